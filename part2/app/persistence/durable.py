@@ -0,0 +1,260 @@
+"""Durable storage for InMemoryRepository.
+
+Every change is appended to an operation log before the call returns, and
+the log is periodically compacted into a snapshot of the whole repository:
+
+    <directory>/snapshot   objects, in batches of SNAPSHOT_BATCH
+    <directory>/log        ('put', obj) / ('delete', obj_id) since the snapshot
+
+Both files are a sequence of frames: a 4-byte length, a 4-byte CRC32 and a
+pickled payload. On startup the files are memory-mapped and the snapshot then
+the log are replayed; a torn frame at the end of the log (crash during a
+write) is dropped. Replaying a log over a snapshot that already contains it
+gives the same state, so a crash in the middle of a compaction is harmless.
+
+Pickle is only safe on files written by the application itself: never point
+the repository at a directory other processes can write to.
+"""
+import gc
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+from .repository import InMemoryRepository
+
+FRAME_HEADER = struct.Struct('<II')
+
+# Nombre d'objets par frame du snapshot (un pickle.loads par lot est bien plus rapide)
+SNAPSHOT_BATCH = 10000
+
+
+def _frame(payload):
+    data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    return FRAME_HEADER.pack(len(data), zlib.crc32(data)) + data
+
+
+def read_frames(path):
+    """Yield the payloads of a frame file, stopping at the first torn or corrupt frame.
+
+    Args:
+        path (str): File to read (a missing or empty file yields nothing)
+
+    Returns:
+        generator: The payloads, then the offset where the valid data ends is
+        available as the generator's return value.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        offset, end = 0, len(data)
+        try:
+            while offset + FRAME_HEADER.size <= end:
+                length, crc = FRAME_HEADER.unpack_from(data, offset)
+                start = offset + FRAME_HEADER.size
+                with view[start:start + length] as body:
+                    if len(body) < length or zlib.crc32(body) != crc:
+                        break
+                    payload = pickle.loads(body)
+                yield payload
+                offset = start + length
+        finally:
+            view.release()
+    return offset
+
+
+def _fsync_directory(directory):
+    # Rend le rename durable (POSIX)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AppendLog:
+    """Append-only log file whose writers share fsync calls (group commit).
+
+    A writer appends its frame, then waits until it is on disk. The first
+    waiter becomes the leader and fsyncs everything written so far while the
+    others wait; writers that arrive during that fsync are covered by the
+    next one. Under load, one fsync thus makes many writes durable.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self.size = os.fstat(self._fd).st_size
+        self._cond = threading.Condition()
+        self._written = self._synced = 0
+        self._syncing = False
+        self.fsyncs = 0
+
+    def write(self, payload):
+        """Append one record without waiting for the disk.
+
+        Returns:
+            int: Sequence number to pass to sync()
+        """
+        data = _frame(payload)
+        with self._cond:
+            os.write(self._fd, data)
+            self.size += len(data)
+            self._written += 1
+            return self._written
+
+    def sync(self, seq):
+        """Block until the record seq (and every record before it) is on disk."""
+        with self._cond:
+            while self._synced < seq:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                self._syncing = True
+                target = self._written
+                self._cond.release()
+                try:
+                    os.fsync(self._fd)
+                finally:
+                    self._cond.acquire()
+                    self._syncing = False
+                    self._cond.notify_all()
+                self._synced = max(self._synced, target)
+                self.fsyncs += 1
+
+    def truncate(self):
+        """Drop every record (after a snapshot made them redundant)."""
+        with self._cond:
+            os.ftruncate(self._fd, 0)
+            os.fsync(self._fd)
+            self.size = 0
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class DurableInMemoryRepository(InMemoryRepository):
+    """InMemoryRepository whose content survives restarts.
+
+    Reads are served from memory as before; each write is applied in memory,
+    appended to the log and made durable (group-committed fsync) before the
+    method returns. When the log grows past compact_ratio times the last
+    snapshot (and at least compact_min_bytes), it is compacted into a new
+    snapshot.
+
+    Objects are pickled independently: references between objects (a place's
+    owner, for instance) come back as copies after a restart.
+    """
+    def __init__(self, directory, unique_indexes=(), indexes=(), compact_min_bytes=64 * 1024 * 1024,
+                 compact_ratio=2.0):
+        super().__init__(unique_indexes, indexes)
+        self.directory = directory
+        self.compact_min_bytes = compact_min_bytes
+        self.compact_ratio = compact_ratio
+        self._snapshot_path = os.path.join(directory, 'snapshot')
+        self._log_path = os.path.join(directory, 'log')
+        # Les écritures en mémoire et dans le log doivent se faire dans le même ordre
+        self._write_lock = threading.RLock()
+        os.makedirs(directory, exist_ok=True)
+        self._snapshot_size = self._load()
+        self._log = AppendLog(self._log_path)
+
+    def _load(self):
+        """Replay the snapshot and the log; return the snapshot size."""
+        # Des millions d'objets créés d'un coup déclencheraient sans cesse le GC
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._replay()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _replay(self):
+        # Snapshot puis log appliqués directement au stockage : rejouer un log sur un snapshot
+        # qui le contient déjà repasse par des états intermédiaires où une valeur unique,
+        # libérée puis réutilisée avant la compaction, semblerait prise deux fois
+        storage = self._storage
+        for batch in read_frames(self._snapshot_path):
+            storage.update((obj.id, obj) for obj in batch)
+        replay = read_frames(self._log_path)
+        while True:
+            try:
+                op, value = next(replay)
+            except StopIteration as done:
+                valid = done.value
+                break
+            if op == 'put':
+                storage[value.id] = value
+            else:
+                storage.pop(value, None)
+        # L'état final vient d'un état valide : les index sont construits une fois, sans revérifier l'unicité
+        objs = storage.values()
+        for name, index in self._unique.items():
+            index.update((value, obj) for obj in objs if (value := getattr(obj, name, None)) is not None)
+        for name, index in self._indexes.items():
+            for obj in objs:
+                index.setdefault(getattr(obj, name, None), {})[obj.id] = obj
+        if os.path.exists(self._log_path) and os.path.getsize(self._log_path) > valid:
+            # Frame incomplète laissée par un crash : on la coupe pour pouvoir réécrire derrière
+            with open(self._log_path, 'r+b') as f:
+                f.truncate(valid)
+        return os.path.getsize(self._snapshot_path) if os.path.exists(self._snapshot_path) else 0
+
+    def _needs_compaction(self):
+        return self._log.size > max(self.compact_min_bytes, self.compact_ratio * self._snapshot_size)
+
+    def _commit(self, seq):
+        # fsync hors du verrou d'écriture, pour que plusieurs écrivains le partagent
+        self._log.sync(seq)
+        if self._needs_compaction():
+            with self._write_lock:
+                # Un autre écrivain a pu compacter entre-temps
+                if self._needs_compaction():
+                    self.compact()
+
+    def add(self, obj):
+        with self._write_lock:
+            super().add(obj)
+            seq = self._log.write(('put', obj))
+        self._commit(seq)
+
+    def update(self, obj_id, data):
+        with self._write_lock:
+            super().update(obj_id, data)
+            obj = self.get(obj_id)
+            if obj is None:
+                return
+            seq = self._log.write(('put', obj))
+        self._commit(seq)
+
+    def delete(self, obj_id):
+        with self._write_lock:
+            if obj_id not in self._storage:
+                return
+            super().delete(obj_id)
+            seq = self._log.write(('delete', obj_id))
+        self._commit(seq)
+
+    def compact(self):
+        """Write a snapshot of the current content and empty the log."""
+        with self._write_lock:
+            tmp_path = self._snapshot_path + '.tmp'
+            objs = list(self._storage.values())
+            with open(tmp_path, 'wb') as f:
+                for start in range(0, len(objs), SNAPSHOT_BATCH):
+                    f.write(_frame(objs[start:start + SNAPSHOT_BATCH]))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._snapshot_path)
+            _fsync_directory(self.directory)
+            # Un crash ici rejoue le log sur un snapshot qui le contient déjà : même résultat
+            self._log.truncate()
+            self._snapshot_size = os.path.getsize(self._snapshot_path)
+
+    def close(self):
+        """Close the log file (the content is already durable)."""
+        self._log.close()
@@ -30,17 +30,61 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def filter_by(self, **criteria):
+        pass
+
 
 class InMemoryRepository(Repository):
     """In-memory implementation of the Repository interface.
     
     This implementation stores objects in a dictionary that exists only for the 
     lifetime of the application. No data persistence between application restarts.
+
+    Attributes that are looked up often can be declared as secondary indexes,
+    kept in sync by add/update/delete, so that get_by_attribute and filter_by
+    do not scan every object.
     """
-    def __init__(self):
+    def __init__(self, unique_indexes=(), indexes=()):
         self._storage = {}
+        # Index unique : valeur -> objet ; index simple : valeur -> {id: objet}
+        self._unique = {name: {} for name in unique_indexes}
+        self._indexes = {name: {} for name in indexes}
+
+    def _index(self, obj):
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            if value is not None and index.get(value, obj).id != obj.id:
+                raise ValueError(f"An item with {name}={value!r} already exists")
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            if value is not None:
+                index[value] = obj
+        for name, index in self._indexes.items():
+            index.setdefault(getattr(obj, name, None), {})[obj.id] = obj
+
+    def _unindex(self, obj):
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            if value is not None and index.get(value) is obj:
+                del index[value]
+        for name, index in self._indexes.items():
+            value = getattr(obj, name, None)
+            bucket = index.get(value, {})
+            bucket.pop(obj.id, None)
+            if not bucket:
+                index.pop(value, None)
 
     def add(self, obj):
+        previous = self._storage.get(obj.id)
+        if previous:
+            self._unindex(previous)
+        try:
+            self._index(obj)
+        except ValueError:
+            if previous:
+                self._index(previous)
+            raise
         self._storage[obj.id] = obj
 
     def get(self, obj_id):
@@ -52,11 +96,40 @@ class InMemoryRepository(Repository):
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
-            obj.update(data)
+            previous = {key: getattr(obj, key, None) for key in data}
+            self._unindex(obj)
+            for key, value in data.items():
+                setattr(obj, key, value)
+            try:
+                self._index(obj)
+            except ValueError:
+                for key, value in previous.items():
+                    setattr(obj, key, value)
+                self._index(obj)
+                raise
 
     def delete(self, obj_id):
         if obj_id in self._storage:
-            del self._storage[obj_id]
+            self._unindex(self._storage.pop(obj_id))
 
     def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._unique and attr_value is not None:
+            return self._unique[attr_name].get(attr_value)
+        if attr_name in self._indexes:
+            return next(iter(self._indexes[attr_name].get(attr_value, {}).values()), None)
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
+
+    def filter_by(self, **criteria):
+        # On part du plus petit index disponible, les autres critères sont vérifiés un par un
+        candidates = self._storage.values()
+        for name, value in criteria.items():
+            if name in self._unique and value is not None:
+                matches = [obj for obj in [self._unique[name].get(value)] if obj]
+            elif name in self._indexes:
+                matches = self._indexes[name].get(value, {}).values()
+            else:
+                continue
+            if len(matches) < len(candidates):
+                candidates = matches
+        return [obj for obj in candidates
+                if all(getattr(obj, name, None) == value for name, value in criteria.items())]
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app.persistence.durable import DurableInMemoryRepository
+
+
+class Item:
+    def __init__(self, id, email, place_id=None):
+        self.id = id
+        self.email = email
+        self.place_id = place_id
+
+
+class TestDurableInMemoryRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def open(self, **kwargs):
+        repo = DurableInMemoryRepository(self.directory, unique_indexes=('email',), **kwargs)
+        self.addCleanup(repo.close)
+        return repo
+
+    def test_changes_survive_a_restart(self):
+        repo = self.open()
+        for i in range(5):
+            repo.add(Item(str(i), f"user{i}@example.com"))
+        repo.update('1', {'email': "new@example.com"})
+        repo.delete('3')
+        repo.close()
+
+        reopened = self.open()
+        self.assertEqual(sorted(obj.id for obj in reopened.get_all()), ['0', '1', '2', '4'])
+        self.assertEqual(reopened.get_by_attribute('email', "new@example.com").id, '1')
+        self.assertIsNone(reopened.get_by_attribute('email', "user1@example.com"))
+
+    def test_compaction_keeps_the_content_and_empties_the_log(self):
+        repo = self.open(compact_min_bytes=2000, compact_ratio=1.0)
+        for i in range(100):
+            repo.add(Item(str(i), f"user{i}@example.com"))
+            repo.update(str(i), {'place_id': i})
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'snapshot')))
+        self.assertLess(os.path.getsize(os.path.join(self.directory, 'log')), 4000)
+        repo.close()
+
+        reopened = self.open()
+        self.assertEqual(len(reopened.get_all()), 100)
+        self.assertEqual(reopened.get('42').place_id, 42)
+
+    def test_replaying_the_log_over_its_own_snapshot(self):
+        # Crash entre le rename du snapshot et la troncature du log
+        repo = self.open()
+        repo.add(Item('a', "a@example.com"))
+        repo.add(Item('b', "b@example.com"))
+        repo.delete('a')
+        # Valeur unique libérée puis reprise avant la compaction
+        repo.add(Item('c', "x@example.com"))
+        repo.update('c', {'email': "y@example.com"})
+        repo.add(Item('d', "x@example.com"))
+        with open(os.path.join(self.directory, 'log'), 'rb') as f:
+            log = f.read()
+        repo.compact()
+        repo.close()
+        with open(os.path.join(self.directory, 'log'), 'wb') as f:
+            f.write(log)
+
+        reopened = self.open()
+        self.assertEqual(sorted(obj.id for obj in reopened.get_all()), ['b', 'c', 'd'])
+        self.assertEqual(reopened.get_by_attribute('email', "x@example.com").id, 'd')
+        self.assertEqual(reopened.get_by_attribute('email', "y@example.com").id, 'c')
+
+    def test_torn_write_is_dropped(self):
+        repo = self.open()
+        repo.add(Item('a', "a@example.com"))
+        repo.add(Item('b', "b@example.com"))
+        repo.close()
+        path = os.path.join(self.directory, 'log')
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 3)
+
+        reopened = self.open()
+        self.assertEqual([obj.id for obj in reopened.get_all()], ['a'])
+        # Le log est réparé : les écritures suivantes sont relues normalement
+        reopened.add(Item('c', "c@example.com"))
+        reopened.close()
+        self.assertEqual(sorted(obj.id for obj in self.open().get_all()), ['a', 'c'])
+
+    def test_concurrent_writers_share_fsyncs(self):
+        repo = self.open()
+
+        def writer(offset):
+            for n in range(50):
+                repo.add(Item(f"{offset}-{n}", f"{offset}-{n}@example.com"))
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(repo._log.fsyncs, 400)
+        repo.close()
+        self.assertEqual(len(self.open().get_all()), 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,15 @@ from flask import Flask
 from flask_restx import Api
 from flask_cors import CORS  # Ajoutez cette importation en haut du fichier avec les autres importations
 from app.persistence.repository import SQLAlchemyRepository  # Import the new repository class
-from app.extensions import db, bcrypt, jwt  # Use extensions for database and authentication
+from app.extensions import db, migrate, bcrypt, jwt, cache, hashing, query_stats, metrics, logs, database, replicas  # Use extensions for database and authentication
 from app.api.v1.users import api as users_ns
 from app.api.v1.amenities import api as amenities_ns
 from app.api.v1.places import api as places_ns
 from app.api.v1.reviews import api as reviews_ns
 from app.api.v1.auth import api as auth_ns
 from app.api.v1.protector import api as protected_ns
+from app.api.v1.debug import api as debug_ns
+from app.commands import register_commands
 
 
 def create_app(config_class="config.DevelopmentConfig"):
@@ -20,24 +22,34 @@ def create_app(config_class="config.DevelopmentConfig"):
         r"/api/*": {
             "origins": "*",  # Ou spécifiez votre origine frontend
             "methods": ["GET", "POST", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"]
+            "allow_headers": ["Content-Type", "Authorization"],
+            "expose_headers": ["X-Next-Cursor", "Link", "X-DB-Query-Count", "X-DB-Time-Ms"]
         }
     })
     
     # Load the configuration
     app.config.from_object(config_class)
+    logs.init_app(app)
 
     # Secret key for JWT (already present in your code)
     app.config['JWT_SECRET_KEY'] = 'your-secret-key'
     
-    # Initialize extensions
+    # Initialize extensions (database first: it completes the engine options)
+    database.init_app(app)
     db.init_app(app)
+    migrate.init_app(app, db)
+    replicas.init_app(app)
     bcrypt.init_app(app)
     jwt.init_app(app)
+    cache.init_app(app)
+    hashing.init_app(app)
+    query_stats.init_app(app)
+    metrics.init_app(app)
 
     with app.app_context():
         # Database tables will be created later (next task)
-        db.create_all()
+        # Primary only: replicas get the schema through replication, and one being down must not block startup
+        db.create_all(bind_key=None)
 
     # Initialize Flask-RESTX API
     api = Api(
@@ -64,8 +76,14 @@ def create_app(config_class="config.DevelopmentConfig"):
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
     api.add_namespace(auth_ns, path='/api/v1/auth')
     api.add_namespace(protected_ns, path='/api/v1/protector')
+    # Diagnostics SQL par requête, jamais exposés en production
+    if app.config.get('QUERY_STATS_DEBUG_ENDPOINT') and 'hbnb_query_stats' in app.extensions:
+        api.add_namespace(debug_ns, path='/api/v1/_debug')
 
     # Initialize JWT again (already present in your code)
     jwt.init_app(app)
 
+    # Maintenance commands (flask --app run repair-ratings)
+    register_commands(app)
+
     return app
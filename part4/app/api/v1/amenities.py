@@ -1,6 +1,10 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt
 from app.api.v1 import facade  # Import the shared facade instance
+from app.api.v1.pagination import PAGE_PARAMS, get_page_args, page_headers
+from app.api.v1.conditional import collection_validators, item_validators, not_modified, validator_headers
+from app.api.v1.bulk import bulk_response, get_bulk_items
+from app.api.v1.serializers import amenity_serializer, json_response
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -30,27 +34,64 @@ class AmenityList(Resource):
         amenity_data = api.payload
         try:
             new_amenity = facade.create_amenity(amenity_data)
-            return {'id': new_amenity.id, 'name': new_amenity.name}, 201
+            return json_response(amenity_serializer.to_json(new_amenity), 201)
         except ValueError as e:
             return {'error': str(e)}, 400
 
+    @api.doc(params=PAGE_PARAMS)
     @api.response(200, 'List of amenities retrieved successfully')
+    @api.response(304, 'List of amenities not modified')
+    @api.response(400, 'Invalid pagination parameters')
     def get(self):
-        """Retrieve a list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [{'id': amenity.id, 'name': amenity.name} for amenity in amenities], 200
+        """Retrieve a page of amenities"""
+        try:
+            limit, cursor = get_page_args()
+            etag, last_modified = collection_validators(facade.get_amenities_fingerprint())
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+            amenities, next_cursor = facade.get_amenities_page(limit, cursor)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return json_response(amenity_serializer.many_to_json(amenities), 200,
+                             dict(page_headers(next_cursor), **validator_headers(etag, last_modified)))
+
+
+@api.route('/bulk')
+class AmenityBulk(Resource):
+    @jwt_required()
+    @api.expect([amenity_model])
+    @api.response(201, 'All amenities successfully created')
+    @api.response(207, 'Some amenities were created, see the per-item results')
+    @api.response(400, 'No amenity was created')
+    @api.response(403, 'Admin privileges required')
+    def post(self):
+        """Register many amenities in one transaction (Admin only)"""
+        if not is_admin_user():
+            return {'error': 'Admin privileges required'}, 403
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        results = facade.create_amenities(items)
+        return bulk_response(results, amenity_serializer.to_dict)
 
 
 @api.route('/<amenity_id>')
 class AmenityResource(Resource):
     @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(304, 'Amenity not modified')
     @api.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """Get amenity details by ID"""
         amenity = facade.get_amenity(amenity_id)
         if not amenity:
             return {'error': 'Amenity not found'}, 404
-        return {'id': amenity.id, 'name': amenity.name}, 200
+        etag, last_modified = item_validators(amenity)
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+        return json_response(amenity_serializer.to_json(amenity), 200, validator_headers(etag, last_modified))
 
     @jwt_required()
     @api.expect(amenity_model)
@@ -68,6 +109,6 @@ class AmenityResource(Resource):
             updated_amenity = facade.update_amenity(amenity_id, amenity_data)
             if not updated_amenity:
                 return {'error': 'Amenity not found'}, 404
-            return {'id': updated_amenity.id, 'name': updated_amenity.name}, 200
+            return json_response(amenity_serializer.to_json(updated_amenity))
         except ValueError as e:
             return {'error': str(e)}, 400
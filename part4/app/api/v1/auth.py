@@ -1,6 +1,7 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token
 from app.services import facade
+from app.hashing import HashingPoolSaturated
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -13,15 +14,21 @@ login_model = api.model('Login', {
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model)
+    @api.response(200, 'Login successful')
+    @api.response(401, 'Invalid credentials')
+    @api.response(503, 'Too many logins in progress, retry later')
     def post(self):
         """Authenticate user and return a JWT token"""
         credentials = api.payload  # Get the email and password from the request payload
         
-        # Step 1: Retrieve the user based on the provided email
-        user = facade.get_user_by_email(credentials['email'])
-        
-        # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
+        # Step 1 & 2: Retrieve the user by email and check the password
+        # (re-hashed on the fly if BCRYPT_LOG_ROUNDS changed)
+        try:
+            user = facade.authenticate_user(credentials['email'], credentials['password'])
+        except HashingPoolSaturated as e:
+            # La file bcrypt est pleine : on répond tout de suite plutôt que d'occuper un worker
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
+        if not user:
             return {'error': 'Invalid credentials'}, 401
 
         # Step 3: Create a JWT token with the user's id as identity
@@ -0,0 +1,46 @@
+from flask import current_app, request
+
+# Status of a bulk response: everything created, nothing created, or a mix
+BULK_STATUS_CREATED = 201
+BULK_STATUS_MIXED = 207
+BULK_STATUS_FAILED = 400
+
+
+def get_bulk_items():
+    """
+    Read the JSON array posted to a bulk endpoint.
+
+    :return: The list of items.
+    :raises ValueError: If the body is not a non-empty array or exceeds BULK_MAX_ITEMS.
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        raise ValueError("Request body must be a non-empty JSON array")
+    limit = current_app.config['BULK_MAX_ITEMS']
+    if len(items) > limit:
+        raise ValueError(f"At most {limit} items can be created at once")
+    return items
+
+
+def bulk_response(results, serialize):
+    """
+    Build the per-item response of a bulk endpoint.
+
+    :param results: (obj, error) pairs returned by the facade, one per posted item.
+    :param serialize: Function turning a created object into its JSON representation.
+    :return: A (body, status) tuple; status is 201, 207 or 400.
+    """
+    body = []
+    for index, (obj, error) in enumerate(results):
+        if error is None:
+            body.append({'index': index, 'status': 201, **serialize(obj)})
+        else:
+            body.append({'index': index, 'status': 400, 'error': error})
+    created = sum(1 for obj, error in results if error is None)
+    if created == len(results):
+        status = BULK_STATUS_CREATED
+    elif created:
+        status = BULK_STATUS_MIXED
+    else:
+        status = BULK_STATUS_FAILED
+    return {'created': created, 'failed': len(results) - created, 'results': body}, status
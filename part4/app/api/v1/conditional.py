@@ -0,0 +1,64 @@
+import hashlib
+from datetime import timezone
+from flask import Response, request
+from werkzeug.http import http_date
+
+
+def item_validators(obj):
+    """
+    ETag and Last-Modified of a single object, derived from its id and updated_at.
+
+    A ?fields= selection is a different representation, so it gets its own ETag.
+
+    :return: A tuple (etag, last_modified).
+    """
+    last_modified = obj.updated_at
+    version = last_modified.isoformat() if last_modified else ''
+    etag = f'{type(obj).__name__.lower()}-{obj.id}-{version}'
+    fields = request.args.get('fields')
+    if fields is not None:
+        etag += '-' + hashlib.sha1(fields.encode()).hexdigest()[:12]
+    return f'"{etag}"', last_modified
+
+
+def collection_validators(fingerprint):
+    """
+    ETag and Last-Modified of a collection from its (count, max(updated_at)) fingerprint.
+
+    The ETag also covers the query string (page, filters), so each page has
+    its own validator. A delete lowers the count and changes the ETag, but
+    not Last-Modified: clients that only send If-Modified-Since may keep a
+    stale page until the next update.
+
+    :return: A tuple (etag, last_modified).
+    """
+    count, last_modified = fingerprint
+    version = last_modified.isoformat() if last_modified else ''
+    digest = hashlib.sha1(f'{request.full_path}|{count}|{version}'.encode()).hexdigest()[:20]
+    return f'"{digest}"', last_modified
+
+
+def validator_headers(etag, last_modified):
+    """Response headers carrying the validators."""
+    headers = {'ETag': etag}
+    if last_modified:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def not_modified(etag, last_modified):
+    """
+    Check the request's If-None-Match / If-Modified-Since headers.
+
+    :return: A 304 response if the client's copy is still fresh, None otherwise.
+    """
+    if request.if_none_match:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        fresh = request.if_none_match.contains_weak(etag.strip('"'))
+    elif request.if_modified_since and last_modified:
+        fresh = last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= request.if_modified_since
+    else:
+        fresh = False
+    if not fresh:
+        return None
+    return Response(status=304, headers=validator_headers(etag, last_modified))
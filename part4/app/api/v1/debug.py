@@ -0,0 +1,34 @@
+from flask import current_app, request
+from flask_restx import Namespace, Resource
+from app.extensions import query_stats
+
+# Only registered when QUERY_STATS_DEBUG_ENDPOINT is set (never in production)
+api = Namespace('_debug', description='Diagnostics (not available in production)')
+
+
+@api.route('/queries')
+class QueryLog(Resource):
+    @api.doc(params={
+        'limit': 'Maximum number of requests to return (newest first)',
+        'min_queries': 'Only return requests that issued at least this many statements'
+    })
+    @api.response(200, 'SQL statistics of the latest requests')
+    @api.response(400, 'Invalid query parameters')
+    def get(self):
+        """SQL statement count, database time and slow statements of the latest requests"""
+        try:
+            limit = int(request.args.get('limit', 50))
+            min_queries = int(request.args.get('min_queries', 0))
+        except ValueError:
+            return {'error': "limit and min_queries must be integers"}, 400
+        requests = [entry for entry in query_stats.history() if entry['queries'] >= min_queries]
+        return {
+            'slow_threshold_ms': current_app.config.get('QUERY_SLOW_THRESHOLD_MS', 100),
+            'requests': requests[:limit]
+        }
+
+    @api.response(204, 'History cleared')
+    def delete(self):
+        """Forget the recorded requests"""
+        query_stats.clear()
+        return '', 204
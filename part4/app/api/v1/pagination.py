@@ -0,0 +1,40 @@
+from urllib.parse import urlencode
+from flask import current_app, request
+
+# Documentation of the query parameters shared by every paginated endpoint
+PAGE_PARAMS = {
+    'limit': 'Maximum number of items to return (capped by PAGE_SIZE_MAX)',
+    'cursor': 'Opaque cursor taken from the X-Next-Cursor header of the previous page'
+}
+
+
+def get_page_args():
+    """
+    Read ?limit= and ?cursor= from the query string.
+
+    :return: A tuple (limit, cursor) with limit defaulted and capped from the config.
+    :raises ValueError: If limit is not a positive integer.
+    """
+    limit = request.args.get('limit')
+    if limit is None:
+        limit = current_app.config['PAGE_SIZE_DEFAULT']
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError("limit must be a positive integer")
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+    return min(limit, current_app.config['PAGE_SIZE_MAX']), request.args.get('cursor') or None
+
+
+def page_headers(next_cursor):
+    """Build the headers pointing to the next page, if there is one."""
+    if not next_cursor:
+        return {}
+    args = request.args.to_dict()
+    args['cursor'] = next_cursor
+    return {
+        'X-Next-Cursor': next_cursor,
+        'Link': f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    }
@@ -1,6 +1,13 @@
 import logging
+import math
+from flask import current_app, request
 from flask_restx import Namespace, Resource, fields
 from app.api.v1 import facade  # Import the shared facade instance
+from app.api.v1.pagination import PAGE_PARAMS, get_page_args, page_headers
+from app.api.v1.conditional import collection_validators, item_validators, not_modified, validator_headers
+from app.api.v1.bulk import bulk_response, get_bulk_items
+from app.api.v1.streaming import STREAM_PARAMS, stream_batch_size, stream_format, stream_response
+from app.api.v1.serializers import FIELDS_PARAMS, dumps, json_response, place_serializer, select_fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 
 logger = logging.getLogger(__name__)
@@ -28,6 +35,54 @@ place_update_model = api.model('PlaceUpdate', {
     'amenities': fields.List(fields.String, description="List of amenities ID's")
 })
 
+# Search filters accepted by GET /places, documented for Swagger
+PLACE_FILTER_PARAMS = {
+    'min_price': 'Minimum price per night',
+    'max_price': 'Maximum price per night',
+    'bbox': 'Bounding box as min_lon,min_lat,max_lon,max_lat',
+    'amenities': "Comma-separated amenity ID's the place must all offer"
+}
+
+
+def get_place_filters():
+    """
+    Read the place search filters from the query string.
+
+    :return: A dict of filters for facade.get_places_page (empty if none were given).
+    :raises ValueError: If a filter is malformed.
+    """
+    filters = {}
+    for name in ('min_price', 'max_price'):
+        if request.args.get(name):
+            try:
+                filters[name] = float(request.args[name])
+            except ValueError:
+                raise ValueError(f"{name} must be a number")
+            # float() accepte aussi 'nan' et 'inf'
+            if not math.isfinite(filters[name]):
+                raise ValueError(f"{name} must be a number")
+
+    if request.args.get('bbox'):
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(value) for value in request.args['bbox'].split(','))
+        except ValueError:
+            raise ValueError("bbox must be min_lon,min_lat,max_lon,max_lat")
+        if not (-90 <= min_lat <= max_lat <= 90) or not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+            raise ValueError("bbox is out of range")
+        filters['bbox'] = (min_lon, min_lat, max_lon, max_lat)
+
+    if request.args.get('amenities'):
+        try:
+            amenity_ids = sorted({int(value) for value in request.args['amenities'].split(',')})
+        except ValueError:
+            raise ValueError("amenities must be a comma-separated list of ID's")
+        # Au-delà d'un entier 64 bits, le driver SQLite lève OverflowError
+        if amenity_ids[0] < -2 ** 63 or amenity_ids[-1] > 2 ** 63 - 1:
+            raise ValueError("amenities must be a comma-separated list of ID's")
+        filters['amenity_ids'] = amenity_ids
+    return filters
+
+
 @api.route('/')
 class PlaceList(Resource):
     @api.expect(place_model, validate=True)
@@ -56,54 +111,116 @@ class PlaceList(Resource):
             # Create place using the facade
             new_place = facade.create_place(place_data)
 
-            return {
-                'id': new_place.id,
-                'title': new_place.title,
-                'description': new_place.description,
-                'price': new_place.price,
-                'latitude': new_place.latitude,
-                'longitude': new_place.longitude,
-                'owner_id': new_place.owner.id,
-                'amenities': [amenity.id for amenity in new_place.amenities]
-            }, 201
+            return json_response(place_serializer.to_json(new_place), 201)
         except ValueError as e:
             return {'error': str(e)}, 400
 
+    @api.doc(params=dict(PAGE_PARAMS, **PLACE_FILTER_PARAMS, **STREAM_PARAMS, **FIELDS_PARAMS))
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(304, 'List of places not modified')
+    @api.response(400, 'Invalid pagination, filter or fields parameters')
+    def get(self):
+        """Retrieve a page of places (or stream them all), optionally filtered by price, area and amenities"""
+        try:
+            limit, cursor = get_page_args()
+            filters = get_place_filters()
+            serializer, attributes = select_fields(place_serializer)
+            etag, last_modified = collection_validators(facade.get_places_fingerprint(filters))
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+            fmt = stream_format()
+            if fmt:
+                places = facade.iter_places(filters, batch_size=stream_batch_size(), fields=attributes)
+                return stream_response(places, serializer, fmt, validator_headers(etag, last_modified))
+            places, next_cursor = facade.get_places_page(limit, cursor, filters=filters, fields=attributes)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return json_response(serializer.many_to_json(places), 200,
+                             dict(page_headers(next_cursor), **validator_headers(etag, last_modified)))
+
+@api.route('/bulk')
+class PlaceBulk(Resource):
+    @jwt_required()
+    @api.expect([place_model])
+    @api.response(201, 'All places successfully created')
+    @api.response(207, 'Some places were created, see the per-item results')
+    @api.response(400, 'No place was created')
+    def post(self):
+        """Register many places in one transaction"""
+        current_user_id = get_jwt_identity()
+        is_admin = get_jwt().get('is_admin', False)
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        # Same rule as POST /places: only admins may pick another owner
+        for item in items:
+            if isinstance(item, dict) and not (is_admin and item.get('owner_id')):
+                item['owner_id'] = current_user_id
+
+        results = facade.create_places(items)
+        return bulk_response(results, lambda place: {'id': place.id, 'title': place.title})
+
+
+@api.route('/nearby')
+class PlaceNearby(Resource):
+    @api.doc(params={
+        'lat': 'Latitude of the center',
+        'lon': 'Longitude of the center',
+        'radius_km': 'Search radius in kilometers',
+        'limit': 'Maximum number of places to return (nearest first)'
+    })
+    @api.response(200, 'List of nearby places retrieved successfully')
+    @api.response(400, 'Invalid query parameters')
     def get(self):
-        """Retrieve a list of all places"""
-        places = facade.get_all_places()
-        return [{
-            'id': place.id,
-            'title': place.title,
-            'description': place.description,
-            'price': place.price,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'owner_id': place.owner.id,
-            'amenities': [amenity.id for amenity in place.amenities]
-        } for place in places], 200
+        """Retrieve the places within radius_km of a point, nearest first"""
+        try:
+            latitude = float(request.args['lat'])
+            longitude = float(request.args['lon'])
+            radius_km = float(request.args['radius_km'])
+        except (KeyError, ValueError):
+            return {'error': "lat, lon and radius_km are required numbers"}, 400
+        if not (-90 <= latitude <= 90) or not (-180 <= longitude <= 180):
+            return {'error': "lat/lon are out of range"}, 400
+        max_radius = current_app.config['NEARBY_MAX_RADIUS_KM']
+        if not (0 < radius_km <= max_radius):
+            return {'error': f"radius_km must be between 0 and {max_radius}"}, 400
+
+        try:
+            limit, _ = get_page_args()
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        results = facade.get_places_nearby(latitude, longitude, radius_km, limit)
+        return json_response(dumps([
+            place_serializer.to_dict(place, distance_km=round(distance, 3)) for place, distance in results
+        ]))
 
 @api.route('/<place_id>')
 class PlaceResource(Resource):
+    @api.doc(params=FIELDS_PARAMS)
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Place not modified')
+    @api.response(400, 'Invalid fields parameter')
     @api.response(404, 'Place not found')
     def get(self, place_id):
         """Get place details by ID"""
+        try:
+            serializer, _ = select_fields(place_serializer)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         place = facade.get_place(place_id)
         if not place:
             return {'error': 'Place not found'}, 404
 
-        return {
-            'id': place.id,
-            'title': place.title,
-            'description': place.description,
-            'price': place.price,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'owner_id': place.owner.id,
-            'amenities': [amenity.id for amenity in place.amenities]
-        }, 200
+        etag, last_modified = item_validators(place)
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+
+        return json_response(serializer.to_json(place), 200, validator_headers(etag, last_modified))
 
     @jwt_required()  # Require authentication to update a place
     @api.expect(place_update_model)
@@ -128,27 +245,18 @@ class PlaceResource(Resource):
                 return {'error': "Unauthorized action"}, 403
 
             update_data = api.payload
-            logger.debug(f"Updating place {place_id} with data: {update_data}")
+            logger.debug("Updating place %s with data: %s", place_id, update_data)
 
             # Update the place
             updated_place = facade.update_place(place_id, update_data)
             
-            return {
-                'id': updated_place.id,
-                'title': updated_place.title,
-                'description': updated_place.description,
-                'price': updated_place.price,
-                'latitude': updated_place.latitude,
-                'longitude': updated_place.longitude,
-                'owner_id': updated_place.owner.id,
-                'amenities': [amenity.id for amenity in updated_place.amenities]
-            }, 200
+            return json_response(place_serializer.to_json(updated_place), 200)
 
         except ValueError as e:
-            logger.error(f"Validation error while updating place: {str(e)}")
+            logger.error("Validation error while updating place: %s", e)
             return {'error': str(e)}, 400
         except Exception as e:
-            logger.error(f"Unexpected error while updating place: {str(e)}")
+            logger.error("Unexpected error while updating place: %s", e)
             return {'error': "Internal server error"}, 500
 
     @jwt_required()  # Require authentication to delete a place
@@ -171,7 +279,7 @@ class PlaceResource(Resource):
             if not is_admin and str(place.owner.id) != current_user_id:  # Utilisez directement l'ID
                 return {'error': "Unauthorized action"}, 403
 
-            logger.debug(f"Deleting place {place_id}")
+            logger.debug("Deleting place %s", place_id)
 
             # Delete the place
             facade.delete_place(place_id)
@@ -179,5 +287,5 @@ class PlaceResource(Resource):
             return {'message': "Place deleted successfully"}, 200
         
         except Exception as e:
-            logger.error(f"Unexpected error while deleting a place: {str(e)}")
+            logger.error("Unexpected error while deleting a place: %s", e)
             return {'error': "Internal server error"}, 500
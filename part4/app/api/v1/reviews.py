@@ -1,6 +1,13 @@
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.facade import HBnBFacade
+from app.api.v1.pagination import PAGE_PARAMS, get_page_args, page_headers
+from app.api.v1.conditional import collection_validators, item_validators, not_modified, validator_headers
+from app.api.v1.bulk import bulk_response, get_bulk_items
+from app.api.v1.streaming import STREAM_PARAMS, stream_batch_size, stream_format, stream_response
+from app.api.v1.serializers import (FIELDS_PARAMS, json_response, place_review_serializer, review_serializer,
+                                    select_fields)
 
 api = Namespace('reviews', description='Review operations')
 facade = HBnBFacade()
@@ -33,7 +40,9 @@ class ReviewList(Resource):
         try:
             # Validate that the user is not reviewing their own place
             place = facade.get_place(review_data['place_id'])
-            if str(place.owner.id) == current_user_id:  # Comparaison directe avec l'ID
+            if not place:
+                return {'error': "Place not found"}, 400
+            if str(place.owner_id) == current_user_id:  # Comparaison directe avec l'ID
                 return {'error': "You cannot review your own place"}, 403
 
             # Validate that the user has not already reviewed this place
@@ -45,42 +54,72 @@ class ReviewList(Resource):
 
             # Create the review using the facade
             new_review = facade.create_review(review_data)
-            return {
-                'id': new_review.id,
-                'text': new_review.text,
-                'rating': new_review.rating,
-                'user_id': new_review.user.id,
-                'place_id': new_review.place.id
-            }, 201
+            return json_response(review_serializer.to_json(new_review), 201)
         except ValueError as e:
             return {'error': str(e)}, 400
 
+    @api.doc(params=dict(PAGE_PARAMS, **STREAM_PARAMS, **FIELDS_PARAMS))
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(304, 'List of reviews not modified')
+    @api.response(400, 'Invalid pagination or fields parameters')
     def get(self):
-        """Retrieve a list of all reviews"""
-        reviews = facade.get_all_reviews()
-        return [{'id': review.id,
-                 'text': review.text,
-                 'rating': review.rating,
-                 'user_id': review.user.id,
-                 'place_id': review.place.id} for review in reviews], 200
+        """Retrieve a page of reviews (or stream them all)"""
+        try:
+            limit, cursor = get_page_args()
+            serializer, attributes = select_fields(review_serializer)
+            etag, last_modified = collection_validators(facade.get_reviews_fingerprint())
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+            fmt = stream_format()
+            if fmt:
+                reviews = facade.iter_reviews(batch_size=stream_batch_size(), fields=attributes)
+                return stream_response(reviews, serializer, fmt, validator_headers(etag, last_modified))
+            reviews, next_cursor = facade.get_reviews_page(limit, cursor, fields=attributes)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return json_response(serializer.many_to_json(reviews), 200,
+                             dict(page_headers(next_cursor), **validator_headers(etag, last_modified)))
+
+@api.route('/bulk')
+class ReviewBulk(Resource):
+    @jwt_required()
+    @api.expect([review_model])
+    @api.response(201, 'All reviews successfully created')
+    @api.response(207, 'Some reviews were created, see the per-item results')
+    @api.response(400, 'No review was created')
+    def post(self):
+        """Register many reviews by the current user in one transaction"""
+        current_user_id = get_jwt_identity()
+        try:
+            items = get_bulk_items()
+            results = facade.create_reviews(current_user_id, items)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return bulk_response(results, lambda review: {'id': review.id, 'place_id': review.place_id})
+
 
 @api.route('/<review_id>')
 class ReviewResource(Resource):
+    @api.doc(params=FIELDS_PARAMS)
     @api.response(200, 'Review details retrieved successfully')
+    @api.response(304, 'Review not modified')
+    @api.response(400, 'Invalid fields parameter')
     @api.response(404, 'Review not found')
     def get(self, review_id):
         """Get review details by ID"""
+        try:
+            serializer, _ = select_fields(review_serializer)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         review = facade.get_review(review_id)
         if not review:
             return {'error': 'Review not found'}, 404
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user.id,
-            'place_id': review.place.id
-        }, 200
+        etag, last_modified = item_validators(review)
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+        return json_response(serializer.to_json(review), 200, validator_headers(etag, last_modified))
 
     @jwt_required()  # Require authentication to update a review
     @api.expect(review_update_model)
@@ -104,13 +143,7 @@ class ReviewResource(Resource):
 
             # Update the review using the facade
             updated_review = facade.update_review(review_id, update_data)
-            return {
-                'id': updated_review.id,
-                'text': updated_review.text,
-                'rating': updated_review.rating,
-                'user_id': updated_review.user.id,
-                'place_id': updated_review.place.id
-            }, 200
+            return json_response(review_serializer.to_json(updated_review))
 
         except ValueError as e:
             return {'error': str(e)}, 400
@@ -141,15 +174,31 @@ class ReviewResource(Resource):
 
 @api.route('/places/<place_id>/reviews')
 class PlaceReviewList(Resource):
+    @api.doc(params=dict(PAGE_PARAMS, **FIELDS_PARAMS, order="'oldest' (default) or 'newest'"))
     @api.response(200, 'List of reviews for the place retrieved successfully')
+    @api.response(304, 'List of reviews not modified')
+    @api.response(400, 'Invalid query parameters')
     @api.response(404, 'Place not found')
     def get(self, place_id):
-        """Get all reviews for a specific place"""
+        """Get a page of reviews for a specific place"""
+        order = request.args.get('order', 'oldest')
+        if order not in ('oldest', 'newest'):
+            return {'error': "order must be 'oldest' or 'newest'"}, 400
+
         try:
-            reviews = facade.get_reviews_by_place(place_id)
-            return [{'id': review.id,
-                     'text': review.text,
-                     'rating': review.rating,
-                     'user_id': review.user.id} for review in reviews], 200
+            limit, cursor = get_page_args()
+            serializer, attributes = select_fields(place_review_serializer)
+            etag, last_modified = collection_validators(facade.get_reviews_fingerprint(place_id))
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+            page = facade.get_place_reviews_page(place_id, limit, cursor, newest_first=order == 'newest',
+                                                 fields=attributes)
         except ValueError as e:
-            return {'error': str(e)}, 404
+            return {'error': str(e)}, 400
+        if page is None:
+            return {'error': "Place not found"}, 404
+
+        reviews, next_cursor = page
+        return json_response(serializer.many_to_json(reviews), 200,
+                             dict(page_headers(next_cursor), **validator_headers(etag, last_modified)))
@@ -0,0 +1,222 @@
+"""
+Precompiled JSON serialisers of the API models.
+
+Each serialiser is built once, at import time, from the model's column
+metadata: the requested columns are checked against the mapper and read
+with a single itemgetter call on the instance __dict__ per row (skipping
+SQLAlchemy's instrumented attributes), plus a few computed fields (amenity
+ids, rating summary). Rows become JSON bytes directly, through orjson when
+it is installed and the stdlib json module otherwise.
+
+Clients may ask for a subset of the fields with ?fields=a,b; the restricted
+serialiser also tells the facade which attributes to load, so unused columns
+and relationships are never read from the database.
+"""
+import json
+from datetime import date, datetime
+from operator import attrgetter, itemgetter
+from flask import Response, request
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used instead
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def loaded_getter(*names):
+    """
+    Precompiled reader of several attributes, returning a tuple.
+
+    Loaded values are read straight from the instance __dict__; if one of
+    them is not loaded (expired, deferred), the regular attributes are used
+    so that SQLAlchemy loads it.
+    """
+    from_dict = itemgetter(*names)
+    from_attributes = attrgetter(*names)
+    if len(names) == 1:
+        def get(obj):
+            try:
+                return (from_dict(obj.__dict__),)
+            except KeyError:
+                return (from_attributes(obj),)
+    else:
+        def get(obj):
+            try:
+                return from_dict(obj.__dict__)
+            except KeyError:
+                return from_attributes(obj)
+    return get
+
+
+def _no_values(obj):
+    return ()
+
+
+def dumps(data):
+    """Encode data as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, separators=(',', ':'), default=_default).encode()
+
+
+def json_response(body, status=200, headers=None):
+    """Wrap already-encoded JSON bytes in a response (flask-restx returns it untouched)."""
+    return Response(body, status=status, headers=headers, mimetype='application/json')
+
+
+# Documentation of the ?fields= query parameter
+FIELDS_PARAMS = {'fields': 'Comma-separated list of the fields to return (all of them by default)'}
+
+
+def select_fields(serializer):
+    """
+    Apply the ?fields= query parameter to a serialiser.
+
+    :return: A tuple (serializer, attributes): the serialiser restricted to the
+        requested fields and the model attributes it reads, or (serializer, None)
+        when every field is wanted.
+    :raises ValueError: If a requested field does not exist.
+    """
+    value = request.args.get('fields')
+    if value is None:
+        return serializer, None
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    if not names:
+        raise ValueError("fields must list at least one field")
+    subset = serializer.only(names)
+    return subset, subset.attributes
+
+
+class ModelSerializer:
+    """
+    Turns instances (or result rows) of one model into dicts and JSON bytes.
+
+    :param model: The SQLAlchemy model.
+    :param columns: Column attribute names to copy, in output order.
+    :param computed: Optional {name: function(obj)} of fields that are not columns.
+    :param requires: Optional {computed name: attribute names} the computed fields read.
+    """
+
+    def __init__(self, model, columns, computed=None, requires=None):
+        mapper = inspect(model)
+        unknown = [name for name in columns if name not in mapper.column_attrs]
+        if unknown:
+            raise ValueError(f"{model.__name__} has no column {', '.join(unknown)}")
+        self.model = model
+        self.columns = tuple(columns)
+        self.computed = dict(computed or {})
+        self.requires = dict(requires or {})
+        self.fields = self.columns + tuple(self.computed)
+        self._values = loaded_getter(*self.columns) if self.columns else _no_values
+        self._subsets = {}
+
+    @property
+    def attributes(self):
+        """Names of the model attributes (columns and relationships) read by the fields."""
+        names = set(self.columns)
+        for name in self.computed:
+            names.update(self.requires.get(name, ()))
+        return names
+
+    def only(self, names):
+        """
+        Serialiser restricted to some of the fields, kept in this serialiser's order.
+
+        :param names: Field names to keep.
+        :return: A ModelSerializer, built once per set of names.
+        :raises ValueError: If a name is not one of the fields.
+        """
+        key = frozenset(names)
+        subset = self._subsets.get(key)
+        if subset is None:
+            unknown = sorted(key.difference(self.fields))
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(self.fields)})")
+            subset = ModelSerializer(
+                self.model,
+                [name for name in self.columns if name in key],
+                {name: compute for name, compute in self.computed.items() if name in key},
+                self.requires
+            )
+            self._subsets[key] = subset
+        return subset
+
+    def to_dict(self, obj, **extra):
+        """Representation of one instance, or of one row selected with the same column names."""
+        if isinstance(obj, Row):
+            data = {name: value for name, value in obj._mapping.items() if name in self.fields}
+        else:
+            data = dict(zip(self.columns, self._values(obj)))
+            for name, compute in self.computed.items():
+                data[name] = compute(obj)
+        if extra:
+            data.update(extra)
+        return data
+
+    def to_json(self, obj, **extra):
+        """JSON bytes of one instance."""
+        return dumps(self.to_dict(obj, **extra))
+
+    def many_to_json(self, objs):
+        """JSON array bytes of many instances."""
+        return dumps([self.to_dict(obj) for obj in objs])
+
+
+_amenities = loaded_getter('amenities')
+_amenity_id = loaded_getter('id')
+# Each computed field only reads the columns it declares, so that it works
+# on places loaded with just those columns
+_review_count = loaded_getter('review_count')
+_rating_total = loaded_getter('review_count', 'rating_sum')
+_rating_counts = loaded_getter('rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+
+def _average_rating(place):
+    # Same rule as Place.average_rating, on the already-loaded values
+    count, total = _rating_total(place)
+    return round(total / count, 2) if count else None
+
+
+def _rating_histogram(place):
+    # Same as Place.rating_histogram
+    return {str(rating): value or 0 for rating, value in enumerate(_rating_counts(place), 1)}
+
+
+place_serializer = ModelSerializer(
+    Place,
+    ['id', 'title', 'description', 'price', 'latitude', 'longitude', 'owner_id'],
+    {
+        'amenities': lambda place: [_amenity_id(amenity)[0] for amenity in _amenities(place)[0]],
+        'review_count': lambda place: _review_count(place)[0] or 0,
+        'average_rating': _average_rating,
+        'rating_histogram': _rating_histogram,
+    },
+    {
+        'amenities': ['amenities'],
+        'review_count': ['review_count'],
+        'average_rating': ['review_count', 'rating_sum'],
+        'rating_histogram': ['rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5'],
+    }
+)
+
+review_serializer = ModelSerializer(Review, ['id', 'text', 'rating', 'user_id', 'place_id'])
+
+# Reviews listed under /places/<place_id>/reviews do not repeat the place
+place_review_serializer = ModelSerializer(Review, ['id', 'text', 'rating', 'user_id'])
+
+# The password hash is never exposed
+user_serializer = ModelSerializer(User, ['id', 'first_name', 'last_name', 'email'])
+
+amenity_serializer = ModelSerializer(Amenity, ['id', 'name'])
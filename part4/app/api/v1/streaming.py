@@ -0,0 +1,66 @@
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON = 'application/x-ndjson'
+
+# Documentation of the query parameter shared by every streamable endpoint
+STREAM_PARAMS = {
+    'stream': "1 to stream every matching row instead of a page "
+              "(a JSON array, or NDJSON with 'Accept: application/x-ndjson')"
+}
+
+# Rows are written to the socket in chunks of roughly this many bytes
+CHUNK_SIZE = 64 * 1024
+
+
+def stream_format():
+    """
+    Tell whether the client asked for a streamed export, and in which format.
+
+    :return: 'ndjson', 'json', or None for the regular paginated response.
+    """
+    # On a tie (e.g. */*), best_match keeps the first offer: plain JSON
+    if request.accept_mimetypes.best_match(['application/json', NDJSON]) == NDJSON:
+        return 'ndjson'
+    if request.args.get('stream') in ('1', 'true'):
+        return 'json'
+    return None
+
+
+def stream_response(rows, serializer, fmt, headers=None):
+    """
+    Build a chunked response writing rows as they come out of the query.
+
+    :param rows: Iterable of objects, typically from a yield_per query.
+    :param serializer: The ModelSerializer of the rows.
+    :param fmt: 'json' for a JSON array, 'ndjson' for one object per line.
+    :param headers: Extra response headers.
+    """
+    separator = b',' if fmt == 'json' else b'\n'
+
+    def generate():
+        buffer, size = [b'[' if fmt == 'json' else b''], 0
+        first = True
+        for row in rows:
+            line = serializer.to_json(row)
+            if fmt == 'json' and not first:
+                line = separator + line
+            elif fmt == 'ndjson':
+                line += separator
+            first = False
+            buffer.append(line)
+            size += len(line)
+            if size >= CHUNK_SIZE:
+                yield b''.join(buffer)
+                buffer, size = [], 0
+        if fmt == 'json':
+            buffer.append(b']')
+        yield b''.join(buffer)
+
+    mimetype = NDJSON if fmt == 'ndjson' else 'application/json'
+    # stream_with_context keeps the request (and its database session) open until the last row
+    return Response(stream_with_context(generate()), mimetype=mimetype, headers=headers)
+
+
+def stream_batch_size():
+    """Number of rows fetched from the database per round trip while streaming."""
+    return current_app.config['STREAM_BATCH_SIZE']
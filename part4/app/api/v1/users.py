@@ -1,8 +1,15 @@
+import logging
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services.facade import HBnBFacade  # Import the shared facade instance
+from app.hashing import HashingPoolSaturated
+from app.api.v1.pagination import PAGE_PARAMS, get_page_args, page_headers
+from app.api.v1.conditional import collection_validators, item_validators, not_modified, validator_headers
+from app.api.v1.serializers import FIELDS_PARAMS, json_response, select_fields, user_serializer
 facade = HBnBFacade()  # Créez une nouvelle instance
 
+logger = logging.getLogger(__name__)
+
 api = Namespace('users', description='User operations')
 
 # Define the user model for input validation and documentation
@@ -27,86 +34,90 @@ def is_admin_user():
         claims = get_jwt()  # Récupérer tous les claims
         return bool(claims.get('is_admin', False))  # Vérifier le claim is_admin
     except Exception as e:
-        print(f"Erreur lors de la vérification admin: {e}")
+        logger.warning("Admin check failed: %s", e)
         return False
 
 
 @api.route('/')
 class UserList(Resource):
+    @api.doc(params=dict(PAGE_PARAMS, **FIELDS_PARAMS))
     @api.response(200, 'List of users retrieved successfully')
+    @api.response(304, 'List of users not modified')
+    @api.response(400, 'Invalid pagination or fields parameters')
     def get(self):
-        """Get list of all users"""
-        users = facade.get_all_users()
-        return [{'id': user.id,
-                 'first_name': user.first_name,
-                 'last_name': user.last_name,
-                 'email': user.email} for user in users], 200
+        """Get a page of users"""
+        try:
+            limit, cursor = get_page_args()
+            serializer, attributes = select_fields(user_serializer)
+            etag, last_modified = collection_validators(facade.get_users_fingerprint())
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+            users, next_cursor = facade.get_users_page(limit, cursor, fields=attributes)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return json_response(serializer.many_to_json(users), 200,
+                             dict(page_headers(next_cursor), **validator_headers(etag, last_modified)))
 
     @api.expect(user_model, validate=True)
     @jwt_required()  # Require authentication to create a new user
     @api.response(201, 'User successfully created')
     @api.response(400, 'Email already registered')
     @api.response(403, 'Admin privileges required')
+    @api.response(503, 'Too many password operations in progress, retry later')
     def post(self):
         """Register a new user (Admin only)"""
         try:
-            # Débogage des claims JWT
-            claims = get_jwt()
-            print(f"DEBUG - JWT claims: {claims}")
-            
             # Utiliser la fonction is_admin_user existante
-            admin_status = is_admin_user()
-            print(f"DEBUG - Admin status: {admin_status}")
-            
-            if not admin_status:
+            if not is_admin_user():
                 return {'error': 'Admin privileges required'}, 403
 
-            from app import bcrypt  # Import différé pour éviter les imports circulaires
             user_data = api.payload
-            print(f"DEBUG - User data: {user_data}")
 
             # Check if email is already in use
             existing_user = facade.get_user_by_email(user_data['email'])
             if existing_user:
                 return {'error': 'Email already registered'}, 400
 
-            # Hash the password before storing it
-            hashed_password = bcrypt.generate_password_hash(user_data['password']).decode('utf-8')
-            user_data['password'] = hashed_password
-
-            # Create the new user
+            # Create the new user (the password is hashed once, by the User model)
             new_user = facade.create_user(user_data)
 
             # Return only the user's ID and a success message (exclude password)
             return {'id': new_user.id, 'message': 'User successfully created'}, 201
+        except HashingPoolSaturated as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
-            # Afficher plus d'informations sur l'erreur
-            import traceback
-            print(f"DEBUG - Exception dans post: {e}")
-            traceback.print_exc()
-            
-            # Puis continuer avec la gestion d'erreur existante
-            if isinstance(e, ValueError):
-                return {'error': str(e)}, 400
-            else:
-                return {'error': f"Unexpected error: {str(e)}"}, 500
+            # La trace complète dans les logs, pas dans la réponse
+            logger.exception("Unexpected error while creating a user")
+            return {'error': f"Unexpected error: {str(e)}"}, 500
 
 
 @api.route('/<id>')
 class UserResource(Resource):
+    @api.doc(params=FIELDS_PARAMS)
     @api.response(200, 'User details retrieved successfully')
+    @api.response(304, 'User not modified')
+    @api.response(400, 'Invalid fields parameter')
     @api.response(404, 'User not found')
     def get(self, id):
         """Get user details by ID"""
+        try:
+            serializer, _ = select_fields(user_serializer)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         user = facade.get_user(id)
         if not user:
             return {'error': 'User not found'}, 404
 
-        # Exclude the password from the response
-        return {'id': user.id,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'email': user.email}, 200
+        etag, last_modified = item_validators(user)
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+
+        # user_serializer excludes the password
+        return json_response(serializer.to_json(user), 200, validator_headers(etag, last_modified))
 
     @jwt_required()  # Require authentication to update a user's details
     @api.expect(user_update_model, validate=True)
@@ -114,6 +125,7 @@ class UserResource(Resource):
     @api.response(404, 'User not found')
     @api.response(400, "You cannot modify email or password")
     @api.response(403, "Unauthorized action")
+    @api.response(503, 'Too many password operations in progress, retry later')
     def put(self, id):
         """Update user details"""
         current_user_id = get_jwt_identity()  # Maintenant c'est juste l'ID comme chaîne
@@ -136,11 +148,11 @@ class UserResource(Resource):
             if not updated_user:
                 return {'error': "User not found"}, 404
 
-            # Exclude the password from the response
-            return {'id': updated_user.id,
-                    'first_name': updated_user.first_name,
-                    'last_name': updated_user.last_name,
-                    'email': updated_user.email}, 200
+            # user_serializer excludes the password
+            return json_response(user_serializer.to_json(updated_user))
+        except HashingPoolSaturated as e:
+            # Changement de mot de passe par un admin : le hachage passe aussi par le pool bcrypt
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
         except ValueError as e:
             return {'error': str(e)}, 400
 
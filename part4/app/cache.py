@@ -0,0 +1,189 @@
+"""
+Read-through cache used by HBnBFacade.
+
+Three backends are available, chosen by the CACHE_BACKEND setting:
+- 'memory': an in-process LRU with per-entry TTL (default)
+- 'redis': a local Redis server, shared by every worker (needs the redis package)
+- 'null': caching disabled
+
+Entries are grouped by entity ('place', 'user', 'amenity', ...) whose TTL comes
+from the CACHE_TTL setting.
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app
+
+try:
+    import redis
+except ImportError:  # redis is optional, only needed by the 'redis' backend
+    redis = None
+
+
+class MemoryBackend:
+    """Thread-safe LRU cache whose entries also expire after their TTL."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def generation(self, name):
+        return self._generations.get(name, 0)
+
+    def bump(self, name):
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'expirations': self.expirations, 'size': len(self._entries)}
+
+
+class RedisBackend:
+    """Cache stored on a local Redis server; values are pickled."""
+
+    def __init__(self, url, prefix='hbnb:'):
+        if redis is None:
+            raise RuntimeError("The 'redis' cache backend requires the redis package")
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def set(self, key, value, ttl=None):
+        self._client.set(self.prefix + key, pickle.dumps(value), ex=int(ttl) if ttl else None)
+
+    def delete(self, key):
+        self._client.delete(self.prefix + key)
+
+    def generation(self, name):
+        return int(self._client.get(f'{self.prefix}generation:{name}') or 0)
+
+    def bump(self, name):
+        self._client.incr(f'{self.prefix}generation:{name}')
+
+    def clear(self):
+        for key in self._client.scan_iter(self.prefix + '*'):
+            self._client.delete(key)
+
+    def stats(self):
+        # Evictions happen inside Redis and are reported by its INFO command
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': 0, 'expirations': 0,
+                'size': self._client.dbsize()}
+
+
+class NullBackend:
+    """Backend that never stores anything (CACHE_BACKEND = 'null')."""
+
+    def __init__(self):
+        self.misses = 0
+
+    def get(self, key):
+        self.misses += 1
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def generation(self, name):
+        return 0
+
+    def bump(self, name):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        return {'hits': 0, 'misses': self.misses, 'evictions': 0, 'expirations': 0, 'size': 0}
+
+
+class Cache:
+    """Flask extension giving each application its own cache backend."""
+
+    def init_app(self, app):
+        backend = app.config.get('CACHE_BACKEND', 'memory')
+        if backend == 'memory':
+            app.extensions['hbnb_cache'] = MemoryBackend(app.config.get('CACHE_MAX_ENTRIES', 10000))
+        elif backend == 'redis':
+            app.extensions['hbnb_cache'] = RedisBackend(app.config['CACHE_REDIS_URL'])
+        elif backend == 'null':
+            app.extensions['hbnb_cache'] = NullBackend()
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND: {backend}")
+
+    @property
+    def backend(self):
+        return current_app.extensions['hbnb_cache']
+
+    def _key(self, entity, key):
+        # Entity generations let invalidate_all() drop a whole entity without scanning
+        return f'{entity}:{self.backend.generation(entity)}:{key}'
+
+    def get(self, entity, key):
+        """Return the cached value or None."""
+        return self.backend.get(self._key(entity, key))
+
+    def set(self, entity, key, value):
+        """Store a value with the TTL configured for the entity."""
+        ttl = current_app.config.get('CACHE_TTL', {}).get(entity)
+        self.backend.set(self._key(entity, key), value, ttl)
+
+    def invalidate(self, entity, key):
+        """Drop one cached value."""
+        self.backend.delete(self._key(entity, key))
+
+    def invalidate_all(self, entity):
+        """Drop every cached value of an entity."""
+        self.backend.bump(entity)
+
+    def stats(self):
+        """Hit/miss/eviction counters of the current application's backend."""
+        return self.backend.stats()
@@ -0,0 +1,26 @@
+import click
+from flask.cli import with_appcontext
+
+
+@click.command('repair-ratings')
+@with_appcontext
+def repair_ratings_command():
+    """Recompute every place's rating aggregates from the reviews table."""
+    from app.services.facade import HBnBFacade  # Import différé pour éviter les imports circulaires
+    updated = HBnBFacade().recompute_rating_aggregates()
+    click.echo(f"Rating aggregates recomputed ({updated} places with reviews).")
+
+
+@click.command('backfill-grid-cells')
+@with_appcontext
+def backfill_grid_cells_command():
+    """Compute the grid cell of places stored without one (used by /places/nearby)."""
+    from app.services.facade import HBnBFacade  # Import différé pour éviter les imports circulaires
+    updated = HBnBFacade().backfill_grid_cells()
+    click.echo(f"Grid cells backfilled ({updated} places updated).")
+
+
+def register_commands(app):
+    """Register the maintenance commands on the Flask CLI (flask --app run <command>)."""
+    app.cli.add_command(repair_ratings_command)
+    app.cli.add_command(backfill_grid_cells_command)
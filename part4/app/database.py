@@ -0,0 +1,124 @@
+"""
+Engine and pool settings of the database connections.
+
+SQLALCHEMY_ENGINE_OPTIONS (pool size, overflow, checkout timeout, recycle,
+pre-ping) come from the config class. Flask-SQLAlchemy serves in-memory
+SQLite from one shared connection (StaticPool), which takes none of the
+queue pool settings, so they are dropped for those URIs; every other URI
+gets a TimedQueuePool, whose checkout waits are exported on /metrics.
+
+SQLite connections are tuned when they are opened, with SQLITE_PRAGMAS:
+- journal_mode=WAL: readers no longer block the writer, nor the writer
+  the readers;
+- synchronous=NORMAL: with WAL, fsync at checkpoints rather than at every
+  commit (a power loss may lose the last commits, a crash of the process
+  does not);
+- mmap_size and cache_size: pages read through a memory map and a larger
+  page cache;
+- busy_timeout: wait for a lock instead of failing at once with "database
+  is locked".
+"""
+import threading
+import time
+from bisect import bisect_left
+from functools import partial
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+# Bornes des buckets d'attente d'une connexion, en secondes
+CHECKOUT_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+# Options propres à QueuePool, refusées par StaticPool
+QUEUE_POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout', 'pool_use_lifo')
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkout_wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1)  # non cumulés, le dernier est +Inf
+        self.checkout_wait_seconds = 0.0
+        self.checkout_timeouts = 0
+
+    def _do_get(self):
+        # Temps pour obtenir une connexion : attente d'une connexion libre ou ouverture d'une nouvelle
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkout_wait_buckets[bisect_left(CHECKOUT_WAIT_BUCKETS, waited)] += 1
+                self.checkout_wait_seconds += waited
+                self.checkout_timeouts += timed_out
+
+    def checkout_stats(self):
+        """
+        Checkout waits since the pool was created.
+
+        :return: A tuple (bucket counts, not cumulative, the last one being
+            +Inf; total seconds; checkouts that timed out).
+        """
+        with self._stats_lock:
+            return list(self.checkout_wait_buckets), self.checkout_wait_seconds, self.checkout_timeouts
+
+
+def is_memory_sqlite(url):
+    """True for the in-memory SQLite URIs Flask-SQLAlchemy serves from a StaticPool."""
+    url = make_url(url)
+    return url.drivername in ('sqlite', 'sqlite+pysqlite') and url.database in (None, '', ':memory:')
+
+
+def _set_pragmas(pragmas, dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+    finally:
+        cursor.close()
+
+
+def engine_options(url, options, pragmas=None):
+    """
+    Options of the engine of one database.
+
+    :param url: The database URI.
+    :param options: The configured engine options (not modified).
+    :param pragmas: Optional {name: value} run on each new SQLite connection.
+    :return: The options to create the engine with.
+    """
+    options = dict(options)
+    if is_memory_sqlite(url):
+        for name in QUEUE_POOL_OPTIONS:
+            options.pop(name, None)
+    else:
+        options.setdefault('poolclass', TimedQueuePool)
+    if pragmas and make_url(url).get_backend_name() == 'sqlite':
+        options['pool_events'] = list(options.get('pool_events', ())) + [(partial(_set_pragmas, pragmas), 'connect')]
+    return options
+
+
+class DatabaseSetup:
+    """Flask extension completing the engine options of every bind; init_app runs before db.init_app."""
+
+    def init_app(self, app):
+        url = app.config.get('SQLALCHEMY_DATABASE_URI')
+        if not url:
+            # Pas de base par défaut : en production, PROD_DATABASE_URI doit être fourni
+            raise RuntimeError("SQLALCHEMY_DATABASE_URI is not set (PROD_DATABASE_URI in production)")
+        options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+        pragmas = app.config.get('SQLITE_PRAGMAS')
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(url, options, pragmas)
+        # Flask-SQLAlchemy n'applique pas SQLALCHEMY_ENGINE_OPTIONS aux autres binds (réplicas)
+        binds = {}
+        for key, value in app.config.get('SQLALCHEMY_BINDS', {}).items():
+            value = dict(value) if isinstance(value, dict) else {'url': value}
+            binds[key] = engine_options(value['url'], dict(options, **value), pragmas)
+        app.config['SQLALCHEMY_BINDS'] = binds
@@ -1,7 +1,24 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
+from flask_migrate import Migrate
+from app.cache import Cache
+from app.hashing import HashingPool
+from app.query_stats import QueryStats
+from app.metrics import Metrics
+from app.logs import LogSetup
+from app.database import DatabaseSetup
+from app.replicas import ReplicaRouter, RoutingSession
 
 jwt = JWTManager()
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 bcrypt = Bcrypt()
+# Migrations Alembic du schéma (flask --app run db upgrade)
+migrate = Migrate(render_as_batch=True)
+cache = Cache()
+hashing = HashingPool()
+query_stats = QueryStats()
+metrics = Metrics()
+logs = LogSetup()
+database = DatabaseSetup()
+replicas = ReplicaRouter()
@@ -0,0 +1,98 @@
+"""
+Geographic helpers used by the place search.
+
+Places are bucketed into a fixed latitude/longitude grid. Each place stores
+the integer id of its cell (Place.grid_cell, indexed), so a radius search
+first narrows candidates to the cells covering the circle and only then
+computes the exact great-circle distance on the survivors.
+"""
+import math
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, distances fall back to pure Python
+    numpy = None
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Size of a grid cell in degrees (~28 km of latitude)
+CELL_SIZE_DEG = 0.25
+GRID_ROWS = int(180 / CELL_SIZE_DEG)
+GRID_COLUMNS = int(360 / CELL_SIZE_DEG)
+
+# Above this many candidate rows of cells, the grid stops being selective
+MAX_GRID_ROWS = 120
+
+# Below this many candidates, the pure Python loop beats numpy's setup cost
+VECTORISE_THRESHOLD = 64
+
+
+def _row(latitude):
+    return min(int((latitude + 90) // CELL_SIZE_DEG), GRID_ROWS - 1)
+
+
+def _column(longitude):
+    return min(int((longitude + 180) // CELL_SIZE_DEG), GRID_COLUMNS - 1)
+
+
+def grid_cell(latitude, longitude):
+    """Return the id of the grid cell containing the given point."""
+    return _row(latitude) * GRID_COLUMNS + _column(longitude)
+
+
+def cell_ranges(latitude, longitude, radius_km):
+    """
+    Return the grid cells covering a circle, as inclusive (first, last) id ranges.
+
+    Cells of a grid row are contiguous ids, so the circle's bounding box maps to
+    one range per row (two when it crosses the antimeridian). Returns None when
+    the circle is too large for the grid to narrow anything down.
+    """
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = max(latitude - delta_lat, -90.0), min(latitude + delta_lat, 90.0)
+    first_row, last_row = _row(min_lat), _row(max_lat)
+    if last_row - first_row + 1 > MAX_GRID_ROWS:
+        return None
+
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 90 or delta_lat / math.cos(math.radians(widest)) >= 180:
+        column_spans = [(0, GRID_COLUMNS - 1)]
+    else:
+        delta_lon = delta_lat / math.cos(math.radians(widest))
+        west, east = longitude - delta_lon, longitude + delta_lon
+        if west < -180:
+            column_spans = [(_column(west + 360), GRID_COLUMNS - 1), (0, _column(east))]
+        elif east > 180:
+            column_spans = [(_column(west), GRID_COLUMNS - 1), (0, _column(east - 360))]
+        else:
+            column_spans = [(_column(west), _column(east))]
+
+    return [
+        (row * GRID_COLUMNS + first, row * GRID_COLUMNS + last)
+        for row in range(first_row, last_row + 1)
+        for first, last in column_spans
+    ]
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """
+    Great-circle distances in km from one point to many.
+
+    Uses numpy for large candidate sets when it is installed.
+    """
+    if numpy is not None and len(latitudes) >= VECTORISE_THRESHOLD:
+        lat1, lon1 = math.radians(latitude), math.radians(longitude)
+        lat2 = numpy.radians(numpy.asarray(latitudes, dtype=float))
+        lon2 = numpy.radians(numpy.asarray(longitudes, dtype=float))
+        a = numpy.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * numpy.cos(lat2) * numpy.sin((lon2 - lon1) / 2) ** 2
+        return (2 * EARTH_RADIUS_KM * numpy.arcsin(numpy.sqrt(numpy.minimum(a, 1.0)))).tolist()
+
+    lat1, lon1 = math.radians(latitude), math.radians(longitude)
+    cos_lat1 = math.cos(lat1)
+    distances = []
+    for lat, lon in zip(latitudes, longitudes):
+        lat2, lon2 = math.radians(lat), math.radians(lon)
+        a = math.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+        distances.append(2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0))))
+    return distances
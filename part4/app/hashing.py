@@ -0,0 +1,96 @@
+"""
+Bounded worker pool for bcrypt.
+
+Hashing and checking a password costs hundreds of milliseconds of CPU. Running
+them on a small dedicated executor caps how many cores a burst of logins can
+take, and the bounded queue turns a login storm into fast 503 responses instead
+of request workers piling up behind bcrypt.
+
+Settings:
+- HASHING_WORKERS: number of threads hashing concurrently (0 runs bcrypt inline)
+- HASHING_QUEUE_SIZE: jobs allowed to wait for a thread before new ones are rejected
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, has_app_context
+
+
+class HashingPoolSaturated(Exception):
+    """Raised when too many hashing jobs are already waiting."""
+
+
+class _Pool:
+    """Executor of one application, with its queue-depth counters."""
+
+    def __init__(self, workers, queue_size):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hbnb-hashing')
+        self._lock = threading.Lock()
+        self.pending = 0  # queued + running
+        self.max_pending = 0
+        self.completed = self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise HashingPoolSaturated("Too many password operations in progress")
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        submitted = time.perf_counter()
+
+        def job():
+            waited = time.perf_counter() - submitted
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.pending -= 1
+                    self.completed += 1
+                    self.wait_seconds += waited
+
+        return self._executor.submit(job).result()
+
+    def stats(self):
+        with self._lock:
+            return {'workers': self.workers, 'queue_size': self.queue_size,
+                    'pending': self.pending, 'max_pending': self.max_pending,
+                    'queued': max(self.pending - self.workers, 0),
+                    'completed': self.completed, 'rejected': self.rejected,
+                    'wait_seconds': self.wait_seconds}
+
+
+class HashingPool:
+    """Flask extension giving each application its own bcrypt executor."""
+
+    def init_app(self, app):
+        workers = app.config.get('HASHING_WORKERS', 2)
+        app.extensions['hbnb_hashing'] = _Pool(workers, app.config.get('HASHING_QUEUE_SIZE', 16)) if workers else None
+
+    @property
+    def pool(self):
+        return current_app.extensions.get('hbnb_hashing') if has_app_context() else None
+
+    def run(self, func, *args):
+        """
+        Run func(*args) on the pool and return its result.
+
+        Runs inline outside an application context or when the pool is disabled.
+
+        :raises HashingPoolSaturated: If the queue is full.
+        """
+        pool = self.pool
+        if pool is None:
+            return func(*args)
+        return pool.run(func, *args)
+
+    def stats(self):
+        """Queue-depth counters of the current application's pool."""
+        pool = self.pool
+        if pool is None:
+            return {'workers': 0, 'queue_size': 0, 'pending': 0, 'max_pending': 0, 'queued': 0,
+                    'completed': 0, 'rejected': 0, 'wait_seconds': 0.0}
+        return pool.stats()
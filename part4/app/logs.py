@@ -0,0 +1,137 @@
+"""
+Logging of the app package, configured from the application config.
+
+Modules log through logging.getLogger(__name__) with %-style arguments: a
+disabled message costs one level check, and an enabled one is only
+formatted once. create_app attaches a single handler to the "app" logger
+(which is also Flask's app.logger):
+- LOG_LEVEL sets its level;
+- LOG_FORMAT is 'text' or 'json' (one object per line, including the
+  fields passed with extra=, such as query_stats);
+- with LOG_ASYNC, request threads only put records on a bounded queue
+  (LOG_QUEUE_SIZE) and a listener thread formats and writes them. When the
+  queue is full, records are dropped and counted instead of blocking the
+  request.
+
+Per-row debug output (every row of a query result) goes through sample(),
+which keeps one row in LOG_ROW_SAMPLE_EVERY.
+"""
+import atexit
+import copy
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from flask import current_app, has_app_context
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+# Attributs standard d'un LogRecord : tout le reste vient de extra=
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record):
+        data = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        if record.stack_info:
+            data['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(data, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records that do not fit in the queue are dropped."""
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Le message est figé ici (ses arguments peuvent changer après l'appel) ;
+        # la mise en forme et l'écriture sont faites par le thread du listener
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def sample(rows):
+    """
+    Rows to log one by one: the first row, then one in LOG_ROW_SAMPLE_EVERY.
+
+    :param rows: An iterable of rows.
+    :return: An iterator over the sampled rows.
+    """
+    every = current_app.config.get('LOG_ROW_SAMPLE_EVERY', 100) if has_app_context() else 100
+    return islice(rows, 0, None, max(1, every))
+
+
+class LogSetup:
+    """Flask extension configuring the "app" logger."""
+
+    def __init__(self):
+        self._handler = None
+        self._listener = None
+        self._registered = False
+
+    def init_app(self, app):
+        # Le logger est global au processus : la dernière application créée le configure
+        self.stop()
+        output = logging.StreamHandler()
+        if app.config.get('LOG_FORMAT', 'text') == 'json':
+            output.setFormatter(JsonFormatter())
+        else:
+            output.setFormatter(logging.Formatter(TEXT_FORMAT))
+        if app.config.get('LOG_ASYNC', True):
+            handler = DroppingQueueHandler(queue.Queue(app.config.get('LOG_QUEUE_SIZE', 10000)))
+            self._listener = QueueListener(handler.queue, output, respect_handler_level=True)
+            self._listener.start()
+            if not self._registered:
+                # Écrit les logs encore en file avant la sortie du processus
+                atexit.register(self.stop)
+                self._registered = True
+        else:
+            handler = output
+        logger = logging.getLogger('app')
+        logger.setLevel(app.config.get('LOG_LEVEL', 'INFO'))
+        logger.addHandler(handler)
+        # Évite les doublons si l'hôte a configuré le logger racine
+        logger.propagate = False
+        self._handler = app.extensions['hbnb_logs'] = handler
+
+    def stop(self):
+        """Write the queued records and detach the handler."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._handler is not None:
+            logging.getLogger('app').removeHandler(self._handler)
+            self._handler = None
+
+    @staticmethod
+    def dropped():
+        """Number of records dropped because the queue was full."""
+        return getattr(current_app.extensions.get('hbnb_logs'), 'dropped', 0)
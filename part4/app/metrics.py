@@ -0,0 +1,316 @@
+"""
+Prometheus metrics of the API, served in the text exposition format at /metrics.
+
+Per request, the namespace (places, users, ...), the method and the status
+are counted and the latency is added to a histogram. To keep this cheap,
+every thread updates its own counters (no lock on the request path); a
+scrape adds up the per-thread counters. The counters of a thread that has
+ended are folded into a shared base shard, so the number of shards follows
+the number of live threads, not the number of threads ever started (the
+development server starts one per request). Gauges that already exist elsewhere
+(database pools, read cache, bcrypt queue, log queue) are read at scrape time.
+"""
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from flask import Response, current_app, request
+from app.database import CHECKOUT_WAIT_BUCKETS
+
+# Bornes des buckets de latence, en secondes
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Route:
+    """Counters of one (namespace, method) in one thread."""
+
+    __slots__ = ('buckets', 'seconds', 'statuses')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # non cumulés, le dernier est +Inf
+        self.seconds = 0.0
+        self.statuses = {}  # status -> count
+
+
+class _Shard:
+    """Counters written by a single thread (no thread: the base shard of ended threads)."""
+
+    __slots__ = ('routes', 'in_flight', 'thread')
+
+    def __init__(self, thread=None):
+        self.routes = {}  # (namespace, method) -> _Route
+        self.in_flight = 0
+        self.thread = weakref.ref(thread) if thread is not None else None
+
+    def ended(self):
+        if self.thread is None:
+            return False
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+    def merge(self, other):
+        """Add the counters of another shard to this one."""
+        for key, route in other.routes.items():
+            mine = self.routes.get(key)
+            if mine is None:
+                mine = self.routes[key] = _Route()
+            mine.buckets = [a + b for a, b in zip(mine.buckets, route.buckets)]
+            mine.seconds += route.seconds
+            for status, count in route.statuses.items():
+                mine.statuses[status] = mine.statuses.get(status, 0) + count
+
+
+class _Registry:
+    """Metrics of one application; its bound methods are the request hooks."""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.base = _Shard()
+        self.shards = [self.base]
+        self.lock = threading.Lock()
+        self.namespaces = {}  # route template -> namespace
+
+    # Les hooks évitent current_app et g, et résolvent le proxy request une seule
+    # fois (un attribut lu à travers le proxy coûte ~10x plus que l'objet lui-même) ;
+    # l'état de la requête est gardé dans son environ WSGI
+
+    def start(self):
+        self.shard().in_flight += 1
+        request._get_current_object().environ['hbnb.metrics_started'] = time.perf_counter()
+
+    @staticmethod
+    def status(response):
+        request._get_current_object().environ['hbnb.metrics_status'] = response.status_code
+        return response
+
+    def finish(self, exc):
+        req = request._get_current_object()
+        started = req.environ.pop('hbnb.metrics_started', None)
+        if started is None:
+            return
+        shard = self.shard()
+        shard.in_flight -= 1
+        self.observe(self.namespace(req.url_rule), req.method, req.environ.pop('hbnb.metrics_status', 500),
+                     time.perf_counter() - started, shard)
+
+    def namespace(self, rule):
+        # Étiquette bornée : le namespace de la route, jamais le chemin brut
+        if rule is None:
+            return 'unmatched'
+        namespace = self.namespaces.get(rule.rule)
+        if namespace is None:
+            parts = rule.rule.split('/')
+            if len(parts) > 3 and parts[1] == 'api':
+                namespace = parts[3] or 'root'
+            else:
+                namespace = parts[1] or 'root'
+            self.namespaces[rule.rule] = namespace
+        return namespace
+
+    def shard(self):
+        shard = getattr(self.local, 'shard', None)
+        if shard is None:
+            # Une seule fois par thread : le verrou n'est pris qu'à l'enregistrement du shard
+            shard = self.local.shard = _Shard(threading.current_thread())
+            with self.lock:
+                self.fold_ended()
+                self.shards.append(shard)
+        return shard
+
+    def fold_ended(self):
+        # Appelé sous self.lock ; un thread terminé n'écrit plus dans son shard.
+        # Son in_flight (non nul si le thread est mort en pleine requête) est abandonné.
+        live = []
+        for shard in self.shards:
+            if shard.ended():
+                self.base.merge(shard)
+            else:
+                live.append(shard)
+        self.shards = live
+
+    def observe(self, namespace, method, status, seconds, shard=None):
+        """Count one request in the current thread's shard."""
+        routes = (shard or self.shard()).routes
+        route = routes.get((namespace, method))
+        if route is None:
+            route = routes[namespace, method] = _Route()
+        route.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        route.seconds += seconds
+        route.statuses[status] = route.statuses.get(status, 0) + 1
+
+    def collect(self):
+        """
+        Sum of every shard.
+
+        :return: A tuple ({(namespace, method, status): count},
+            {(namespace, method): (bucket counts, seconds)}, in_flight).
+        """
+        requests, latency, in_flight = {}, {}, 0
+        # Sous le verrou : un shard replié dans la base pendant la lecture serait compté deux fois
+        with self.lock:
+            self.fold_ended()
+            for shard in self.shards:
+                # dict() et list() copient en C, sans laisser la main aux autres threads
+                for key, route in dict(shard.routes).items():
+                    for status, count in dict(route.statuses).items():
+                        requests[key + (status,)] = requests.get(key + (status,), 0) + count
+                    buckets, seconds = latency.get(key, ([0] * len(route.buckets), 0.0))
+                    latency[key] = ([a + b for a, b in zip(buckets, list(route.buckets))], seconds + route.seconds)
+                in_flight += shard.in_flight
+        return requests, latency, in_flight
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram(name, bounds, buckets, seconds, **labels):
+    """Sample lines of one histogram series, from non-cumulative bucket counts."""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(bounds + ('+Inf',), buckets):
+        cumulative += count
+        le = bound if isinstance(bound, str) else _format(float(bound))
+        lines.append(f'{name}_bucket{_labels(**labels, le=le)} {cumulative}')
+    lines.append(f'{name}_sum{_labels(**labels)} {_format(float(seconds))}')
+    lines.append(f'{name}_count{_labels(**labels)} {cumulative}')
+    return lines
+
+
+class Metrics:
+    """Flask extension collecting request metrics and serving /metrics."""
+
+    def init_app(self, app):
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+        registry = app.extensions['hbnb_metrics'] = _Registry()
+        app.before_request(registry.start)
+        app.after_request(registry.status)
+        app.teardown_request(registry.finish)
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', self.render)
+
+    def render(self):
+        """GET /metrics: every metric in the Prometheus text format."""
+        return Response(self.exposition(), mimetype=None, content_type=CONTENT_TYPE)
+
+    def exposition(self):
+        """Text of the current metrics."""
+        from app.extensions import cache, hashing, logs  # import local : app.extensions importe ce module
+
+        requests, latency, in_flight = current_app.extensions['hbnb_metrics'].collect()
+        lines = [
+            '# HELP hbnb_http_requests_total HTTP requests handled, by namespace, method and status.',
+            '# TYPE hbnb_http_requests_total counter',
+        ]
+        for (namespace, method, status), count in sorted(requests.items()):
+            lines.append(f'hbnb_http_requests_total{_labels(namespace=namespace, method=method, status=status)} {count}')
+
+        lines += [
+            '# HELP hbnb_http_request_duration_seconds Time spent handling HTTP requests.',
+            '# TYPE hbnb_http_request_duration_seconds histogram',
+        ]
+        for (namespace, method), (buckets, seconds) in sorted(latency.items()):
+            lines += _histogram('hbnb_http_request_duration_seconds', LATENCY_BUCKETS, buckets, seconds,
+                                namespace=namespace, method=method)
+
+        lines += [
+            '# HELP hbnb_http_requests_in_flight HTTP requests being handled.',
+            '# TYPE hbnb_http_requests_in_flight gauge',
+            f'hbnb_http_requests_in_flight {in_flight}',
+        ]
+        lines += self._pool_metrics()
+
+        stats = cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        lines += [
+            '# HELP hbnb_cache_hits_total Read cache hits.',
+            '# TYPE hbnb_cache_hits_total counter',
+            f"hbnb_cache_hits_total {stats['hits']}",
+            '# HELP hbnb_cache_misses_total Read cache misses.',
+            '# TYPE hbnb_cache_misses_total counter',
+            f"hbnb_cache_misses_total {stats['misses']}",
+            '# HELP hbnb_cache_evictions_total Entries evicted from the read cache.',
+            '# TYPE hbnb_cache_evictions_total counter',
+            f"hbnb_cache_evictions_total {stats['evictions']}",
+            '# HELP hbnb_cache_entries Entries in the read cache.',
+            '# TYPE hbnb_cache_entries gauge',
+            f"hbnb_cache_entries {stats['size']}",
+            '# HELP hbnb_cache_hit_ratio Share of cache lookups that were hits since startup.',
+            '# TYPE hbnb_cache_hit_ratio gauge',
+            f"hbnb_cache_hit_ratio {_format(stats['hits'] / lookups if lookups else 0.0)}",
+        ]
+
+        stats = hashing.stats()
+        lines += [
+            '# HELP hbnb_hashing_workers Threads dedicated to bcrypt.',
+            '# TYPE hbnb_hashing_workers gauge',
+            f"hbnb_hashing_workers {stats['workers']}",
+            '# HELP hbnb_hashing_queue_depth bcrypt jobs waiting for a worker.',
+            '# TYPE hbnb_hashing_queue_depth gauge',
+            f"hbnb_hashing_queue_depth {stats['queued']}",
+            '# HELP hbnb_hashing_pending bcrypt jobs queued or running.',
+            '# TYPE hbnb_hashing_pending gauge',
+            f"hbnb_hashing_pending {stats['pending']}",
+            '# HELP hbnb_hashing_completed_total bcrypt jobs completed.',
+            '# TYPE hbnb_hashing_completed_total counter',
+            f"hbnb_hashing_completed_total {stats['completed']}",
+            '# HELP hbnb_hashing_rejected_total bcrypt jobs rejected because the queue was full.',
+            '# TYPE hbnb_hashing_rejected_total counter',
+            f"hbnb_hashing_rejected_total {stats['rejected']}",
+            '# HELP hbnb_hashing_wait_seconds_total Time bcrypt jobs spent waiting for a worker.',
+            '# TYPE hbnb_hashing_wait_seconds_total counter',
+            f"hbnb_hashing_wait_seconds_total {_format(float(stats['wait_seconds']))}",
+            '# HELP hbnb_log_records_dropped_total Log records dropped because the log queue was full.',
+            '# TYPE hbnb_log_records_dropped_total counter',
+            f'hbnb_log_records_dropped_total {logs.dropped()}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _pool_metrics():
+        lines = [
+            '# HELP hbnb_db_pool_connections Database pool connections, by bind and state.',
+            '# TYPE hbnb_db_pool_connections gauge',
+        ]
+        waits, timeouts = [], []
+        for bind, engine in current_app.extensions['sqlalchemy'].engines.items():
+            pool = engine.pool
+            bind = bind or 'default'
+            # Seul QueuePool a une taille fixe ; les pools SQLite n'exposent pas tout
+            for state in ('size', 'checkedin', 'checkedout', 'overflow'):
+                reader = getattr(pool, state, None)
+                if callable(reader):
+                    lines.append(f'hbnb_db_pool_connections{_labels(bind=bind, state=state)} {reader()}')
+            # Attente des connexions : seulement pour les pools TimedQueuePool (pas SQLite en mémoire)
+            checkout_stats = getattr(pool, 'checkout_stats', None)
+            if checkout_stats is not None:
+                buckets, seconds, timed_out = checkout_stats()
+                waits += _histogram('hbnb_db_pool_checkout_wait_seconds', CHECKOUT_WAIT_BUCKETS, buckets, seconds,
+                                    bind=bind)
+                timeouts.append(f'hbnb_db_pool_checkout_timeouts_total{_labels(bind=bind)} {timed_out}')
+        replicas = current_app.extensions.get('hbnb_replicas')
+        if replicas is not None:
+            lines += [
+                '# HELP hbnb_db_replica_up Whether a read replica is used (1) or skipped as unhealthy (0).',
+                '# TYPE hbnb_db_replica_up gauge',
+            ] + [f'hbnb_db_replica_up{_labels(bind=replica.bind)} {int(replica.healthy)}'
+                 for replica in replicas.replicas]
+        if waits:
+            lines += [
+                '# HELP hbnb_db_pool_checkout_wait_seconds Time taken to get a connection from the pool.',
+                '# TYPE hbnb_db_pool_checkout_wait_seconds histogram',
+            ] + waits + [
+                '# HELP hbnb_db_pool_checkout_timeouts_total Checkouts that gave up after pool_timeout.',
+                '# TYPE hbnb_db_pool_checkout_timeouts_total counter',
+            ] + timeouts
+        return lines
@@ -1,7 +1,8 @@
 from app import db
+from app.geo import grid_cell
 from .base_model import BaseModel
 from sqlalchemy import Column, Integer, String, Float, ForeignKey, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 # Table d'association pour la relation many-to-many entre Place et Amenity
 place_amenity_association = Table(
@@ -11,15 +12,31 @@ place_amenity_association = Table(
     Column('amenity_id', Integer, ForeignKey('amenities.id'), primary_key=True)
 )
 
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 class Place(BaseModel, db.Model):
     __tablename__ = 'places'
 
     id = Column(Integer, primary_key=True)
     title = Column(String(100), nullable=False)
     description = Column(String, nullable=True)
-    price = Column(Float, default=0.0)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
+    price = Column(Float, default=0.0, index=True)
+    latitude = Column(Float, nullable=False, index=True)
+    longitude = Column(Float, nullable=False, index=True)
+    # Cellule de la grille géographique (app.geo), recalculée à chaque écriture de latitude/longitude
+    grid_cell = Column(Integer, nullable=True, index=True)
+
+    # Agrégats des notes, maintenus par le facade à chaque création/modification/suppression d'avis
+    review_count = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_sum = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_1 = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_2 = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_3 = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_4 = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_5 = Column(Integer, nullable=False, default=0, server_default='0')
 
     owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     owner = relationship('User', back_populates='places', lazy=True)
@@ -57,6 +74,63 @@ class Place(BaseModel, db.Model):
         if not isinstance(self.longitude, (int, float)) or not (-180 <= self.longitude <= 180):
             raise ValueError("Longitude must be a number between -180 et 180")
 
+    @validates('latitude', 'longitude')
+    def _update_grid_cell(self, key, value):
+        """Recalcule la cellule de la grille quand une coordonnée change (constructeur compris)"""
+        latitude = value if key == 'latitude' else self.latitude
+        longitude = value if key == 'longitude' else self.longitude
+        if _is_number(latitude) and _is_number(longitude):
+            self.grid_cell = grid_cell(latitude, longitude)
+        else:
+            # Coordonnée manquante ou invalide : validate_attributes la refusera
+            self.grid_cell = None
+        return value
+
+    @property
+    def average_rating(self):
+        """Note moyenne, ou None si le lieu n'a pas encore d'avis"""
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+    @property
+    def rating_histogram(self):
+        """Nombre d'avis par note, de 1 à 5"""
+        return {str(rating): getattr(self, f'rating_{rating}') or 0 for rating in range(1, 6)}
+
+    def update_rating_aggregates(self, added=None, removed=None):
+        """
+        Met à jour les agrégats pour une note ajoutée et/ou retirée.
+
+        Les valeurs sont des incréments SQL (col = col + n) : ils sont écrits
+        dans la même transaction que l'avis et restent justes en concurrence.
+        """
+        cls = type(self)
+        count_delta = (added is not None) - (removed is not None)
+        sum_delta = (added or 0) - (removed or 0)
+        if count_delta:
+            self.review_count = cls.review_count + count_delta
+        if sum_delta:
+            self.rating_sum = cls.rating_sum + sum_delta
+        if added != removed:
+            if added is not None:
+                setattr(self, f'rating_{added}', getattr(cls, f'rating_{added}') + 1)
+            if removed is not None:
+                setattr(self, f'rating_{removed}', getattr(cls, f'rating_{removed}') - 1)
+
+    def add_ratings_to_aggregates(self, ratings):
+        """
+        Ajoute plusieurs notes en une fois (création d'avis en masse).
+
+        update_rating_aggregates ne peut être appelé qu'une fois par flush :
+        un second appel réécrirait le même incrément au lieu de l'ajouter.
+        """
+        cls = type(self)
+        self.review_count = cls.review_count + len(ratings)
+        self.rating_sum = cls.rating_sum + sum(ratings)
+        for rating in set(ratings):
+            setattr(self, f'rating_{rating}', getattr(cls, f'rating_{rating}') + ratings.count(rating))
+
     def add_review(self, review):
         self.reviews.append(review)
 
@@ -2,11 +2,17 @@ from app import db
 from .base_model import BaseModel
 from .place import Place
 from .user import User
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 class Review(BaseModel, db.Model):
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # Sert les listes d'avis par lieu, triées par date, sans parcourir la table
+        Index('ix_reviews_place_id_created_at', 'place_id', 'created_at'),
+        # Un utilisateur ne peut noter un lieu qu'une seule fois (cf. setup.sql)
+        UniqueConstraint('user_id', 'place_id', name='uq_reviews_user_id_place_id'),
+    )
 
     id = Column(Integer, primary_key=True)
     text = Column(String, nullable=False)
@@ -1,4 +1,6 @@
+from flask import current_app
 from app import db, bcrypt
+from app.extensions import hashing
 from .base_model import BaseModel
 import re
 from sqlalchemy import Column, Integer, String, Boolean
@@ -32,12 +34,20 @@ class User(BaseModel, db.Model):
     def hash_password(self, password):
         if not password.strip():
             raise ValueError("Mot de passe vide")
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = hashing.run(bcrypt.generate_password_hash, password).decode('utf-8')
 
     def verify_password(self, password):
         if not self.password:
             return False
-        return bcrypt.check_password_hash(self.password, password)
+        return hashing.run(bcrypt.check_password_hash, self.password, password)
+
+    def password_needs_rehash(self):
+        """True if the stored hash was made with another cost than BCRYPT_LOG_ROUNDS"""
+        # Format d'un hash bcrypt : $2b$<cost>$<salt+hash>
+        parts = (self.password or '').split('$')
+        if len(parts) < 4 or not parts[2].isdigit():
+            return False
+        return int(parts[2]) != current_app.config.get('BCRYPT_LOG_ROUNDS', 12)
 
     def validate(self):
         if not self.first_name or len(self.first_name) > 50:
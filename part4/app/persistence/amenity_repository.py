@@ -22,10 +22,10 @@ class AmenityRepository:
         try:
             amenity = self.model(name=name)
             db.session.add(amenity)
-            db.session.commit()
+            db.session.flush()
             return amenity
         except IntegrityError:
-            db.session.rollback()
+            # Le rollback est fait par l'unit of work appelante
             raise ValueError("Erreur lors de la création de l'amenity (contrainte invalide).")
 
     def update(self, amenity_id, data):
@@ -38,7 +38,7 @@ class AmenityRepository:
             if hasattr(amenity, key) and key != "id":
                 setattr(amenity, key, value)
 
-        db.session.commit()
+        db.session.flush()
         return amenity
 
     def delete(self, amenity_id):
@@ -48,4 +48,4 @@ class AmenityRepository:
             raise ValueError("Amenity introuvable.")
 
         db.session.delete(amenity)
-        db.session.commit()
+        db.session.flush()
@@ -1,14 +1,18 @@
 # app/persistence/place_repository.py
 
 from app.models.place import Place
+from app.models.amenity import Amenity
 from app import db
+from app.persistence.repository import SQLAlchemyRepository
+from app.geo import cell_ranges, grid_cell, KM_PER_DEGREE
+from sqlalchemy import or_, select, update
 from sqlalchemy.exc import IntegrityError
 
-class PlaceRepository:
+class PlaceRepository(SQLAlchemyRepository):
     """Repository spécifique pour le modèle Place (sans relations)."""
 
     def __init__(self):
-        self.model = Place
+        super().__init__(Place)
 
     def get_by_id(self, place_id):
         """Récupère un lieu (Place) par son ID."""
@@ -26,10 +30,10 @@ class PlaceRepository:
                 owner_id=owner_id,
             )
             db.session.add(place)
-            db.session.commit()
+            db.session.flush()
             return place
         except IntegrityError:
-            db.session.rollback()
+            # Le rollback est fait par l'unit of work appelante
             raise ValueError("Erreur lors de la création du lieu (doublon ou contrainte invalide).")
 
     def update(self, place_id, data):
@@ -43,7 +47,7 @@ class PlaceRepository:
             if hasattr(place, key) and key != "id":
                 setattr(place, key, value)
 
-        db.session.commit()
+        db.session.flush()
         return place
 
     def delete(self, place_id):
@@ -53,4 +57,110 @@ class PlaceRepository:
             raise ValueError("Lieu introuvable.")
 
         db.session.delete(place)
-        db.session.commit()
+        db.session.flush()
+
+    def search_criteria(self, min_price=None, max_price=None, bbox=None, amenity_ids=None):
+        """
+        Construit les prédicats SQL de recherche de lieux.
+
+        Les bornes de prix et de coordonnées s'appuient sur les index de
+        places.price, places.latitude et places.longitude ; chaque amenity
+        requise devient un EXISTS sur la clé primaire de la table d'association.
+
+        Args:
+            min_price: prix minimum (inclus)
+            max_price: prix maximum (inclus)
+            bbox: tuple (min_lon, min_lat, max_lon, max_lat)
+            amenity_ids: IDs des amenities que le lieu doit toutes proposer
+
+        Returns:
+            list: Liste d'expressions à passer à get_page / filter
+        """
+        criteria = []
+        if min_price is not None:
+            criteria.append(self.model.price >= min_price)
+        if max_price is not None:
+            criteria.append(self.model.price <= max_price)
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            criteria.append(self.model.latitude.between(min_lat, max_lat))
+            if min_lon <= max_lon:
+                criteria.append(self.model.longitude.between(min_lon, max_lon))
+            else:
+                # La boîte traverse l'antiméridien
+                criteria.append(or_(self.model.longitude >= min_lon, self.model.longitude <= max_lon))
+        for amenity_id in amenity_ids or []:
+            criteria.append(self.model.amenities.any(Amenity.id == amenity_id))
+        return criteria
+
+    def get_nearby_candidates(self, latitude, longitude, radius_km):
+        """
+        Récupère (id, latitude, longitude) des lieux dont la cellule de grille
+        recoupe le cercle demandé.
+
+        Seules les colonnes utiles au calcul de distance sont lues ; le
+        filtrage exact (haversine) est fait ensuite par l'appelant.
+        """
+        delta_lat = radius_km / KM_PER_DEGREE
+        query = db.session.query(self.model.id, self.model.latitude, self.model.longitude).filter(
+            self.model.latitude.between(latitude - delta_lat, latitude + delta_lat)
+        )
+        ranges = cell_ranges(latitude, longitude, radius_km)
+        if ranges is not None:
+            query = query.filter(or_(*[self.model.grid_cell.between(first, last) for first, last in ranges]))
+        return query.all()
+
+    def replace_rating_aggregates(self, counts):
+        """
+        Remplace les agrégats de notes de tous les lieux.
+
+        Args:
+            counts: {place_id: {note: nombre d'avis}}, cf. ReviewRepository.count_ratings_by_place
+
+        Returns:
+            int: Nombre de lieux ayant au moins un avis
+        """
+        histogram = [f'rating_{rating}' for rating in range(1, 6)]
+        db.session.execute(update(self.model).values(
+            review_count=0, rating_sum=0, **{column: 0 for column in histogram}
+        ))
+        rows = []
+        for place_id, by_rating in counts.items():
+            row = {'id': place_id, 'review_count': sum(by_rating.values()),
+                   'rating_sum': sum(rating * count for rating, count in by_rating.items())}
+            row.update({f'rating_{rating}': by_rating.get(rating, 0) for rating in range(1, 6)})
+            rows.append(row)
+        if rows:
+            # UPDATE ... WHERE id = ? exécuté en executemany
+            db.session.execute(update(self.model), rows)
+        return len(rows)
+
+    def refresh_grid_cells(self, batch_size=1000):
+        """
+        Recalcule la cellule de grille des lieux où elle est absente ou fausse.
+
+        Rattrape les lignes antérieures à la colonne et celles écrites sans
+        passer par le modèle (INSERT/UPDATE en SQL direct).
+
+        Args:
+            batch_size: Nombre de lignes lues puis mises à jour à la fois
+
+        Returns:
+            int: Nombre de lieux mis à jour
+        """
+        model = self.model
+        rows = db.session.execute(
+            select(model.id, model.latitude, model.longitude, model.grid_cell).order_by(model.id)
+        ).yield_per(batch_size)
+        updated = 0
+        for partition in rows.partitions():
+            stale = []
+            for place_id, latitude, longitude, cell in partition:
+                expected = grid_cell(latitude, longitude)
+                if cell != expected:
+                    stale.append({'id': place_id, 'grid_cell': expected})
+            if stale:
+                # UPDATE ... WHERE id = ? exécuté en executemany
+                db.session.execute(update(model), stale)
+                updated += len(stale)
+        return updated
@@ -1,10 +1,61 @@
+import base64
+import copy
+import itertools
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import func, inspect, tuple_
+from sqlalchemy.orm import load_only
 from app.extensions import db  # Import SQLAlchemy instance for database operations
 
 logger = logging.getLogger(__name__)
 
 
+def encode_cursor(values):
+    """Encode the sort key of the last row of a page into an opaque cursor."""
+    payload = [{'dt': value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, types=None):
+    """
+    Decode a cursor produced by encode_cursor, raising ValueError if it is malformed.
+
+    :param cursor: The cursor sent by the client.
+    :param types: Optional Python types of the sort key; the cursor must hold one
+        value of each (or None), in that order.
+    :return: The list of values of the sort key.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, list):
+            raise ValueError("Invalid cursor")
+        values = [datetime.fromisoformat(value['dt']) if isinstance(value, dict) else value for value in payload]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if types is not None:
+        # Un curseur forgé ne doit pas arriver jusqu'à la base (liste, objet... => erreur du driver)
+        if len(values) != len(types) or not all(_cursor_value_matches(value, expected)
+                                                for value, expected in zip(values, types)):
+            raise ValueError("Invalid cursor")
+    return values
+
+
+def _cursor_value_matches(value, expected):
+    if value is None:
+        return True
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        # Un float entier peut avoir été relu en int
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
 class Repository(ABC):
     """Abstract base class for repositories."""
 
@@ -13,11 +64,21 @@ class Repository(ABC):
         """Add an object to the repository."""
         pass
 
+    @abstractmethod
+    def add_all(self, objs):
+        """Add several objects to the repository at once."""
+        pass
+
     @abstractmethod
     def get(self, obj_id):
         """Retrieve an object by its ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, obj_ids):
+        """Retrieve the objects matching a list of IDs, skipping unknown ones."""
+        pass
+
     @abstractmethod
     def get_all(self):
         """Retrieve all objects in the repository."""
@@ -38,61 +99,368 @@ class Repository(ABC):
         """Retrieve an object by a specific attribute."""
         pass
 
+    @abstractmethod
+    def filter_by(self, **criteria):
+        """Retrieve every object whose attributes equal the given values."""
+        pass
+
 
 class InMemoryRepository(Repository):
-    """In-memory implementation of the repository for testing and prototyping."""
+    """
+    In-memory implementation of the repository for testing and prototyping.
+
+    Attributes that are looked up often can be declared as secondary indexes
+    (attribute value -> objects), kept in sync by add/update/delete, so that
+    get_by_attribute and filter_by no longer scan every object. Objects must
+    be changed through update() for their indexes to follow.
+    """
 
-    def __init__(self):
+    def __init__(self, unique_indexes=(), indexes=()):
+        """
+        :param unique_indexes: Attributes whose values identify at most one object (e.g. email).
+        :param indexes: Attributes whose values are shared by several objects (e.g. place_id).
+        """
         self._storage = {}
+        # Index unique : valeur -> objet ; index simple : valeur -> {id: objet}
+        self._unique = {name: {} for name in unique_indexes}
+        self._indexes = {name: {} for name in indexes}
+
+    def _index(self, obj):
+        # Comme en SQL, None n'est pas soumis à l'unicité (et n'est pas indexé)
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            other = index.get(value) if value is not None else None
+            if other is not None and other.id != obj.id:
+                raise ValueError(f"An item with {name}={value!r} already exists")
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            if value is not None:
+                index[value] = obj
+        for name, index in self._indexes.items():
+            index.setdefault(getattr(obj, name, None), {})[obj.id] = obj
+
+    def _unindex(self, obj):
+        for name, index in self._unique.items():
+            value = getattr(obj, name, None)
+            if value is not None and index.get(value) is obj:
+                del index[value]
+        for name, index in self._indexes.items():
+            value = getattr(obj, name, None)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(obj.id, None)
+                if not bucket:
+                    del index[value]
+
+    def _put(self, obj):
+        previous = self._storage.get(obj.id)
+        if previous is not None:
+            self._unindex(previous)
+        try:
+            self._index(obj)
+        except ValueError:
+            if previous is not None:
+                self._index(previous)
+            raise
+        self._storage[obj.id] = obj
 
     def add(self, obj):
-        logger.debug(f"Adding item with ID {obj.id} to repository")
-        self._storage[obj.id] = obj
-        logger.debug(f"Repository now contains {len(self._storage)} items")
+        logger.debug("Adding item with ID %s to repository", obj.id)
+        self._put(obj)
+        logger.debug("Repository now contains %d items", len(self._storage))
         return obj
 
+    def add_all(self, objs):
+        # Stops at the first duplicate of a unique index, like the SQL implementation
+        for obj in objs:
+            self._put(obj)
+        logger.debug("Repository now contains %d items", len(self._storage))
+        return objs
+
     def get(self, obj_id):
-        logger.debug(f"Fetching item with ID {obj_id}")
+        logger.debug("Fetching item with ID %s", obj_id)
         obj = self._storage.get(obj_id)
         if obj:
-            logger.debug(f"Found item with ID {obj_id}")
+            logger.debug("Found item with ID %s", obj_id)
         else:
-            logger.debug(f"No item found with ID {obj_id}")
+            logger.debug("No item found with ID %s", obj_id)
         return obj
 
+    def get_many(self, obj_ids):
+        obj_ids = list(dict.fromkeys(obj_ids))
+        logger.debug("Fetching %d items by ID", len(obj_ids))
+        return [self._storage[obj_id] for obj_id in obj_ids if obj_id in self._storage]
+
     def get_all(self):
         return list(self._storage.values())
 
     def update(self, obj_id, data):
         if obj_id in self._storage:
             obj = self._storage[obj_id]
+            previous = {key: getattr(obj, key, None) for key in data}
+            self._unindex(obj)
             for key, value in data.items():
                 setattr(obj, key, value)
-            logger.debug(f"Updated item with ID {obj_id}")
+            try:
+                self._index(obj)
+            except ValueError:
+                for key, value in previous.items():
+                    setattr(obj, key, value)
+                self._index(obj)
+                raise
+            logger.debug("Updated item with ID %s", obj_id)
             return obj
-        logger.debug(f"Failed to update: no item with ID {obj_id}")
+        logger.debug("Failed to update: no item with ID %s", obj_id)
         return None
 
     def delete(self, obj_id):
         if obj_id in self._storage:
-            del self._storage[obj_id]
-            logger.debug(f"Deleted item with ID {obj_id}")
+            self._unindex(self._storage.pop(obj_id))
+            logger.debug("Deleted item with ID %s", obj_id)
             return True
-        logger.debug(f"Failed to delete: no item with ID {obj_id}")
+        logger.debug("Failed to delete: no item with ID %s", obj_id)
         return False
 
     def get_by_attribute(self, attr_name, attr_value):
-        logger.debug(f"Searching for item with {attr_name}={attr_value}")
+        logger.debug("Searching for item with %s=%s", attr_name, attr_value)
+        if attr_name in self._unique and attr_value is not None:
+            return self._unique[attr_name].get(attr_value)
+        if attr_name in self._indexes:
+            return next(iter(self._indexes[attr_name].get(attr_value, {}).values()), None)
         for obj in self._storage.values():
             if getattr(obj, attr_name, None) == attr_value:
-                logger.debug(f"Found item with {attr_name}={attr_value}")
+                logger.debug("Found item with %s=%s", attr_name, attr_value)
                 return obj
-        logger.debug(f"No item found with {attr_name}={attr_value}")
+        logger.debug("No item found with %s=%s", attr_name, attr_value)
         return None
 
+    def filter_by(self, **criteria):
+        # On part du plus petit index disponible, les autres critères sont vérifiés un par un
+        candidates = None
+        for name, value in criteria.items():
+            if name in self._unique and value is not None:
+                obj = self._unique[name].get(value)
+                matches = [obj] if obj is not None else []
+            elif name in self._indexes:
+                matches = self._indexes[name].get(value, {}).values()
+            else:
+                continue
+            if candidates is None or len(matches) < len(candidates):
+                candidates = matches
+        if candidates is None:
+            candidates = self._storage.values()
+        return [obj for obj in candidates
+                if all(getattr(obj, name, None) == value for name, value in criteria.items())]
+
+
+class ConcurrentInMemoryRepository(Repository):
+    """
+    In-memory repository that can be shared by the threads of a server.
+
+    Readers take no lock. Objects are never changed in place: update()
+    stores a modified copy, so a reader sees either the old or the new
+    version, never a mix. Every dict a reader looks into is only changed
+    one key at a time (an atomic operation), and the buckets of the
+    secondary indexes are replaced rather than modified, so a reader can
+    iterate the bucket it got. get_all() returns a tuple built once per
+    state of the store, on the first call after a write, and shared by the
+    following readers.
+
+    Writers are serialised per key with lock striping: a write takes the
+    stripes of the object's id and of the index values it frees or claims
+    (in a fixed order, so writers cannot deadlock), then changes only those
+    entries. Writers to different keys run in parallel and a write costs
+    O(1) whatever the size of the store, except for the copy of the index
+    buckets it touches. A write that fails on a unique index changes
+    nothing; add_all() checks the whole batch before applying any of it.
+    """
+
+    def __init__(self, unique_indexes=(), indexes=(), stripes=64):
+        """
+        :param unique_indexes: Attributes whose values identify at most one object (e.g. email).
+        :param indexes: Attributes whose values are shared by several objects (e.g. place_id).
+        :param stripes: Number of write locks the keys are spread over.
+        """
+        self._storage = {}
+        # Index unique : valeur -> objet ; index simple : valeur -> {id: objet}, remplacé à chaque écriture
+        self._unique = {name: {} for name in unique_indexes}
+        self._indexes = {name: {} for name in indexes}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Numéro de l'état publié, et le tuple de get_all() construit pour cet état
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._all = (0, ())
+
+    def _stripes(self, obj_ids, *objs):
+        """Indexes of the locks covering these ids and the index values of these objects, sorted."""
+        stripes = len(self._locks)
+        keys = {hash(obj_id) % stripes for obj_id in obj_ids}
+        for obj in objs:
+            if obj is None:
+                continue
+            for name in self._unique:
+                value = getattr(obj, name, None)
+                if value is not None:
+                    keys.add(hash((name, value)) % stripes)
+            for name in self._indexes:
+                keys.add(hash((name, getattr(obj, name, None))) % stripes)
+        return sorted(keys)
+
+    @contextmanager
+    def _locked(self, stripes):
+        locks = [self._locks[stripe] for stripe in stripes]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _check_unique(self, objs):
+        # Appelé sous les verrous des valeurs réclamées
+        obj_ids = {obj.id for obj in objs}
+        for name, index in self._unique.items():
+            claimed = {}
+            for obj in objs:
+                value = getattr(obj, name, None)
+                if value is None:
+                    continue
+                other = index.get(value)
+                if claimed.setdefault(value, obj.id) != obj.id or (other is not None and other.id not in obj_ids):
+                    raise ValueError(f"An item with {name}={value!r} already exists")
+
+    def _replace(self, previous, obj):
+        # Appelé sous les verrous de l'id et des valeurs des deux versions (l'une peut être None)
+        if obj is not None:
+            self._storage[obj.id] = obj
+        else:
+            del self._storage[previous.id]
+        for name, index in self._unique.items():
+            value = getattr(previous, name, None)
+            if value is not None and index.get(value) is previous:
+                del index[value]
+            value = getattr(obj, name, None)
+            if value is not None:
+                index[value] = obj
+        for name, index in self._indexes.items():
+            if previous is not None:
+                value = getattr(previous, name, None)
+                bucket = {obj_id: other for obj_id, other in index.get(value, {}).items() if obj_id != previous.id}
+                if bucket:
+                    index[value] = bucket
+                else:
+                    index.pop(value, None)
+            if obj is not None:
+                value = getattr(obj, name, None)
+                bucket = dict(index.get(value, {}))
+                bucket[obj.id] = obj
+                index[value] = bucket
+        # Après la modification : un get_all() construit avant ne sera pas réutilisé
+        self._version = next(self._versions)
+
+    def add(self, obj):
+        while True:
+            previous = self._storage.get(obj.id)
+            with self._locked(self._stripes([obj.id], previous, obj)):
+                # Remplacé par un autre écrivain avant la prise des verrous : ses valeurs n'étaient pas couvertes
+                if self._storage.get(obj.id) is not previous:
+                    continue
+                self._check_unique([obj])
+                self._replace(previous, obj)
+            return obj
+
+    def add_all(self, objs):
+        objs = list(objs)
+        while True:
+            previous = {obj.id: self._storage.get(obj.id) for obj in objs}
+            with self._locked(self._stripes(previous, *previous.values(), *objs)):
+                if any(self._storage.get(obj_id) is not obj for obj_id, obj in previous.items()):
+                    continue
+                self._check_unique(objs)
+                for obj in objs:
+                    self._replace(self._storage.get(obj.id), obj)
+            return objs
+
+    def get(self, obj_id):
+        return self._storage.get(obj_id)
+
+    def get_many(self, obj_ids):
+        storage = self._storage
+        return [obj for obj in map(storage.get, dict.fromkeys(obj_ids)) if obj is not None]
+
+    def get_all(self):
+        """Every object, as a tuple shared by the readers until the next write."""
+        version = self._version
+        built, objs = self._all
+        if built != version:
+            # Copie faite en C, sans rendre la main aux autres threads ; étiquetée avec la version lue
+            # avant : si une écriture a lieu pendant ce temps, la suivante est reconstruite
+            objs = tuple(self._storage.values())
+            self._all = (version, objs)
+        return objs
+
+    def update(self, obj_id, data):
+        while True:
+            previous = self._storage.get(obj_id)
+            if previous is None:
+                logger.debug("Failed to update: no item with ID %s", obj_id)
+                return None
+            obj = copy.copy(previous)
+            for key, value in data.items():
+                setattr(obj, key, value)
+            with self._locked(self._stripes([obj_id], previous, obj)):
+                if self._storage.get(obj_id) is not previous:
+                    continue
+                self._check_unique([obj])
+                self._replace(previous, obj)
+            logger.debug("Updated item with ID %s", obj_id)
+            return obj
+
+    def delete(self, obj_id):
+        while True:
+            previous = self._storage.get(obj_id)
+            if previous is None:
+                logger.debug("Failed to delete: no item with ID %s", obj_id)
+                return False
+            with self._locked(self._stripes([obj_id], previous)):
+                if self._storage.get(obj_id) is not previous:
+                    continue
+                self._replace(previous, None)
+            return True
+
+    def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._unique and attr_value is not None:
+            return self._unique[attr_name].get(attr_value)
+        if attr_name in self._indexes:
+            return next(iter(self._indexes[attr_name].get(attr_value, {}).values()), None)
+        return next((obj for obj in self.get_all() if getattr(obj, attr_name, None) == attr_value), None)
+
+    def filter_by(self, **criteria):
+        candidates = None
+        for name, value in criteria.items():
+            if name in self._unique and value is not None:
+                obj = self._unique[name].get(value)
+                matches = [obj] if obj is not None else []
+            elif name in self._indexes:
+                matches = self._indexes[name].get(value, {}).values()
+            else:
+                continue
+            if candidates is None or len(matches) < len(candidates):
+                candidates = matches
+        if candidates is None:
+            candidates = self.get_all()
+        return [obj for obj in candidates
+                if all(getattr(obj, name, None) == value for name, value in criteria.items())]
+
 
 class SQLAlchemyRepository(Repository):
-    """SQLAlchemy implementation of the repository for persistent storage."""
+    """
+    SQLAlchemy implementation of the repository for persistent storage.
+
+    Writes are only flushed: committing is the job of the caller's unit of
+    work (app.persistence.unit_of_work).
+    """
 
     def __init__(self, model):
         """
@@ -104,16 +472,31 @@ class SQLAlchemyRepository(Repository):
 
     def add(self, obj):
         """
-        Add a new object to the database.
+        Add a new object to the database (flushed, not committed).
 
         :param obj: The object to be added.
         :return: The added object.
         """
-        logger.debug(f"Adding item with ID {getattr(obj, 'id', None)} to repository")
+        logger.debug("Adding item with ID %s to repository", getattr(obj, 'id', None))
         db.session.add(obj)
-        db.session.commit()
+        db.session.flush()
         return obj
 
+    def add_all(self, objs):
+        """
+        Add several objects with a single flush.
+
+        The flush groups the INSERTs of each table into executemany batches;
+        the commit is left to the caller's unit of work.
+
+        :param objs: The objects to be added.
+        :return: The added objects.
+        """
+        logger.debug("Adding %d items to repository", len(objs))
+        db.session.add_all(objs)
+        db.session.flush()
+        return objs
+
     def get(self, obj_id):
         """
         Fetch an object by its ID.
@@ -121,17 +504,126 @@ class SQLAlchemyRepository(Repository):
         :param obj_id: The ID of the object to fetch.
         :return: The fetched object or None if not found.
         """
-        logger.debug(f"Fetching item with ID {obj_id}")
+        logger.debug("Fetching item with ID %s", obj_id)
         return self.model.query.get(obj_id)
 
-    def get_all(self):
+    def get_many(self, obj_ids):
+        """
+        Fetch several objects by ID with a single IN (...) query.
+
+        :param obj_ids: The IDs to fetch; duplicates are ignored.
+        :return: The objects found, in the order of obj_ids. Unknown IDs are skipped.
+        """
+        obj_ids = list(dict.fromkeys(obj_ids))
+        if not obj_ids:
+            return []
+        logger.debug("Fetching %d items by ID", len(obj_ids))
+        found = {str(obj.id): obj for obj in self.model.query.filter(self.model.id.in_(obj_ids))}
+        return [found[str(obj_id)] for obj_id in obj_ids if str(obj_id) in found]
+
+    def get_all(self, options=None, criteria=None):
         """
         Fetch all objects of this model.
 
+        :param options: Optional loader options (e.g. selectinload) applied to the query.
+        :param criteria: Optional list of filter expressions.
         :return: A list of all objects.
         """
         logger.debug("Fetching all items from repository")
-        return self.model.query.all()
+        query = self.model.query
+        if criteria:
+            query = query.filter(*criteria)
+        if options:
+            query = query.options(*options)
+        return query.all()
+
+    def _load_only(self, columns, keys):
+        """
+        Loader option selecting only some columns of the model.
+
+        Names that are not columns (relationships) are ignored; the sort keys
+        are always loaded since the cursor is built from them.
+        """
+        mapper = inspect(self.model)
+        names = {name for name in columns if name in mapper.column_attrs}
+        names.update(key.key for key in keys)
+        return load_only(*[getattr(self.model, name) for name in sorted(names)])
+
+    def iter_all(self, criteria=None, options=None, batch_size=1000, columns=None):
+        """
+        Iterate over every object of this model without loading them all at once.
+
+        Rows are fetched batch_size at a time (yield_per), in id order; the
+        session only holds weak references, so objects already consumed can
+        be garbage collected.
+
+        :param criteria: Optional list of filter expressions.
+        :param options: Optional loader options applied to each batch.
+        :param batch_size: Number of rows fetched per round trip.
+        :param columns: Optional attribute names to load, the other columns are deferred.
+        :return: An iterator of objects.
+        """
+        logger.debug("Iterating over all items, %s at a time", batch_size)
+        query = self.model.query
+        if criteria:
+            query = query.filter(*criteria)
+        if options:
+            query = query.options(*options)
+        if columns is not None:
+            query = query.options(self._load_only(columns, [self.model.id]))
+        return query.order_by(self.model.id).yield_per(batch_size)
+
+    def get_page(self, limit, cursor=None, criteria=None, options=None, order_by=None, descending=False,
+                 columns=None):
+        """
+        Fetch one page of objects using keyset pagination.
+
+        Rows are ordered by (order_by, id) and the cursor holds the key of the
+        last row returned, so every page is a range scan on an index no matter
+        how deep it is.
+
+        :param limit: Maximum number of objects to return.
+        :param cursor: Cursor returned with the previous page, or None for the first page.
+        :param criteria: Optional list of filter expressions.
+        :param options: Optional loader options applied to the query.
+        :param order_by: Optional column to sort on before the primary key.
+        :param descending: Sort in descending order if True.
+        :param columns: Optional attribute names to load, the other columns are deferred.
+        :return: A tuple (objects, next_cursor); next_cursor is None on the last page.
+        """
+        keys = [self.model.id] if order_by is None else [order_by, self.model.id]
+        query = self.model.query
+        if criteria:
+            query = query.filter(*criteria)
+        if options:
+            query = query.options(*options)
+        if columns is not None:
+            query = query.options(self._load_only(columns, keys))
+        if cursor:
+            values = decode_cursor(cursor, [key.type.python_type for key in keys])
+            key, value = (tuple_(*keys), tuple(values)) if len(keys) > 1 else (keys[0], values[0])
+            query = query.filter(key < value if descending else key > value)
+        query = query.order_by(*[key.desc() if descending else key.asc() for key in keys])
+
+        logger.debug("Fetching a page of %s items after cursor %s", limit, cursor)
+        items = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys])
+        return items, next_cursor
+
+    def fingerprint(self, criteria=None):
+        """
+        Cheap version stamp of a collection, for HTTP validators.
+
+        :param criteria: Optional list of filter expressions.
+        :return: A tuple (count, max(updated_at)).
+        """
+        query = db.session.query(func.count(self.model.id), func.max(self.model.updated_at))
+        if criteria:
+            query = query.filter(*criteria)
+        return tuple(query.one())
 
     def update(self, obj_id, data):
         """
@@ -145,10 +637,10 @@ class SQLAlchemyRepository(Repository):
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
-            logger.debug(f"Updated item with ID {obj_id}")
+            db.session.flush()
+            logger.debug("Updated item with ID %s", obj_id)
             return obj
-        logger.debug(f"Failed to update: no item with ID {obj_id}")
+        logger.debug("Failed to update: no item with ID %s", obj_id)
         return None
 
     def delete(self, obj_id):
@@ -161,10 +653,10 @@ class SQLAlchemyRepository(Repository):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
-            logger.debug(f"Deleted item with ID {obj_id}")
+            db.session.flush()
+            logger.debug("Deleted item with ID %s", obj_id)
             return True
-        logger.debug(f"Failed to delete: no item with ID {obj_id}")
+        logger.debug("Failed to delete: no item with ID %s", obj_id)
         return False
 
     def get_by_attribute(self, attr_name, attr_value):
@@ -175,6 +667,16 @@ class SQLAlchemyRepository(Repository):
         :param attr_value: The value of the attribute to filter by.
         :return: The first matching object or None if not found.
         """
-        logger.debug(f"Searching for item with {attr_name}={attr_value}")
+        logger.debug("Searching for item with %s=%s", attr_name, attr_value)
         # Use getattr to access the attribute of the model and filter by it
         return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
+
+    def filter_by(self, **criteria):
+        """
+        Fetch every object whose attributes equal the given values.
+
+        :param criteria: attribute=value pairs that must all match.
+        :return: A list of objects, in id order.
+        """
+        logger.debug("Filtering items by %s", criteria)
+        return self.model.query.filter_by(**criteria).order_by(self.model.id).all()
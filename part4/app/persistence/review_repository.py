@@ -1,17 +1,23 @@
 # app/persistence/review_repository.py
 
+import logging
 from app.models.review import Review
 from app import db
+from app.persistence.repository import SQLAlchemyRepository
+from sqlalchemy import exists, func
 from sqlalchemy.exc import IntegrityError
+from app.logs import sample
 
-class ReviewRepository:
+logger = logging.getLogger(__name__)
+
+class ReviewRepository(SQLAlchemyRepository):
     """
     Repository spécifique pour le modèle Review,
     sans relations (pas de foreign key).
     """
 
     def __init__(self):
-        self.model = Review
+        super().__init__(Review)
 
     def get_by_id(self, review_id):
         """Récupère un avis (Review) par son ID."""
@@ -33,10 +39,10 @@ class ReviewRepository:
                 review.user_id = user_id
 
             db.session.add(review)
-            db.session.commit()
+            db.session.flush()
             return review
         except IntegrityError:
-            db.session.rollback()
+            # Le rollback est fait par l'unit of work appelante
             raise ValueError("Erreur lors de la création du review (contrainte invalide).")
 
     def update(self, review_id, data):
@@ -51,7 +57,7 @@ class ReviewRepository:
             if hasattr(review, key) and key != "id":
                 setattr(review, key, value)
 
-        db.session.commit()
+        db.session.flush()
         return review
 
     def delete(self, review_id):
@@ -63,7 +69,7 @@ class ReviewRepository:
             raise ValueError("Review introuvable.")
 
         db.session.delete(review)
-        db.session.commit()
+        db.session.flush()
 
     def find_by_user_and_place(self, user_id, place_id):
         """
@@ -80,7 +86,30 @@ class ReviewRepository:
             user_id=user_id, 
             place_id=place_id
         ).first()
+
+    def exists_for_user_and_place(self, user_id, place_id):
+        """
+        Indique si l'utilisateur a déjà noté le lieu.
+
+        Une seule requête EXISTS, servie par la contrainte unique (user_id, place_id).
+        """
+        return db.session.query(exists().where(
+            self.model.user_id == user_id,
+            self.model.place_id == place_id
+        )).scalar()
         
+    def get_reviewed_place_ids(self, user_id, place_ids):
+        """
+        Parmi place_ids, les lieux que l'utilisateur a déjà notés (une seule requête IN).
+        """
+        if not place_ids:
+            return set()
+        rows = db.session.query(self.model.place_id).filter(
+            self.model.user_id == user_id,
+            self.model.place_id.in_(place_ids)
+        )
+        return {place_id for place_id, in rows}
+
     def get_all(self):
         """
         Récupère tous les avis.
@@ -90,12 +119,64 @@ class ReviewRepository:
         """
         return db.session.query(self.model).all()
 
-    def get_by_place_id(self, place_id):
+    def get_by_place_id(self, place_id, newest_first=False, limit=None):
         """
-        Récupère tous les avis pour un lieu donné directement via SQL
+        Récupère les avis d'un lieu directement via SQL.
+
+        La requête s'appuie sur l'index (place_id, created_at) : le coût ne
+        dépend que du nombre d'avis du lieu, pas de la taille de la table.
+
+        Args:
+            place_id: ID du lieu
+            newest_first: trie du plus récent au plus ancien si True
+            limit: nombre maximum d'avis à retourner (None = tous)
+
+        Returns:
+            list: Liste des avis du lieu
+        """
+        created_at = self.model.created_at.desc() if newest_first else self.model.created_at.asc()
+        query = db.session.query(self.model).filter(self.model.place_id == place_id).order_by(
+            created_at, self.model.id.desc() if newest_first else self.model.id.asc()
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        reviews = query.all()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Direct query for place_id=%s returned %d reviews", place_id, len(reviews))
+            for r in sample(reviews):
+                logger.debug("Found: Review ID=%s, place_id=%s, user_id=%s", r.id, r.place_id, r.user_id)
+        return reviews
+
+    def get_page_by_place_id(self, place_id, limit, cursor=None, newest_first=False, columns=None):
+        """
+        Récupère une page d'avis d'un lieu (pagination par curseur).
+
+        Le tri (created_at, id) suit l'index (place_id, created_at), donc les
+        pages profondes coûtent autant que la première.
+
+        Returns:
+            tuple: (liste des avis, curseur de la page suivante ou None)
+        """
+        return self.get_page(
+            limit,
+            cursor=cursor,
+            criteria=[self.model.place_id == place_id],
+            order_by=self.model.created_at,
+            descending=newest_first,
+            columns=columns
+        )
+
+    def count_ratings_by_place(self):
+        """
+        Compte les avis par lieu et par note en un seul GROUP BY.
+
+        Returns:
+            dict: {place_id: {note: nombre d'avis}}
         """
-        reviews = db.session.query(self.model).filter(self.model.place_id == place_id).all()
-        print(f"Direct query for place_id={place_id} returned {len(reviews)} reviews")
-        for r in reviews:
-            print(f"Found: Review ID={r.id}, place_id={r.place_id}, user_id={r.user_id}")
-        return reviews
\ No newline at end of file
+        counts = {}
+        rows = db.session.query(self.model.place_id, self.model.rating, func.count()).group_by(
+            self.model.place_id, self.model.rating
+        )
+        for place_id, rating, count in rows:
+            counts.setdefault(place_id, {})[rating] = count
+        return counts
@@ -0,0 +1,34 @@
+"""
+Unit of work: the transaction scope of the facade.
+
+Repositories only flush their changes. Every facade operation that writes
+runs inside unit_of_work(), which commits once when the outermost block
+exits and rolls back if it raises. Blocks can nest (a facade operation
+calling another one); only the outermost one commits, so one API request
+costs one commit.
+"""
+from contextlib import contextmanager
+from flask import g
+from app.extensions import db
+
+
+@contextmanager
+def unit_of_work():
+    """Run the block in a transaction committed (or rolled back) by the outermost unit of work."""
+    depth = g.get('unit_of_work_depth', 0)
+    g.unit_of_work_depth = depth + 1
+    try:
+        yield db.session
+        if depth == 0:
+            db.session.commit()
+    except BaseException:
+        if depth == 0:
+            db.session.rollback()
+        raise
+    finally:
+        g.unit_of_work_depth = depth
+
+
+def in_unit_of_work():
+    """True inside a unit_of_work() block."""
+    return g.get('unit_of_work_depth', 0) > 0
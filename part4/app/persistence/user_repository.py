@@ -1,12 +1,13 @@
 from app.models.user import User
 from app import db
+from app.persistence.repository import SQLAlchemyRepository
 from sqlalchemy.exc import IntegrityError
 
-class UserRepository:
+class UserRepository(SQLAlchemyRepository):
     """Repository spécifique pour le modèle User."""
 
     def __init__(self):
-        self.model = User
+        super().__init__(User)
 
     def get_by_id(self, user_id):
         """Récupère un utilisateur par son ID."""
@@ -17,7 +18,7 @@ class UserRepository:
         return db.session.query(self.model).filter_by(email=email).first()
 
     def create(self, first_name, last_name, email, password, is_admin=False):
-        """Crée un nouvel utilisateur."""
+        """Crée un nouvel utilisateur (le mot de passe en clair est hashé une seule fois par le modèle)."""
         try:
             user = self.model(
                 first_name=first_name,
@@ -26,12 +27,11 @@ class UserRepository:
                 password=password,
                 is_admin=is_admin,
             )
-            user.hash_password(password)  # Hashage du mot de passe
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
             return user
         except IntegrityError:
-            db.session.rollback()
+            # Le rollback est fait par l'unit of work appelante
             raise ValueError("Email déjà utilisé.")
 
     def update(self, user_id, data):
@@ -41,10 +41,12 @@ class UserRepository:
             raise ValueError("Utilisateur introuvable.")
         
         for key, value in data.items():
-            if hasattr(user, key) and key != "id":
+            if key == "password":
+                user.hash_password(value)
+            elif hasattr(user, key) and key != "id":
                 setattr(user, key, value)
         
-        db.session.commit()
+        db.session.flush()
         return user
 
     def delete(self, user_id):
@@ -54,7 +56,7 @@ class UserRepository:
             raise ValueError("Utilisateur introuvable.")
         
         db.session.delete(user)
-        db.session.commit()
+        db.session.flush()
 
     def get_all(self):
         """Get all users from the database"""
@@ -0,0 +1,131 @@
+"""
+Per-request SQL instrumentation.
+
+Engine events time every statement executed while a request is handled.
+For each request, the number of statements, the time spent in the database
+and the statements slower than QUERY_SLOW_THRESHOLD_MS are recorded on
+flask.g, then:
+- logged: one INFO line per request, one WARNING per slow statement, with
+  the figures also attached to the record (record.query_stats);
+- sent back as X-DB-Query-Count / X-DB-Time-Ms headers if
+  QUERY_STATS_HEADERS is set;
+- kept in a bounded history, served by GET /api/v1/_debug/queries when
+  QUERY_STATS_DEBUG_ENDPOINT is set (never in production).
+
+Statements run while a streamed response is generated are logged and kept
+in the history, but come too late for the headers.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+class RequestQueries:
+    """Statements executed while handling one request."""
+
+    __slots__ = ('count', 'seconds', 'slow')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.slow = []
+
+
+class _History:
+    def __init__(self, size):
+        self.entries = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._hbnb_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_hbnb_started', None)
+    if started is None or not has_request_context():
+        return
+    queries = g.get('queries')
+    if queries is None:
+        return
+    elapsed = time.perf_counter() - started
+    queries.count += 1
+    queries.seconds += elapsed
+    if elapsed * 1000 >= current_app.config.get('QUERY_SLOW_THRESHOLD_MS', 100):
+        slow = {'statement': statement, 'duration_ms': round(elapsed * 1000, 3)}
+        queries.slow.append(slow)
+        logger.warning("Slow query (%.1f ms) during %s %s: %s", elapsed * 1000, request.method, request.path,
+                       statement, extra={'query_stats': slow})
+
+
+class QueryStats:
+    """Flask extension recording the SQL statements of each request."""
+
+    def init_app(self, app):
+        """Hook the engines of the application (db.init_app must have been called)."""
+        if not app.config.get('QUERY_STATS_ENABLED', True):
+            return
+        app.extensions['hbnb_query_stats'] = _History(app.config.get('QUERY_STATS_HISTORY', 200))
+        with app.app_context():
+            engines = app.extensions['sqlalchemy'].engines.values()
+            for engine in engines:
+                if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        app.before_request(self._start)
+        app.after_request(self._add_headers)
+        app.teardown_request(self._finish)
+
+    @staticmethod
+    def _start():
+        g.queries = RequestQueries()
+
+    @staticmethod
+    def _add_headers(response):
+        queries = g.get('queries')
+        if queries is None:
+            return response
+        g.queries_status = response.status_code
+        if current_app.config.get('QUERY_STATS_HEADERS'):
+            response.headers['X-DB-Query-Count'] = str(queries.count)
+            response.headers['X-DB-Time-Ms'] = f'{queries.seconds * 1000:.2f}'
+        return response
+
+    @staticmethod
+    def _finish(exc):
+        # Après la fin du streaming éventuel : les chiffres sont complets
+        queries = g.pop('queries', None)
+        if queries is None:
+            return
+        summary = {
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'status': g.pop('queries_status', 500),
+            'queries': queries.count,
+            'db_time_ms': round(queries.seconds * 1000, 3),
+            'slow': queries.slow,
+        }
+        logger.info("%s %s status=%s queries=%d db_time_ms=%.2f slow=%d", summary['method'], summary['path'],
+                    summary['status'], queries.count, summary['db_time_ms'], len(queries.slow),
+                    extra={'query_stats': summary})
+        history = current_app.extensions['hbnb_query_stats']
+        with history.lock:
+            history.entries.append(summary)
+
+    def history(self):
+        """Summaries of the latest requests, newest first."""
+        history = current_app.extensions['hbnb_query_stats']
+        with history.lock:
+            return list(reversed(history.entries))
+
+    def clear(self):
+        """Forget the recorded requests."""
+        history = current_app.extensions['hbnb_query_stats']
+        with history.lock:
+            history.entries.clear()
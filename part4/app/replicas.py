@@ -0,0 +1,200 @@
+"""
+Read-replica routing of the database session.
+
+Queries made by facade methods decorated with @read_only go to one of the
+DB_REPLICA_BINDS (binds declared in SQLALCHEMY_BINDS): each request picks
+the next healthy replica in turn and keeps it. Everything else goes to the
+primary database:
+- writes (flushes, INSERT/UPDATE/DELETE statements);
+- reads outside a @read_only method (lookups before an update, login, ...);
+- every read of a request that has already written (read-your-writes).
+
+An unhealthy replica is skipped. Replicas are checked with SELECT 1 every
+DB_REPLICA_HEALTH_INTERVAL seconds, by the first query that needs one after
+that delay. A replica is also marked down as soon as one of its statements
+fails with an operational error. With no healthy replica, reads go to the
+primary.
+
+Replication lag is not tracked: a request that follows another request's
+write may still read the previous state from a replica (and the facade cache
+may keep that result for its TTL).
+"""
+import functools
+import inspect
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, exc
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+_read_only = ContextVar('hbnb_read_only', default=False)
+
+
+def read_only(method):
+    """Let the queries of a facade method go to a replica."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+        if inspect.isgenerator(result) or isinstance(result, Query):
+            return _read_only_iter(result)
+        return result
+    return wrapper
+
+
+def _read_only_iter(iterable):
+    # Les exports en streaming (Query en yield_per, générateurs) lisent pendant l'itération,
+    # une fois la méthode décorée terminée
+    iterator = None
+    try:
+        while True:
+            token = _read_only.set(True)
+            try:
+                if iterator is None:
+                    iterator = iter(iterable)
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _read_only.reset(token)
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def _has_written():
+    if has_request_context():
+        return request.environ.get('hbnb.wrote_primary', False)
+    return g.get('hbnb_wrote_primary', False)
+
+
+def _replica_engine(replicas):
+    # Un seul réplica par requête : l'ETag et la page qu'elle renvoie viennent du même état
+    if not has_request_context():
+        return replicas.pick()
+    environ = request.environ
+    if 'hbnb.replica' not in environ:
+        environ['hbnb.replica'] = replicas.pick()
+    return environ['hbnb.replica']
+
+
+def _mark_written():
+    # Sur la requête plutôt que sur g : g est partagé quand un contexte d'application englobe plusieurs requêtes
+    if has_request_context():
+        request.environ['hbnb.wrote_primary'] = True
+    else:
+        g.hbnb_wrote_primary = True
+
+
+class RoutingSession(Session):
+    """Session sending the reads of @read_only methods to a replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                _mark_written()
+            elif _read_only.get() and not _has_written():
+                replicas = current_app.extensions.get('hbnb_replicas')
+                engine = _replica_engine(replicas) if replicas is not None else None
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+class _Replica:
+    __slots__ = ('bind', 'engine', 'healthy', 'checked_at')
+
+    def __init__(self, bind, engine):
+        self.bind = bind
+        self.engine = engine
+        self.healthy = True
+        self.checked_at = float('-inf')
+
+
+class _Replicas:
+    def __init__(self, replicas, interval):
+        self.replicas = replicas
+        self.interval = interval
+        self.turn = itertools.count()
+        self.lock = threading.Lock()
+
+    def pick(self):
+        """Engine of the next healthy replica (None if there is none)."""
+        now = time.monotonic()
+        for replica in self.replicas:
+            if now - replica.checked_at >= self.interval:
+                self.check(replica, now)
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self.turn) % len(healthy)].engine
+
+    def check(self, replica, now):
+        # Un seul thread vérifie à la fois ; les autres gardent le dernier état connu
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            replica.checked_at = now
+            try:
+                # Connexion DBAPI brute : le test n'apparaît pas dans les statistiques SQL de la requête
+                connection = replica.engine.raw_connection()
+                try:
+                    cursor = connection.cursor()
+                    cursor.execute('SELECT 1')
+                    cursor.close()
+                finally:
+                    connection.close()
+            except Exception as e:
+                if replica.healthy:
+                    logger.warning("Replica %s is down: %s", replica.bind, e)
+                replica.healthy = False
+            else:
+                if not replica.healthy:
+                    logger.warning("Replica %s is back", replica.bind)
+                replica.healthy = True
+        finally:
+            self.lock.release()
+
+
+def _on_error(replica, context):
+    if context.is_disconnect or isinstance(context.sqlalchemy_exception, exc.OperationalError):
+        if replica.healthy:
+            logger.warning("Replica %s marked down after an error: %s", replica.bind, context.original_exception)
+        replica.healthy = False
+        replica.checked_at = time.monotonic()
+
+
+class ReplicaRouter:
+    """Flask extension declaring the replicas (db.init_app must have been called)."""
+
+    def init_app(self, app):
+        binds = app.config.get('DB_REPLICA_BINDS') or []
+        if not binds:
+            return
+        with app.app_context():
+            engines = app.extensions['sqlalchemy'].engines
+            missing = [bind for bind in binds if bind not in engines]
+            if missing:
+                raise RuntimeError(f"DB_REPLICA_BINDS lists {', '.join(missing)}, missing from SQLALCHEMY_BINDS")
+            replicas = [_Replica(bind, engines[bind]) for bind in binds]
+        for replica in replicas:
+            event.listen(replica.engine, 'handle_error', functools.partial(_on_error, replica))
+        app.extensions['hbnb_replicas'] = _Replicas(replicas, app.config.get('DB_REPLICA_HEALTH_INTERVAL', 5))
+
+    @staticmethod
+    def status():
+        """{bind: healthy} of the replicas of the current application."""
+        replicas = current_app.extensions.get('hbnb_replicas')
+        return {replica.bind: replica.healthy for replica in replicas.replicas} if replicas else {}
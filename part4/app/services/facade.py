@@ -1,14 +1,58 @@
 import logging
+from datetime import datetime
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from app.extensions import db, cache
+from app.geo import haversine_km
+from app.hashing import HashingPoolSaturated
+from app.logs import sample
+from app.replicas import read_only
 from app.persistence.user_repository import UserRepository
+from app.persistence.review_repository import ReviewRepository
+from app.persistence.place_repository import PlaceRepository
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.unit_of_work import unit_of_work
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+
+def _snapshot(obj, exclude=()):
+    """Column values of a clean, persistent object (None if it has pending changes), without the excluded ones"""
+    state = inspect(obj)
+    if not state.persistent or state.modified:
+        return None
+    return {attr.key: getattr(obj, attr.key) for attr in state.mapper.column_attrs if attr.key not in exclude}
+
+
+def _restore(model, data):
+    """Attach a cached snapshot to the current session without querying the database"""
+    mapper = model.__mapper__
+    # Déjà dans la session (chargé ou modifié par cette requête) : cet état est plus récent que le cache
+    identity = mapper.identity_key_from_primary_key([data[mapper.get_property_by_column(column).key]
+                                                     for column in mapper.primary_key])
+    existing = db.session.identity_map.get(identity)
+    if existing is not None:
+        return existing
+    obj = mapper.class_manager.new_instance()
+    for key, value in data.items():
+        set_committed_value(obj, key, value)
+    make_transient_to_detached(obj)
+    return db.session.merge(obj, load=False)
+
+
+def _bulk_id(value, field):
+    """Key of an id sent in a bulk item; raises ValueError unless it is a string or an integer"""
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        raise ValueError(f"{field} must be a string or an integer")
+    return str(value)
+
+
 class HBnBFacade:
     _instance = None
 
@@ -20,52 +64,109 @@ class HBnBFacade:
 
     def __init__(self):
         if not self._initialized:
-            # Use UserRepository for User and SQLAlchemyRepository for others
+            # Use the model-specific repositories where they exist, SQLAlchemyRepository for others
             self.user_repo = UserRepository()
-            self.place_repo = SQLAlchemyRepository(Place)
+            self.place_repo = PlaceRepository()
             self.amenity_repo = SQLAlchemyRepository(Amenity)
-            self.review_repo = SQLAlchemyRepository(Review)
+            self.review_repo = ReviewRepository()
             self._initialized = True
 
+    def _cached(self, entity, key, model, loader, exclude=()):
+        """
+        Read-through lookup: the cached snapshot if there is one, else loader() and cache its result.
+
+        Columns in exclude are not cached; they are loaded from the database
+        if a restored object reads them.
+        """
+        data = cache.get(entity, key)
+        if data is not None:
+            return _restore(model, data)
+        obj = loader()
+        if obj is not None:
+            data = _snapshot(obj, exclude)
+            if data is not None:
+                cache.set(entity, key, data)
+        return obj
+
     def create_user(self, user_data):
-        logger.debug(f"Creating user with data: {user_data}")
+        logger.debug("Creating user %s", user_data.get('email'))
         try:
-            user = self.user_repo.create(**user_data)
-            logger.debug(f"User created with ID: {user.id}")
+            with unit_of_work():
+                user = self.user_repo.create(**user_data)
+            logger.debug("User created with ID: %s", user.id)
             return user
         except ValueError as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             raise
 
     def get_user(self, user_id):
-        logger.debug(f"Looking for user with ID: {user_id}")
-        user = self.user_repo.get_by_id(user_id)
+        logger.debug("Looking for user with ID: %s", user_id)
+        # Le hash bcrypt ne va pas dans le cache (partagé, et sérialisé dans Redis)
+        user = self._cached('user', str(user_id), User, lambda: self.user_repo.get_by_id(user_id),
+                            exclude=('password',))
         if user:
-            logger.debug(f"Found user: {user.first_name} {user.last_name}")
+            logger.debug("Found user: %s %s", user.first_name, user.last_name)
         else:
             logger.debug("User not found")
         return user
 
     def get_user_by_email(self, email):
-        logger.debug(f"Looking for user with email: {email}")
+        logger.debug("Looking for user with email: %s", email)
         user = self.user_repo.get_by_email(email)
         if user:
-            logger.debug(f"Found user: {user.first_name} {user.last_name}")
+            logger.debug("Found user: %s %s", user.first_name, user.last_name)
         else:
             logger.debug("User not found")
         return user
 
+    def authenticate_user(self, email, password):
+        """
+        Check a user's credentials.
+
+        The password is re-hashed when the stored hash uses another cost than
+        BCRYPT_LOG_ROUNDS, so raising or lowering the cost migrates users as
+        they log in.
+
+        :return: The user if the credentials are valid, None otherwise.
+        """
+        user = self.user_repo.get_by_email(email)
+        if not user or not user.verify_password(password):
+            return None
+        if user.password_needs_rehash():
+            logger.debug("Re-hashing password of user %s", user.id)
+            try:
+                with unit_of_work():
+                    user.hash_password(password)
+            except HashingPoolSaturated:
+                # The credentials are valid: the re-hash waits for a quieter login
+                return user
+            cache.invalidate('user', str(user.id))
+        return user
+
+    @read_only
     def get_all_users(self):
         """Retrieve all users from the repository"""
         return self.user_repo.get_all()
 
+    @read_only
+    def get_users_page(self, limit, cursor=None, fields=None):
+        """Retrieve one page of users (only the columns in fields, if given) and the cursor of the next page"""
+        return self.user_repo.get_page(limit, cursor=cursor, columns=fields)
+
+    @read_only
+    def get_users_fingerprint(self):
+        """(count, last update) of the users collection"""
+        return self.user_repo.fingerprint()
+
     def update_user(self, user_id, user_data):
         """Update user with new data"""
         try:
-            user = self.user_repo.update(user_id, user_data)
+            with unit_of_work():
+                user = self.user_repo.update(user_id, user_data)
+            cache.invalidate('user', str(user_id))
             return user
         except ValueError as e:
-            logger.error(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
             raise
 
     def create_amenity(self, amenity_data):
@@ -73,16 +174,64 @@ class HBnBFacade:
         if len(amenity_data['name']) > 50:
             raise ValueError("Amenity name must be 50 characters or less")
         amenity = Amenity(**amenity_data)
-        self.amenity_repo.add(amenity)
+        with unit_of_work():
+            self.amenity_repo.add(amenity)
+        cache.invalidate_all('amenity')
         return amenity
 
+    def create_amenities(self, items):
+        """
+        Create many amenities in one transaction.
+
+        Every item is validated first; the valid ones are then inserted together.
+
+        :return: One (amenity, None) or (None, error message) pair per item.
+        """
+        results, amenities = [], []
+        for item in items:
+            try:
+                amenity = Amenity(name=item.get('name'))
+            except (ValueError, TypeError, AttributeError) as e:
+                results.append((None, str(e)))
+                continue
+            results.append((amenity, None))
+            amenities.append(amenity)
+        if amenities:
+            with unit_of_work():
+                self.amenity_repo.add_all(amenities)
+            cache.invalidate_all('amenity')
+        return results
+
     def get_amenity(self, amenity_id):
         """Get an amenity by ID"""
-        return self.amenity_repo.get(amenity_id)
+        return self._cached('amenity', str(amenity_id), Amenity, lambda: self.amenity_repo.get(amenity_id))
 
+    @read_only
     def get_all_amenities(self):
         """Get all amenities"""
-        return self.amenity_repo.get_all()
+        data = cache.get('amenity', 'all')
+        if data is not None:
+            return [_restore(Amenity, item) for item in data]
+        amenities = self.amenity_repo.get_all()
+        cache.set('amenity', 'all', [_snapshot(amenity) for amenity in amenities])
+        return amenities
+
+    @read_only
+    def get_amenities_page(self, limit, cursor=None):
+        """Get one page of amenities and the cursor of the next page"""
+        key = f'page:{limit}:{cursor}'
+        data = cache.get('amenity', key)
+        if data is not None:
+            items, next_cursor = data
+            return [_restore(Amenity, item) for item in items], next_cursor
+        amenities, next_cursor = self.amenity_repo.get_page(limit, cursor=cursor)
+        cache.set('amenity', key, ([_snapshot(amenity) for amenity in amenities], next_cursor))
+        return amenities, next_cursor
+
+    @read_only
+    def get_amenities_fingerprint(self):
+        """(count, last update) of the amenities collection"""
+        return self.amenity_repo.fingerprint()
 
     def update_amenity(self, amenity_id, amenity_data):
         """Update an amenity"""
@@ -90,12 +239,27 @@ class HBnBFacade:
             raise ValueError("Amenity name must be 50 characters or less")
         amenity = self.get_amenity(amenity_id)
         if amenity:
-            self.amenity_repo.update(amenity_id, amenity_data)
+            with unit_of_work():
+                self.amenity_repo.update(amenity_id, amenity_data)
+            cache.invalidate_all('amenity')
             return amenity
         return None
 
+    def _get_amenities(self, amenity_ids):
+        """
+        Resolve a list of amenity ids with one query.
+
+        :raises ValueError: Listing every unknown id at once.
+        """
+        amenities = self.amenity_repo.get_many(amenity_ids)
+        found = {str(amenity.id) for amenity in amenities}
+        missing = [str(amenity_id) for amenity_id in dict.fromkeys(amenity_ids) if str(amenity_id) not in found]
+        if missing:
+            raise ValueError(f"Amenities not found: {', '.join(missing)}")
+        return amenities
+
     def create_place(self, place_data):
-        logger.debug(f"Attempting to create place with data: {place_data}")
+        logger.debug("Attempting to create place with data: %s", place_data)
 
         # Extract owner_id and amenities from place_data
         owner_id = place_data.pop('owner_id', None)
@@ -108,35 +272,156 @@ class HBnBFacade:
         if not owner:
             raise ValueError(f"User with id {owner_id} not found")
 
+        # Resolved before the place exists so that an unknown id leaves nothing pending
+        amenities = self._get_amenities(amenities_ids)
+
         try:
-            # Create place with core data
-            place = Place(
-                **place_data,
-                owner=owner
-            )
-
-            # Add amenities after place creation
-            for amenity_id in amenities_ids:
-                amenity = self.amenity_repo.get(amenity_id)
-                if amenity:
+            # An invalid place is rolled back with the unit of work, even if the owner cascaded it into the session
+            with unit_of_work():
+                # Create place with core data
+                place = Place(
+                    **place_data,
+                    owner=owner
+                )
+
+                # Add amenities after place creation
+                for amenity in amenities:
                     place.add_amenity(amenity)
-                else:
-                    logger.warning(f"Amenity {amenity_id} not found")
 
-            self.place_repo.add(place)
-            logger.debug(f"Place added to repository with owner {owner.id}")
+                self.place_repo.add(place)
+            logger.debug("Place added to repository with owner %s", owner.id)
 
             return place
 
         except Exception as e:
-            logger.error(f"Error creating place: {str(e)}")
+            logger.error("Error creating place: %s", e)
             raise ValueError(str(e))
 
+    def create_places(self, items):
+        """
+        Create many places in one transaction.
+
+        Owners and amenities of the whole batch are resolved with one query
+        each, then every item is validated before anything is inserted.
+
+        :return: One (place, None) or (None, error message) pair per item.
+        """
+        # Ids checked item by item first: a malformed item must not fail the batch lookups below
+        checked = []
+        for item in items:
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Each item must be an object")
+                owner_id = item.get('owner_id')
+                owner_id = _bulk_id(owner_id, 'owner_id') if owner_id is not None else None
+                amenity_ids = item.get('amenities') or []
+                if not isinstance(amenity_ids, list):
+                    raise ValueError("amenities must be a list of ids")
+                amenity_ids = list(dict.fromkeys(_bulk_id(amenity_id, 'amenity id') for amenity_id in amenity_ids))
+            except ValueError as e:
+                checked.append((None, str(e)))
+            else:
+                checked.append(((item, owner_id, amenity_ids), None))
+        valid = [value for value, error in checked if error is None]
+        owners = {str(user.id): user for user in self.user_repo.get_many(
+            [owner_id for _, owner_id, _ in valid if owner_id])}
+        amenities = {str(amenity.id): amenity for amenity in self.amenity_repo.get_many(
+            [amenity_id for _, _, amenity_ids in valid for amenity_id in amenity_ids])}
+
+        results, places = [], []
+        for value, error in checked:
+            if error is not None:
+                results.append((None, error))
+                continue
+            item, owner_id, amenity_ids = value
+            try:
+                owner = owners.get(owner_id)
+                if not owner:
+                    raise ValueError(f"User with id {owner_id} not found")
+                missing = [amenity_id for amenity_id in amenity_ids if amenity_id not in amenities]
+                if missing:
+                    raise ValueError(f"Amenities not found: {', '.join(missing)}")
+                # owner_id only: linking the owner would cascade the place into the session before validation
+                place = Place(title=item.get('title'), description=item.get('description', ''),
+                              price=item.get('price'), latitude=item.get('latitude'),
+                              longitude=item.get('longitude'), owner_id=owner.id)
+            except ValueError as e:
+                results.append((None, str(e)))
+                continue
+            place.amenities = [amenities[amenity_id] for amenity_id in amenity_ids]
+            results.append((place, None))
+            places.append(place)
+        if places:
+            with unit_of_work():
+                self.place_repo.add_all(places)
+        return results
+
     def get_place(self, place_id):
-        return self.place_repo.get(place_id)
+        return self._cached('place', str(place_id), Place, lambda: self.place_repo.get(place_id))
 
+    @read_only
     def get_all_places(self):
-        return self.place_repo.get_all()
+        """Get all places with their amenity ids loaded in a single extra query"""
+        return self.place_repo.get_all(options=[
+            selectinload(Place.amenities).load_only(Amenity.id)
+        ])
+
+    @staticmethod
+    def _place_options(fields):
+        # Les ids des équipements ne sont chargés que si la réponse les contient
+        if fields is None or 'amenities' in fields:
+            return [selectinload(Place.amenities).load_only(Amenity.id)]
+        return []
+
+    @read_only
+    def get_places_page(self, limit, cursor=None, filters=None, fields=None):
+        """
+        Get one page of places (with amenity ids loaded) and the cursor of the next page.
+
+        filters may hold min_price, max_price, bbox and amenity_ids; they are
+        applied as SQL predicates by PlaceRepository.search_criteria. If fields
+        is given, only those attributes are loaded (amenities included).
+        """
+        criteria = self.place_repo.search_criteria(**filters) if filters else None
+        return self.place_repo.get_page(limit, cursor=cursor, criteria=criteria,
+                                        options=self._place_options(fields), columns=fields)
+
+    @read_only
+    def iter_places(self, filters=None, batch_size=1000, fields=None):
+        """Iterate over every place matching the filters, batch_size rows at a time (for streaming)"""
+        criteria = self.place_repo.search_criteria(**filters) if filters else None
+        return self.place_repo.iter_all(criteria=criteria, batch_size=batch_size,
+                                        options=self._place_options(fields), columns=fields)
+
+    @read_only
+    def get_places_fingerprint(self, filters=None):
+        """(count, last update) of the places matching the filters"""
+        criteria = self.place_repo.search_criteria(**filters) if filters else None
+        return self.place_repo.fingerprint(criteria)
+
+    @read_only
+    def get_places_nearby(self, latitude, longitude, radius_km, limit):
+        """
+        Get the places within radius_km of a point, nearest first.
+
+        The grid index narrows the candidates, the exact haversine distance is
+        computed only on them, and just the `limit` nearest places are loaded.
+
+        Returns:
+            list: (place, distance_km) tuples
+        """
+        candidates = self.place_repo.get_nearby_candidates(latitude, longitude, radius_km)
+        if not candidates:
+            return []
+        ids, latitudes, longitudes = zip(*candidates)
+        distances = haversine_km(latitude, longitude, latitudes, longitudes)
+        nearest = sorted(
+            ((distance, place_id) for place_id, distance in zip(ids, distances) if distance <= radius_km)
+        )[:limit]
+        places = {place.id: place for place in self.place_repo.get_all(options=[
+            selectinload(Place.amenities).load_only(Amenity.id)
+        ], criteria=[Place.id.in_([place_id for _, place_id in nearest])])}
+        return [(places[place_id], distance) for distance, place_id in nearest]
 
     def update_place(self, place_id, place_data):
         place = self.place_repo.get(place_id)
@@ -144,83 +429,69 @@ class HBnBFacade:
             return None
 
         try:
-            # Validate core attributes if they're being updated
-            if 'title' in place_data:
-                if len(place_data['title']) > 100:
-                    raise ValueError("Title must be 100 characters or less")
-                place.title = place_data['title']
-
-            if 'description' in place_data:
-                place.description = place_data['description']
-
-            if 'price' in place_data:
-                if place_data['price'] < 0:
-                    raise ValueError("Price must be a non-negative number")
-                place.price = float(place_data['price'])
-
-            if 'latitude' in place_data:
-                if not (-90 <= place_data['latitude'] <= 90):
-                    raise ValueError("Latitude must be between -90 and 90")
-                place.latitude = float(place_data['latitude'])
-
-            if 'longitude' in place_data:
-                if not (-180 <= place_data['longitude'] <= 180):
-                    raise ValueError("Longitude must be between -180 and 180")
-                place.longitude = float(place_data['longitude'])
-
-            if 'owner_id' in place_data:
-                owner = self.user_repo.get(place_data['owner_id'])
-                if owner:
-                    place.owner = owner
-                else:
-                    raise ValueError(f"User with id {place_data['owner_id']} not found")
-
-            if 'amenities' in place_data:
-                place.amenities = []  # Reset amenities
-                for amenity_id in place_data['amenities']:
-                    amenity = self.amenity_repo.get(amenity_id)
-                    if amenity:
-                        place.add_amenity(amenity)
-
-            # AJOUT CRUCIAL : Commit les changements dans la base de données
-            from app import db
-            db.session.commit()
-            
-            logger.debug(f"Successfully updated place {place_id}")
-            return place
-
+            with unit_of_work():
+                # Validate core attributes if they're being updated
+                if 'title' in place_data:
+                    if len(place_data['title']) > 100:
+                        raise ValueError("Title must be 100 characters or less")
+                    place.title = place_data['title']
+
+                if 'description' in place_data:
+                    place.description = place_data['description']
+
+                if 'price' in place_data:
+                    if place_data['price'] < 0:
+                        raise ValueError("Price must be a non-negative number")
+                    place.price = float(place_data['price'])
+
+                if 'latitude' in place_data:
+                    if not (-90 <= place_data['latitude'] <= 90):
+                        raise ValueError("Latitude must be between -90 and 90")
+                    place.latitude = float(place_data['latitude'])
+
+                if 'longitude' in place_data:
+                    if not (-180 <= place_data['longitude'] <= 180):
+                        raise ValueError("Longitude must be between -180 and 180")
+                    place.longitude = float(place_data['longitude'])
+
+                if 'owner_id' in place_data:
+                    owner = self.user_repo.get(place_data['owner_id'])
+                    if owner:
+                        place.owner = owner
+                    else:
+                        raise ValueError(f"User with id {place_data['owner_id']} not found")
+
+                if 'amenities' in place_data:
+                    place.amenities = self._get_amenities(place_data['amenities'])
+                    # Only the association table changes: bump updated_at for the HTTP validators
+                    place.updated_at = datetime.utcnow()
         except Exception as e:
-            # AJOUT : Rollback en cas d'erreur
-            from app import db
-            db.session.rollback()
-            
-            logger.error(f"Error updating place: {str(e)}")
+            logger.error("Error updating place: %s", e)
             raise ValueError(str(e))
 
+        cache.invalidate('place', str(place_id))
+        logger.debug("Successfully updated place %s", place_id)
+        return place
+
     def delete_place(self, place_id):
         """Delete a place by ID"""
         try:
             # Vérifier si la place existe
             place = self.place_repo.get(place_id)
             if not place:
-                logger.error(f"Place with ID {place_id} not found")
+                logger.error("Place with ID %s not found", place_id)
                 return False
             
             # Supprimer la place
-            self.place_repo.delete(place_id)
-            
-            # Commit les changements
-            from app import db
-            db.session.commit()
+            with unit_of_work():
+                self.place_repo.delete(place_id)
+            cache.invalidate('place', str(place_id))
             
-            logger.debug(f"Successfully deleted place {place_id}")
+            logger.debug("Successfully deleted place %s", place_id)
             return True
             
         except Exception as e:
-            from app import db
-            db.session.rollback()
-            
-            logger.error(f"Error deleting place: {str(e)}")
+            logger.error("Error deleting place: %s", e)
             raise ValueError(str(e))
 
     def create_review(self, review_data):
@@ -238,46 +509,182 @@ class HBnBFacade:
             place=place,
             user=user
         )
-        self.review_repo.add(review)
+        try:
+            # Written in the same transaction as the review
+            with unit_of_work():
+                place.update_rating_aggregates(added=review.rating)
+                self.review_repo.add(review)
+        except IntegrityError:
+            # Violation de la contrainte unique (user_id, place_id)
+            raise ValueError("You have already reviewed this place")
+        cache.invalidate('place', str(place.id))
         return review
 
+    def create_reviews(self, user_id, items):
+        """
+        Create many reviews by one user in one transaction.
+
+        Places and the user's existing reviews are looked up with one query
+        each; rating aggregates get one increment per place.
+
+        :return: One (review, None) or (None, error message) pair per item.
+        :raises ValueError: If the user does not exist.
+        """
+        user = self.user_repo.get(user_id)
+        if not user:
+            raise ValueError("User not found")
+        # Ids checked item by item first: a malformed item must not fail the batch lookups below
+        checked = []
+        for item in items:
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Each item must be an object")
+                place_id = item.get('place_id')
+                place_id = _bulk_id(place_id, 'place_id') if place_id is not None else None
+            except ValueError as e:
+                checked.append((None, str(e)))
+            else:
+                checked.append(((item, place_id), None))
+        valid = [value for value, error in checked if error is None]
+        places = {str(place.id): place for place in self.place_repo.get_many(
+            [place_id for _, place_id in valid if place_id])}
+        reviewed = {str(place_id) for place_id in
+                    self.review_repo.get_reviewed_place_ids(user.id, list(places))}
+
+        results, reviews, ratings = [], [], {}
+        for value, error in checked:
+            if error is not None:
+                results.append((None, error))
+                continue
+            item, place_id = value
+            try:
+                place = places.get(place_id)
+                if not place:
+                    raise ValueError("Place not found")
+                if place.owner_id == user.id:
+                    raise ValueError("You cannot review your own place")
+                if str(place.id) in reviewed:
+                    raise ValueError("You have already reviewed this place")
+                # Relations set after validation, otherwise an invalid review would be cascaded into the session
+                # (and not as place_id/user_id: the place=None set by __init__ would win at flush)
+                review = Review(text=item.get('text'), rating=item.get('rating'))
+            except ValueError as e:
+                results.append((None, str(e)))
+                continue
+            review.place, review.user = place, user
+            reviewed.add(str(place.id))
+            ratings.setdefault(place, []).append(review.rating)
+            results.append((review, None))
+            reviews.append(review)
+
+        if reviews:
+            try:
+                with unit_of_work():
+                    for place, place_ratings in ratings.items():
+                        place.add_ratings_to_aggregates(place_ratings)
+                    self.review_repo.add_all(reviews)
+            except IntegrityError:
+                # A concurrent request created one of the reviews in the meantime
+                raise ValueError("You have already reviewed one of these places")
+            for place in ratings:
+                cache.invalidate('place', str(place.id))
+        return results
+
     def get_review(self, review_id):
         return self.review_repo.get(review_id)
 
+    @read_only
     def get_all_reviews(self):
         return self.review_repo.get_all()
 
-    def get_reviews_by_place(self, place_id):
+    @read_only
+    def get_reviews_page(self, limit, cursor=None, fields=None):
+        return self.review_repo.get_page(limit, cursor=cursor, columns=fields)
+
+    @read_only
+    def iter_reviews(self, batch_size=1000, fields=None):
+        """Iterate over every review, batch_size rows at a time (for streaming)"""
+        return self.review_repo.iter_all(batch_size=batch_size, columns=fields)
+
+    @read_only
+    def get_reviews_fingerprint(self, place_id=None):
+        """(count, last update) of all reviews, or of one place's reviews"""
+        criteria = [Review.place_id == place_id] if place_id is not None else None
+        return self.review_repo.fingerprint(criteria)
+
+    @read_only
+    def get_reviews_by_place(self, place_id, newest_first=False, limit=None):
         place = self.get_place(place_id)
         if not place:
             raise ValueError("Place not found")
-        
-        # Filtrer manuellement puisque la méthode n'existe pas dans SQLAlchemyRepository
-        all_reviews = self.review_repo.get_all()
-        filtered_reviews = [review for review in all_reviews if str(review.place_id) == str(place_id)]
-        
-        # Ajouter des logs pour le débogage
-        print(f"Found {len(filtered_reviews)} reviews for place_id {place_id}")
-        for review in filtered_reviews:
-            print(f"Review {review.id}: text={review.text}, rating={review.rating}")
-        
-        return filtered_reviews
+
+        reviews = self.review_repo.get_by_place_id(place_id, newest_first=newest_first, limit=limit)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found %d reviews for place_id %s", len(reviews), place_id)
+            for review in sample(reviews):
+                logger.debug("Review %s: rating=%s", review.id, review.rating)
+
+        return reviews
+
+    @read_only
+    def get_place_reviews_page(self, place_id, limit, cursor=None, newest_first=False, fields=None):
+        """Get one page of a place's reviews and the cursor of the next page (None if the place does not exist)"""
+        place = self.get_place(place_id)
+        if not place:
+            return None
+        return self.review_repo.get_page_by_place_id(place_id, limit, cursor=cursor, newest_first=newest_first,
+                                                     columns=fields)
 
     def update_review(self, review_id, review_data):
         review = self.review_repo.get(review_id)
         if review:
             if 'rating' in review_data and not (1 <= review_data['rating'] <= 5):
                 raise ValueError("Rating must be between 1 and 5")
-            self.review_repo.update(review_id, review_data)
+            with unit_of_work():
+                if 'rating' in review_data and review_data['rating'] != review.rating:
+                    review.place.update_rating_aggregates(added=review_data['rating'], removed=review.rating)
+                self.review_repo.update(review_id, review_data)
+            cache.invalidate('place', str(review.place_id))
             return review
         return None
 
     def delete_review(self, review_id):
         review = self.review_repo.get(review_id)
         if review:
-            self.review_repo.delete(review_id)
+            place_id = review.place_id
+            with unit_of_work():
+                review.place.update_rating_aggregates(removed=review.rating)
+                self.review_repo.delete(review_id)
+            cache.invalidate('place', str(place_id))
             return True
         return False
+
+    def recompute_rating_aggregates(self):
+        """
+        Rebuild every place's rating aggregates from the reviews table.
+
+        Returns:
+            int: Number of places that have at least one review
+        """
+        with unit_of_work():
+            updated = self.place_repo.replace_rating_aggregates(self.review_repo.count_ratings_by_place())
+        cache.invalidate_all('place')
+        logger.debug("Recomputed rating aggregates for %d places", updated)
+        return updated
+
+    def backfill_grid_cells(self):
+        """
+        Set the grid cell of the places stored without one, or with a stale one.
+
+        Returns:
+            int: Number of places updated
+        """
+        with unit_of_work():
+            updated = self.place_repo.refresh_grid_cells()
+        cache.invalidate_all('place')
+        logger.debug("Backfilled the grid cell of %d places", updated)
+        return updated
         
     def has_already_reviewed(self, user_id, place_id):
         """
@@ -290,11 +697,7 @@ class HBnBFacade:
         Returns:
             bool: True if the user has already reviewed the place, False otherwise
         """
-        reviews = self.get_reviews_by_place(place_id)
-        for review in reviews:
-            if review.user.id == user_id:
-                return True
-        return False
+        return self.review_repo.exists_for_user_and_place(user_id, place_id)
 
     def is_valid_email(self, email):
         """Validate email format"""
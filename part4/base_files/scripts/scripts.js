@@ -72,9 +72,40 @@ function checkAuthentication() {
     fetchPlaces(token);
 }
 
-async function fetchPlaces(token) {
+// Current listing: the filter it was loaded with and the cursor of its next page
+const placesListing = {
+    params: new URLSearchParams(),
+    cursor: null,
+    loading: false,
+    generation: 0
+};
+
+async function fetchPlaces(token, maxPrice = 'all') {
+    // A new filter starts a new listing; pages of the previous one still in flight are ignored
+    const params = new URLSearchParams();
+    if (maxPrice !== 'all') {
+        params.set('max_price', maxPrice);
+    }
+    placesListing.params = params;
+    placesListing.cursor = null;
+    placesListing.loading = false;
+    placesListing.generation += 1;
+    window.allPlaces = [];
+    await fetchPlacesPage(token, false);
+}
+
+async function fetchPlacesPage(token, append = true) {
     const apiUrl = 'http://127.0.0.1:5000/api/v1/places';
-    
+    if (placesListing.loading) {
+        return;
+    }
+    const generation = placesListing.generation;
+    const params = new URLSearchParams(placesListing.params);
+    if (placesListing.cursor) {
+        params.set('cursor', placesListing.cursor);
+    }
+    placesListing.loading = true;
+
     try {
         const headers = {
             'Content-Type': 'application/json'
@@ -85,35 +116,73 @@ async function fetchPlaces(token) {
             headers['Authorization'] = `Bearer ${token}`;
         }
         
-        const response = await fetch(apiUrl, {
+        // The API returns one page at a time: only the next one is fetched, when the user asks for it
+        const pageUrl = params.toString() ? `${apiUrl}?${params}` : apiUrl;
+        const response = await fetch(pageUrl, {
             method: 'GET',
             headers: headers,
             mode: 'cors'
         });
-        
-        if (response.ok) {
-            const data = await response.json();
-            displayPlaces(data);
-            // Store places data for filtering
-            window.allPlaces = data;
-        } else {
+        if (generation !== placesListing.generation) {
+            return;
+        }
+
+        if (!response.ok) {
             console.error('Failed to fetch places:', response.statusText);
+            return;
+        }
+        const data = await response.json();
+        if (generation !== placesListing.generation) {
+            return;
         }
+        placesListing.cursor = response.headers.get('X-Next-Cursor');
+
+        displayPlaces(data, append);
+        // Keep the places fetched so far around for the other pages
+        window.allPlaces = (window.allPlaces || []).concat(data);
+        updateLoadMore();
     } catch (error) {
         console.error('Error fetching places:', error);
+    } finally {
+        if (generation === placesListing.generation) {
+            placesListing.loading = false;
+        }
     }
 }
 
-function displayPlaces(places) {
+function updateLoadMore() {
+    const loadMore = document.getElementById('load-more');
+    if (!loadMore) return;
+
+    loadMore.style.display = placesListing.cursor ? 'inline-block' : 'none';
+    if (!loadMore.dataset.ready) {
+        loadMore.dataset.ready = 'true';
+        loadMore.addEventListener('click', () => fetchPlacesPage(getCookie('token')));
+        // Load the next page when the button scrolls into view
+        if ('IntersectionObserver' in window) {
+            new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting) && placesListing.cursor) {
+                    fetchPlacesPage(getCookie('token'));
+                }
+            }).observe(loadMore);
+        }
+    }
+}
+
+function displayPlaces(places, append = false) {
     const placesList = document.getElementById('places-list');
     
     if (!placesList) return;
     
-    // Clear current content
-    placesList.innerHTML = '';
+    // Clear current content, unless this is a further page of the same listing
+    if (!append) {
+        placesList.innerHTML = '';
+    }
     
     if (places.length === 0) {
-        placesList.innerHTML = '<p>No places found.</p>';
+        if (!append) {
+            placesList.innerHTML = '<p>No places found.</p>';
+        }
         return;
     }
     
@@ -144,50 +213,9 @@ function displayPlaces(places) {
 function handlePriceFilter(event) {
     const maxPrice = typeof event === 'object' && event.target ? event.target.value : event;
     console.log('Filtrage par prix activé. Prix maximum sélectionné:', maxPrice);
-    
-    // Utiliser les classes correctes qui correspondent à votre HTML
-    const places = document.querySelectorAll('.place-card');
-    console.log('Nombre d\'annonces trouvées:', places.length);
-    
-    let visibleCount = 0;
-    let hiddenCount = 0;
-    
-    places.forEach(place => {
-        // Extraire le prix du texte de l'élément avec la classe 'price'
-        const priceElement = place.querySelector('.price');
-        if (!priceElement) {
-            console.log('Élément de prix non trouvé pour une place');
-            return;
-        }
-        
-        // Format attendu: "$120 per night" - extraire seulement le nombre
-        const priceText = priceElement.textContent;
-        const priceMatch = priceText.match(/\$(\d+)/);
-        
-        if (!priceMatch) {
-            console.log('Format de prix non reconnu:', priceText);
-            return;
-        }
-        
-        const price = parseInt(priceMatch[1], 10);
-        console.log(`Annonce: prix=${price}, limite=${maxPrice}`);
-        
-        if (maxPrice === 'all') {
-            place.style.display = 'flex'; // ou 'block' selon votre CSS
-            visibleCount++;
-        } else {
-            const priceLimit = parseInt(maxPrice, 10);
-            if (price <= priceLimit) {
-                place.style.display = 'flex'; // ou 'block' selon votre CSS
-                visibleCount++;
-            } else {
-                place.style.display = 'none';
-                hiddenCount++;
-            }
-        }
-    });
-    
-    console.log(`Résultat du filtrage: ${visibleCount} annonces visibles, ${hiddenCount} annonces masquées`);
+
+    // Le filtrage est fait par l'API (paramètre max_price), on recharge simplement la liste
+    fetchPlaces(getCookie('token'), maxPrice);
 }
 
 async function loginUser(email, password) {
@@ -270,68 +298,3 @@ async function loginUser(email, password) {
         throw error;
     }
 }
-
-// Fonction séparée pour appliquer le filtre de prix
-function applyPriceFilter(maxPrice) {
-    console.log('Applying price filter with max price:', maxPrice);
-    const places = document.querySelectorAll('.place');
-    console.log('Found places:', places.length);
-    
-    let visibleCount = 0;
-    let hiddenCount = 0;
-    
-    places.forEach(place => {
-        const priceStr = place.getAttribute('data-price');
-        const price = parseInt(priceStr, 10);
-        console.log(`Place price=${price}, limit=${maxPrice}`);
-        
-        if (maxPrice === 'all') {
-            place.style.display = 'block';
-            visibleCount++;
-        } else {
-            const priceLimit = parseInt(maxPrice, 10);
-            if (price <= priceLimit) {
-                place.style.display = 'block';
-                visibleCount++;
-            } else {
-                place.style.display = 'none';
-                hiddenCount++;
-            }
-        }
-    });
-    
-    console.log(`Filter result: ${visibleCount} visible, ${hiddenCount} hidden`);
-}
-
-// Fonction simple de filtrage par prix - Corrigée
-function filterPlacesByPrice(maxPrice) {
-    console.log('Filtering places with max price:', maxPrice);
-    const places = document.querySelectorAll('.place');
-    console.log('Number of places found:', places.length);
-    
-    let visibleCount = 0;
-    let hiddenCount = 0;
-    
-    places.forEach(place => {
-        const priceStr = place.getAttribute('data-price');
-        console.log(`Place price attribute: ${priceStr}`);
-        const price = parseInt(priceStr, 10);
-        
-        if (maxPrice === 'all') {
-            place.style.display = 'block';
-            visibleCount++;
-        } else {
-            const priceLimit = parseInt(maxPrice, 10);
-            console.log(`Comparing price ${price} with limit ${priceLimit}`);
-            if (price <= priceLimit) {
-                place.style.display = 'block';
-                visibleCount++;
-            } else {
-                place.style.display = 'none';
-                hiddenCount++;
-            }
-        }
-    });
-    
-    console.log(`Filter results: ${visibleCount} places visible, ${hiddenCount} places hidden`);
-}
\ No newline at end of file
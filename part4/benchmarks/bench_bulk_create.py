@@ -0,0 +1,61 @@
+"""
+10k places: one POST /places per place vs. a single POST /places/bulk.
+
+Runs on a SQLite file rather than in memory, so that every commit pays for
+its fsync as it would in production.
+
+    python -m benchmarks.bench_bulk_create
+"""
+import os
+import tempfile
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.place import Place
+from app.models.user import User
+from benchmarks.common import BenchmarkConfig, make_app, timeit
+
+PLACES = 10_000
+
+
+def place(i):
+    return {'title': f"Place {i}", 'description': "", 'price': 100.0,
+            'latitude': 48.85, 'longitude': 2.35, 'owner_id': "1", 'amenities': []}
+
+
+def run(label, post_all):
+    directory = tempfile.mkdtemp()
+
+    class FileConfig(BenchmarkConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+
+    app = make_app(FileConfig)
+    client = app.test_client()
+    with app.app_context():
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com", password="s3cret!")
+        db.session.add(owner)
+        db.session.commit()
+        headers = {'Authorization': f'Bearer {create_access_token(identity=str(owner.id))}'}
+        timeit(label, lambda: post_all(client, headers), repeat=1)
+        assert Place.query.count() == PLACES
+        db.session.remove()
+        db.engine.dispose()
+
+
+def single_posts(client, headers):
+    for i in range(PLACES):
+        assert client.post('/api/v1/places/', json=place(i), headers=headers).status_code == 201
+
+
+def bulk_post(client, headers):
+    response = client.post('/api/v1/places/bulk', json=[place(i) for i in range(PLACES)], headers=headers)
+    assert response.status_code == 201
+
+
+def main():
+    print(f"--- {PLACES} places, SQLite file")
+    run(f"{PLACES} x POST /places", single_posts)
+    run("1 x POST /places/bulk", bulk_post)
+
+
+if __name__ == '__main__':
+    main()
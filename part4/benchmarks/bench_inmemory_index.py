@@ -0,0 +1,51 @@
+"""
+Attribute lookups on a 100k-object InMemoryRepository: linear scan vs.
+declared secondary indexes (unique email, non-unique place_id).
+
+    python -m benchmarks.bench_inmemory_index
+"""
+from app.persistence.repository import InMemoryRepository
+from benchmarks.common import timeit
+
+OBJECTS = 100_000
+PLACES = 1_000
+LOOKUPS = 1_000
+
+
+class Item:
+    def __init__(self, id, email, place_id):
+        self.id = id
+        self.email = email
+        self.place_id = place_id
+
+
+def fill(repo):
+    repo.add_all([Item(i, f"user{i}@example.com", i % PLACES) for i in range(OBJECTS)])
+    return repo
+
+
+def lookups(repo):
+    step = OBJECTS // LOOKUPS
+    for i in range(0, OBJECTS, step):
+        assert repo.get_by_attribute('email', f"user{i}@example.com").id == i
+
+
+def filters(repo):
+    for place_id in range(0, PLACES, PLACES // 100):
+        assert len(repo.filter_by(place_id=place_id)) == OBJECTS // PLACES
+
+
+def main():
+    print(f"--- {OBJECTS} objects, {LOOKUPS} email lookups, 100 place_id filters")
+    scan = timeit("add_all, no index", lambda: fill(InMemoryRepository()), repeat=1)
+    indexed = timeit("add_all, indexed",
+                     lambda: fill(InMemoryRepository(unique_indexes=('email',), indexes=('place_id',))),
+                     repeat=1)
+    timeit("get_by_attribute, scan", lambda: lookups(scan), repeat=1)
+    timeit("get_by_attribute, unique index", lambda: lookups(indexed))
+    timeit("filter_by, scan", lambda: filters(scan), repeat=1)
+    timeit("filter_by, index", lambda: filters(indexed))
+
+
+if __name__ == '__main__':
+    main()
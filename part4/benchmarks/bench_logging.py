@@ -0,0 +1,113 @@
+"""
+Throughput of logged code paths under each logging setup.
+
+"DEBUG, synchronous, all rows" is what the facade's logging.basicConfig(DEBUG)
+gave: every debug message, including one per review row, formatted and
+written by the request thread. The other rows use the LOG_* settings. Times
+include draining the log queue; the log output goes to a temporary file.
+
+    python -m benchmarks.bench_logging
+"""
+import logging
+import os
+import tempfile
+import time
+from contextlib import redirect_stderr
+from sqlalchemy import insert
+from app import db
+from app.extensions import logs
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.facade import HBnBFacade
+from benchmarks.common import BenchmarkConfig, make_app
+
+REVIEWS = 500
+FACADE_CALLS = 200
+REQUESTS = 2000
+MESSAGES = 1_000_000
+
+
+class DebugSyncConfig(BenchmarkConfig):
+    LOG_LEVEL = 'DEBUG'
+    LOG_ASYNC = False
+    LOG_ROW_SAMPLE_EVERY = 1
+
+
+class DebugAsyncConfig(BenchmarkConfig):
+    LOG_LEVEL = 'DEBUG'
+
+
+class InfoAsyncConfig(BenchmarkConfig):
+    LOG_LEVEL = 'INFO'
+
+
+def seed():
+    db.session.execute(insert(User), [
+        {'first_name': "John", 'last_name': "Doe", 'email': f"user{i}@example.com", 'password': "x"}
+        for i in range(REVIEWS)
+    ])
+    db.session.execute(insert(Place), [
+        {'title': "Flat", 'description': "", 'price': 1.0, 'latitude': 0, 'longitude': 0, 'owner_id': 1}
+    ])
+    db.session.execute(insert(Review), [
+        {'text': f"Review {i}", 'rating': 1 + i % 5, 'user_id': 1 + i, 'place_id': 1} for i in range(REVIEWS)
+    ])
+    db.session.commit()
+    return db.session.get(Place, 1).id, db.session.get(User, 1).id
+
+
+def run(label, config_class):
+    with tempfile.TemporaryFile('w') as output:
+        with redirect_stderr(output):
+            app = make_app(config_class)
+        client = app.test_client()
+        facade = HBnBFacade()
+        with app.app_context():
+            place_id, user_id = seed()
+            start = time.perf_counter()
+            for _ in range(FACADE_CALLS):
+                facade.get_reviews_by_place(place_id)
+            for _ in range(REQUESTS):
+                client.get(f'/api/v1/users/{user_id}')
+            dropped = logs.dropped()
+            logs.stop()
+            elapsed = time.perf_counter() - start
+            output.flush()
+            written = os.fstat(output.fileno()).st_size
+    operations = FACADE_CALLS + REQUESTS
+    print(f"{label:<32} {operations / elapsed:10.0f} ops/s   {written / 2 ** 20:7.1f} MiB logged"
+          f"   {dropped} dropped")
+
+
+def micro():
+    logger = logging.getLogger('app.bench')
+    logger.setLevel(logging.INFO)
+    # Comme facade.create_place, qui journalise le payload reçu
+    place_data = {'title': "Flat", 'description': "Nice flat", 'price': 80.0, 'latitude': 48.85,
+                  'longitude': 2.35, 'owner_id': 'c3f5a0e2-4ad1-4c8e-9f4e-0d6b4e3b2a11', 'amenities': []}
+
+    def eager():
+        for _ in range(MESSAGES):
+            logger.debug(f"Attempting to create place with data: {place_data}")
+
+    def lazy():
+        for _ in range(MESSAGES):
+            logger.debug("Attempting to create place with data: %s", place_data)
+
+    for label, func in (("disabled debug, f-string", eager), ("disabled debug, %-style", lazy)):
+        start = time.perf_counter()
+        func()
+        print(f"{label:<32} {(time.perf_counter() - start) / MESSAGES * 1e9:10.0f} ns/call")
+
+
+def main():
+    print(f"--- {FACADE_CALLS} get_reviews_by_place ({REVIEWS} reviews) + {REQUESTS} GET /users/<id>")
+    run("DEBUG, synchronous, all rows", DebugSyncConfig)
+    run("DEBUG, async, sampled rows", DebugAsyncConfig)
+    run("INFO, async (default)", InfoAsyncConfig)
+    micro()
+
+
+if __name__ == '__main__':
+    main()
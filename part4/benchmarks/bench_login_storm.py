@@ -0,0 +1,81 @@
+"""
+Latency of a non-auth endpoint (GET /amenities/) during a login storm.
+
+A gunicorn-like server is simulated with a fixed pool of request workers fed
+by one queue. Without the hashing pool, logins hold every worker for the
+whole bcrypt check and amenity requests queue behind them. With the pool,
+logins beyond its queue are rejected with a 503 at once and the workers stay
+available.
+
+    python -m benchmarks.bench_login_storm
+"""
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app import db
+from app.models.amenity import Amenity
+from app.models.user import User
+from benchmarks.common import BenchmarkConfig, make_app
+
+REQUEST_WORKERS = 8
+LOGINS = 200
+PROBES = 50
+
+
+class StormConfig(BenchmarkConfig):
+    BCRYPT_LOG_ROUNDS = 10
+    HASHING_WORKERS = 2
+    HASHING_QUEUE_SIZE = 4
+
+
+class InlineConfig(StormConfig):
+    HASHING_WORKERS = 0
+
+
+def run(config_class, storm):
+    app = make_app(config_class)
+    client = app.test_client()
+    with app.app_context():
+        db.session.add(User(first_name="John", last_name="Doe", email="john.doe@example.com", password="s3cret!"))
+        db.session.add_all([Amenity(name=f"Amenity {i}") for i in range(20)])
+        db.session.commit()
+
+    def login():
+        return client.post('/api/v1/auth/login', json={'email': "john.doe@example.com", 'password': "s3cret!"}).status_code
+
+    def probe(enqueued):
+        assert client.get('/api/v1/amenities/').status_code == 200
+        # Queueing time in the server + service time, as a client would see it
+        return time.perf_counter() - enqueued
+
+    statuses, latencies = [], []
+    with ThreadPoolExecutor(max_workers=REQUEST_WORKERS) as server:
+        logins, probes = [], []
+        for i in range(max(LOGINS if storm else 0, PROBES)):
+            if storm and i < LOGINS:
+                logins.append(server.submit(login))
+            if i < PROBES and i % 4 == 0:
+                probes.append(server.submit(probe, time.perf_counter()))
+        while len(probes) < PROBES:
+            probes.append(server.submit(probe, time.perf_counter()))
+        statuses = [future.result() for future in logins]
+        latencies = sorted(future.result() for future in probes)
+    return statuses, latencies
+
+
+def report(label, statuses, latencies):
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    accepted = statuses.count(200)
+    print(f"{label:<32} probe p50 {statistics.median(latencies) * 1000:9.1f} ms   p95 {p95 * 1000:9.1f} ms"
+          f"   logins ok {accepted:4}/{len(statuses):<4} 503 {statuses.count(503):4}")
+
+
+def main():
+    print(f"--- {REQUEST_WORKERS} request workers, {LOGINS} logins, {PROBES} GET /amenities/")
+    report("no storm", *run(StormConfig, storm=False))
+    report("storm, bcrypt inline", *run(InlineConfig, storm=True))
+    report("storm, hashing pool", *run(StormConfig, storm=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Cost of the request metrics: the three hooks alone, then end-to-end
+requests with METRICS_ENABLED on and off.
+
+    python -m benchmarks.bench_metrics_overhead
+"""
+import logging
+import time
+from flask import Response
+from benchmarks.common import BenchmarkConfig, make_app
+
+HOOK_CALLS = 100_000
+REQUESTS = 5_000
+
+
+class MetricsOffConfig(BenchmarkConfig):
+    METRICS_ENABLED = False
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def hooks(app):
+    response = Response()
+    registry = app.extensions['hbnb_metrics']
+    with app.test_request_context('/api/v1/places/'):
+        for _ in range(HOOK_CALLS):
+            registry.start()
+            registry.status(response)
+            registry.finish(None)
+
+
+def requests(client):
+    # Route inconnue : la requête la moins chère qui passe par tous les hooks
+    for _ in range(REQUESTS):
+        client.get('/api/v1/places/unknown/route')
+
+
+def main():
+    # Les logs par requête (query_stats) fausseraient la mesure
+    logging.disable(logging.INFO)
+    app = make_app()
+    per_call = best_of(lambda: hooks(app), 5) / HOOK_CALLS
+    print(f"{'metrics hooks alone':<40} {per_call * 1e6:10.2f} us/request")
+
+    on = make_app().test_client()
+    off = make_app(MetricsOffConfig).test_client()
+    # Alterner les deux variantes pour que le bruit de la machine les touche autant
+    without = with_metrics = float('inf')
+    for _ in range(5):
+        without = min(without, best_of(lambda: requests(off), 1) / REQUESTS)
+        with_metrics = min(with_metrics, best_of(lambda: requests(on), 1) / REQUESTS)
+    print(f"{'request, metrics off':<40} {without * 1e6:10.2f} us/request")
+    print(f"{'request, metrics on':<40} {with_metrics * 1e6:10.2f} us/request")
+    print(f"{'overhead':<40} {(with_metrics - without) * 1e6:10.2f} us/request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Radius search: grid-cell index vs. a naive full scan, on 100k places.
+
+    python -m benchmarks.bench_nearby
+"""
+import random
+from sqlalchemy import insert
+from app import db
+from app.geo import grid_cell, haversine_km
+from app.models.place import Place
+from app.services.facade import HBnBFacade
+from benchmarks.common import make_app, timeit
+
+PLACES = 100_000
+
+
+def seed():
+    rng = random.Random(0)
+    rows = []
+    for i in range(PLACES):
+        latitude, longitude = rng.uniform(-60, 70), rng.uniform(-180, 180)
+        rows.append({
+            'title': f"Place {i}", 'description': "", 'price': 100.0,
+            'latitude': latitude, 'longitude': longitude,
+            'grid_cell': grid_cell(latitude, longitude), 'owner_id': 1
+        })
+    db.session.execute(insert(Place), rows)
+    db.session.commit()
+
+
+def naive(latitude, longitude, radius_km):
+    """What a client-side or unindexed search would do: scan every place."""
+    rows = db.session.query(Place.id, Place.latitude, Place.longitude).all()
+    ids, latitudes, longitudes = zip(*rows)
+    distances = haversine_km(latitude, longitude, latitudes, longitudes)
+    return sorted(place_id for place_id, d in zip(ids, distances) if d <= radius_km)
+
+
+def main():
+    app = make_app()
+    with app.app_context():
+        seed()
+        facade = HBnBFacade()
+        for radius_km in (5, 50, 250):
+            print(f"--- radius {radius_km} km around Paris")
+            expected = timeit("naive full scan", lambda: naive(48.8566, 2.3522, radius_km))
+            found = timeit("grid index + haversine", lambda: facade.get_places_nearby(48.8566, 2.3522, radius_km, limit=PLACES))
+            assert sorted(place.id for place, _ in found) == expected
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Serialising a 10k-place payload: hand-built dicts + json.dumps vs. the
+precompiled serialiser (stdlib json and orjson).
+
+    python -m benchmarks.bench_serializers
+"""
+import json
+from unittest import mock
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+from app import db
+from app.api.v1 import serializers
+from app.api.v1.serializers import place_serializer
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity_association
+from benchmarks.common import BenchmarkConfig, make_app, timeit
+
+PLACES = 10_000
+
+
+class SerializerConfig(BenchmarkConfig):
+    PAGE_SIZE_MAX = PLACES
+
+
+def seed():
+    db.session.execute(insert(Amenity), [{'name': f"Amenity {i}"} for i in range(10)])
+    db.session.execute(insert(Place), [
+        {'title': f"Place {i}", 'description': "A nice place", 'price': 100.0 + i, 'latitude': 48.85,
+         'longitude': 2.35, 'owner_id': 1, 'review_count': i % 7, 'rating_sum': 4 * (i % 7), 'rating_4': i % 7}
+        for i in range(PLACES)
+    ])
+    db.session.execute(insert(place_amenity_association), [
+        {'place_id': i + 1, 'amenity_id': 1 + (i + k) % 10} for i in range(PLACES) for k in range(3)
+    ])
+    db.session.commit()
+
+
+def hand_built(places):
+    # What places.py did before: one dict per place, then the default encoder
+    return json.dumps([{
+        'id': place.id, 'title': place.title, 'description': place.description, 'price': place.price,
+        'latitude': place.latitude, 'longitude': place.longitude, 'owner_id': place.owner_id,
+        'amenities': [amenity.id for amenity in place.amenities],
+        'review_count': place.review_count or 0, 'average_rating': place.average_rating,
+        'rating_histogram': place.rating_histogram
+    } for place in places]).encode()
+
+
+def main():
+    app = make_app(SerializerConfig)
+    client = app.test_client()
+    with app.app_context():
+        seed()
+        places = Place.query.options(selectinload(Place.amenities)).all()
+        print(f"--- {PLACES} places, orjson {'installed' if serializers.orjson else 'missing'}")
+        expected = json.loads(timeit("hand-built dicts + json.dumps", lambda: hand_built(places)))
+        with mock.patch.object(serializers, 'orjson', None):
+            stdlib = timeit("serializer, stdlib json", lambda: place_serializer.many_to_json(places))
+        fast = timeit("serializer, fast backend", lambda: place_serializer.many_to_json(places))
+        assert json.loads(stdlib) == json.loads(fast) == expected
+        db.session.remove()
+
+    timeit(f"GET /places?limit={PLACES} end to end",
+           lambda: client.get(f'/api/v1/places/?limit={PLACES}').get_data(), repeat=3)
+
+
+if __name__ == '__main__':
+    main()
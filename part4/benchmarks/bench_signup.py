@@ -0,0 +1,51 @@
+"""
+Signup throughput: one bcrypt hash per user vs. the three the old code path did.
+
+    python -m benchmarks.bench_signup
+"""
+from flask_jwt_extended import create_access_token
+from app import bcrypt, db
+from app.models.user import User
+from benchmarks.common import BenchmarkConfig, make_app, timeit
+
+SIGNUPS = 10
+
+
+class SignupConfig(BenchmarkConfig):
+    # Production cost, the benchmark is about its CPU time
+    BCRYPT_LOG_ROUNDS = 12
+
+
+def main():
+    app = make_app(SignupConfig)
+    client = app.test_client()
+    with app.app_context():
+        admin = User(first_name="Admin", last_name="User", email="admin@hbnb.io", password="admin123", is_admin=True)
+        db.session.add(admin)
+        db.session.commit()
+        token = create_access_token(identity=str(admin.id), additional_claims={'is_admin': True})
+    headers = {'Authorization': f'Bearer {token}'}
+    counter = iter(range(10 ** 9))
+
+    def signup_batch():
+        for _ in range(SIGNUPS):
+            response = client.post('/api/v1/users/', headers=headers, json={
+                'first_name': "John", 'last_name': "Doe",
+                'email': f"user{next(counter)}@example.com", 'password': "s3cret!"
+            })
+            assert response.status_code == 201
+
+    def triple_hash():
+        # What a signup used to cost: resource, model and repository each hashed
+        for _ in range(SIGNUPS):
+            for _ in range(3):
+                bcrypt.generate_password_hash("s3cret!")
+
+    print(f"--- {SIGNUPS} signups, BCRYPT_LOG_ROUNDS={SignupConfig.BCRYPT_LOG_ROUNDS}")
+    with app.app_context():
+        timeit("POST /users (one hash)", signup_batch, repeat=3)
+        timeit("3 hashes per signup (before)", triple_hash, repeat=3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Concurrent reads and writes on a SQLite file: SQLite's defaults (rollback
+journal, synchronous=FULL) vs. SQLITE_PRAGMAS (WAL, synchronous=NORMAL, ...).
+
+READERS threads list places through the API while one thread inserts places,
+one commit per place, for DURATION seconds.
+
+    python -m benchmarks.bench_sqlite_wal
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+from sqlalchemy import exc, insert
+from app import db
+from app.models.place import Place
+from app.models.user import User
+from benchmarks.common import BenchmarkConfig, make_app
+
+READERS = 4
+DURATION = 5.0
+PLACES = 1000
+
+
+def run(label, pragmas):
+    directory = tempfile.mkdtemp()
+
+    class FileConfig(BenchmarkConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        SQLITE_PRAGMAS = pragmas
+        # Les avertissements de requêtes lentes, attendus ici, ne feraient que du bruit
+        QUERY_STATS_ENABLED = False
+
+    app = make_app(FileConfig)
+    with app.app_context():
+        db.session.execute(insert(User), [{'first_name': "John", 'last_name': "Doe",
+                                           'email': "john.doe@example.com", 'password': "x"}])
+        owner_id = db.session.query(User.id).scalar()
+        db.session.execute(insert(Place), [
+            {'title': f"Place {i}", 'description': "", 'price': 1.0, 'latitude': 0, 'longitude': 0,
+             'owner_id': owner_id} for i in range(PLACES)
+        ])
+        db.session.commit()
+        db.session.remove()
+
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + DURATION
+
+    def count(name):
+        with lock:
+            counts[name] += 1
+
+    def reader():
+        client = app.test_client()
+        while time.perf_counter() < deadline:
+            response = client.get('/api/v1/places/?limit=20')
+            count('reads' if response.status_code == 200 else 'locked')
+
+    def writer():
+        with app.app_context():
+            i = 0
+            while time.perf_counter() < deadline:
+                try:
+                    db.session.execute(insert(Place), [{'title': f"New {i}", 'description': "", 'price': 1.0,
+                                                        'latitude': 0, 'longitude': 0, 'owner_id': owner_id}])
+                    db.session.commit()
+                    count('writes')
+                except exc.OperationalError:
+                    db.session.rollback()
+                    count('locked')
+                i += 1
+            db.session.remove()
+
+    threads = [threading.Thread(target=reader) for _ in range(READERS)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with app.app_context():
+        db.engine.dispose()
+    shutil.rmtree(directory)
+    print(f"{label:<34} {counts['reads'] / DURATION:8.0f} reads/s {counts['writes'] / DURATION:8.0f} writes/s"
+          f" {counts['locked']:6d} locked")
+
+
+def main():
+    print(f"--- {READERS} reader threads + 1 writer thread, {DURATION:.0f} s, SQLite file")
+    run("rollback journal, synchronous=FULL", {'journal_mode': 'DELETE', 'synchronous': 'FULL'})
+    run("SQLITE_PRAGMAS (WAL, NORMAL, ...)", BenchmarkConfig.SQLITE_PRAGMAS)
+
+
+if __name__ == '__main__':
+    main()
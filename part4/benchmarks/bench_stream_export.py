@@ -0,0 +1,78 @@
+"""
+Peak memory of a full review export: streamed NDJSON vs. one JSON list.
+
+    python -m benchmarks.bench_stream_export [reviews]   (default 1,000,000)
+"""
+import sys
+import time
+import tracemalloc
+from sqlalchemy import insert
+from app import db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.facade import HBnBFacade
+from benchmarks.common import make_app
+
+CHUNK = 50_000
+
+
+def seed(total):
+    # One review per (user, place) pair, as the unique constraint requires
+    side = int(total ** 0.5) + 1
+    db.session.execute(insert(User), [
+        {'first_name': "John", 'last_name': "Doe", 'email': f"user{i}@example.com", 'password': "x"} for i in range(side)
+    ])
+    db.session.execute(insert(Place), [
+        {'title': f"Place {i}", 'description': "", 'price': 1.0, 'latitude': 0, 'longitude': 0, 'owner_id': 1}
+        for i in range(side)
+    ])
+    for start in range(0, total, CHUNK):
+        db.session.execute(insert(Review), [
+            {'text': f"Review {i}", 'rating': 1 + i % 5, 'user_id': 1 + i // side, 'place_id': 1 + i % side}
+            for i in range(start, min(start + CHUNK, total))
+        ])
+    db.session.commit()
+
+
+def measure(label, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed:8.1f} s   peak {peak / 2 ** 20:8.1f} MiB   {size / 2 ** 20:8.1f} MiB sent")
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = make_app()
+    client = app.test_client()
+    with app.app_context():
+        seed(total)
+        db.session.remove()
+
+    def streamed():
+        response = client.get('/api/v1/reviews/', headers={'Accept': 'application/x-ndjson'}, buffered=False)
+        size = sum(len(chunk) for chunk in response.response)
+        response.close()
+        return size
+
+    def listed():
+        # What an unpaginated GET /reviews did: every row as a dict, then one dump
+        import json
+        with app.test_request_context():
+            reviews = HBnBFacade().get_all_reviews()
+            body = json.dumps([{'id': r.id, 'text': r.text, 'rating': r.rating,
+                                'user_id': r.user_id, 'place_id': r.place_id} for r in reviews])
+            db.session.remove()
+        return len(body)
+
+    print(f"--- export of {total} reviews")
+    measure("streamed NDJSON (yield_per)", streamed)
+    measure("full list + json.dumps", listed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""Shared helpers for the benchmark scripts (run them from part4/: python -m benchmarks.<name>)."""
+import time
+from config import TestingConfig
+from app import create_app
+
+
+class BenchmarkConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def make_app(config_class=BenchmarkConfig):
+    """Create an application bound to a fresh in-memory database."""
+    return create_app(config_class)
+
+
+def timeit(label, func, repeat=5):
+    """Run func `repeat` times and print the best wall-clock time in milliseconds."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:10.2f} ms")
+    return result
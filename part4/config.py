@@ -5,17 +5,102 @@ class Config:
     JWT_SECRET_KEY = SECRET_KEY
     DEBUG = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Pagination des listes : taille par défaut et taille maximale d'une page
+    PAGE_SIZE_DEFAULT = 100
+    PAGE_SIZE_MAX = 1000
+    # Rayon maximum accepté par GET /places/nearby
+    NEARBY_MAX_RADIUS_KM = 500
+    # Cache des lectures du facade : 'memory' (LRU + TTL), 'redis' ou 'null'
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_MAX_ENTRIES = 10000
+    # Durée de vie des entrées en secondes, par entité
+    CACHE_TTL = {'place': 30, 'user': 60, 'amenity': 300}
+    # Coût bcrypt (2^n itérations) ; les hash d'un autre coût sont refaits à la connexion
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    # Threads dédiés à bcrypt et file d'attente maximale avant de répondre 503
+    HASHING_WORKERS = int(os.getenv('HASHING_WORKERS', 2))
+    HASHING_QUEUE_SIZE = int(os.getenv('HASHING_QUEUE_SIZE', 16))
+    # Nombre maximum d'éléments acceptés par les endpoints POST /bulk
+    BULK_MAX_ITEMS = 10000
+    # Lignes lues par aller-retour (yield_per) pour les exports en streaming
+    STREAM_BATCH_SIZE = 1000
+    # Instrumentation SQL par requête (nombre de requêtes, temps passé en base)
+    QUERY_STATS_ENABLED = True
+    # Requêtes plus lentes que ce seuil (ms) journalisées en WARNING
+    QUERY_SLOW_THRESHOLD_MS = float(os.getenv('QUERY_SLOW_THRESHOLD_MS', 100))
+    # En-têtes X-DB-Query-Count / X-DB-Time-Ms sur chaque réponse (opt-in)
+    QUERY_STATS_HEADERS = os.getenv('QUERY_STATS_HEADERS', '0') == '1'
+    # GET /api/v1/_debug/queries et nombre de requêtes HTTP qu'il conserve
+    QUERY_STATS_DEBUG_ENDPOINT = False
+    QUERY_STATS_HISTORY = 200
+    # Métriques Prometheus (compteurs par namespace, histogrammes de latence) sur /metrics
+    METRICS_ENABLED = True
+    # Chemin de l'endpoint des métriques
+    METRICS_PATH = os.getenv('METRICS_PATH', '/metrics')
+    # Journalisation du package app : niveau et format ('text' ou 'json', une ligne JSON par log)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+    # Écriture des logs par un thread dédié ; au-delà de LOG_QUEUE_SIZE logs en attente, ils sont perdus (et comptés)
+    LOG_ASYNC = True
+    LOG_QUEUE_SIZE = 10000
+    # Logs DEBUG ligne par ligne (résultats de requêtes) : une ligne sur N
+    LOG_ROW_SAMPLE_EVERY = 100
+    # Pool de connexions (sans effet sur SQLite en mémoire, servi par une connexion unique)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        # Attente maximale (s, entier) d'une connexion libre avant erreur
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+    }
+    # Réglages appliqués à chaque nouvelle connexion SQLite
+    SQLITE_PRAGMAS = {
+        'busy_timeout': 5000,  # ms d'attente d'un verrou avant "database is locked"
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,  # négatif : en KiB, soit ~64 Mo
+    }
+    # Réplicas en lecture seule (URIs séparées par des virgules), déclarés comme binds replica_1, replica_2...
+    SQLALCHEMY_BINDS = {
+        f'replica_{i}': uri for i, uri in enumerate(filter(None, os.getenv('DB_REPLICA_URIS', '').split(',')), 1)
+    }
+    # Binds qui reçoivent, à tour de rôle, les lectures des méthodes @read_only du facade
+    DB_REPLICA_BINDS = list(SQLALCHEMY_BINDS)
+    # Délai (s) entre deux vérifications de l'état d'un réplica
+    DB_REPLICA_HEALTH_INTERVAL = 5
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    QUERY_STATS_DEBUG_ENDPOINT = True
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
     SQLALCHEMY_DATABASE_URI = os.getenv('DEV_DATABASE_URI', 'sqlite:///development.db')
 
 class ProductionConfig(Config):
     DEBUG = False
-    SQLALCHEMY_DATABASE_URI = os.getenv('PROD_DATABASE_URI', 'sqlite:///production.db')
+    # Ne jamais exposer les requêtes SQL en production
+    QUERY_STATS_DEBUG_ENDPOINT = False
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')
+    # Pas de repli sur un fichier SQLite : create_app échoue si l'URI manque
+    SQLALCHEMY_DATABASE_URI = os.getenv('PROD_DATABASE_URI')
+    SQLALCHEMY_ENGINE_OPTIONS = dict(
+        Config.SQLALCHEMY_ENGINE_OPTIONS,
+        pool_size=int(os.getenv('DB_POOL_SIZE', 10)),
+        max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 20)),
+        pool_timeout=int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        # Connexions renouvelées avant que le serveur ne coupe celles restées inactives
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        # Connexion vérifiée à chaque sortie du pool (redémarrage du serveur, coupure réseau)
+        pool_pre_ping=True,
+    )
 
 class TestingConfig(Config):
     TESTING = True
+    # Coût minimal accepté par bcrypt, pour des tests rapides
+    BCRYPT_LOG_ROUNDS = 4
+    QUERY_STATS_DEBUG_ENDPOINT = True
+    # Seuls les problèmes dans la sortie des tests
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING')
     SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URI', 'sqlite:///testing.db')
 
 config = {
@@ -0,0 +1,54 @@
+"""Grid cell of places for /places/nearby
+
+Revision ID: 4a586bc45d4c
+Revises: fabab506bf85
+Create Date: 2026-10-18 09:10:00.000000
+
+Adds places.grid_cell and its index, then computes the cell of every
+existing place (app.geo.grid_cell). Rows written later with plain SQL can
+be fixed with 'flask --app run backfill-grid-cells'.
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.geo import grid_cell
+
+
+# revision identifiers, used by Alembic.
+revision = '4a586bc45d4c'
+down_revision = 'fabab506bf85'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if 'grid_cell' not in {column['name'] for column in inspector.get_columns('places')}:
+        op.add_column('places', sa.Column('grid_cell', sa.Integer(), nullable=True))
+    if 'ix_places_grid_cell' not in {index['name'] for index in inspector.get_indexes('places')}:
+        op.create_index('ix_places_grid_cell', 'places', ['grid_cell'], unique=False)
+
+    # Cellule des lieux existants, par lots (la fonction de grille n'existe qu'en Python)
+    places = sa.table('places', sa.column('id', sa.Integer), sa.column('latitude', sa.Float),
+                      sa.column('longitude', sa.Float), sa.column('grid_cell', sa.Integer))
+    connection = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(places.c.id, places.c.latitude, places.c.longitude).where(places.c.grid_cell.is_(None))
+        if last_id is not None:
+            query = query.where(places.c.id > last_id)
+        rows = connection.execute(query.order_by(places.c.id).limit(BATCH_SIZE)).all()
+        if not rows:
+            break
+        connection.execute(
+            places.update().where(places.c.id == sa.bindparam('place_id')).values(grid_cell=sa.bindparam('cell')),
+            [{'place_id': place_id, 'cell': grid_cell(latitude, longitude)} for place_id, latitude, longitude in rows]
+        )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    op.drop_index('ix_places_grid_cell', table_name='places')
+    with op.batch_alter_table('places') as batch_op:
+        batch_op.drop_column('grid_cell')
@@ -0,0 +1,58 @@
+"""One review per user and place; rating aggregates on places
+
+Revision ID: 861feaf1acf1
+Revises: 4a586bc45d4c
+Create Date: 2026-10-18 09:15:00.000000
+
+Duplicate reviews (same user and place) are deleted before the unique
+constraint is added: the oldest one (lowest id) is kept. The aggregates are
+then computed from the remaining reviews, as 'flask --app run
+repair-ratings' does.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '861feaf1acf1'
+down_revision = '4a586bc45d4c'
+branch_labels = None
+depends_on = None
+
+RATINGS = range(1, 6)
+AGGREGATES = ['review_count', 'rating_sum'] + [f'rating_{rating}' for rating in RATINGS]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    constraints = {constraint['name'] for constraint in inspector.get_unique_constraints('reviews')}
+    if 'uq_reviews_user_id_place_id' not in constraints:
+        # Table dérivée : MySQL refuse une sous-requête sur la table dont on supprime des lignes
+        op.execute(
+            "DELETE FROM reviews WHERE id NOT IN ("
+            "SELECT id FROM (SELECT MIN(id) AS id FROM reviews GROUP BY user_id, place_id) AS kept)"
+        )
+        with op.batch_alter_table('reviews') as batch_op:
+            batch_op.create_unique_constraint('uq_reviews_user_id_place_id', ['user_id', 'place_id'])
+
+    columns = {column['name'] for column in inspector.get_columns('places')}
+    for name in AGGREGATES:
+        if name not in columns:
+            op.add_column('places', sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    # Les agrégats ne sont maintenus qu'à partir de maintenant : on les calcule pour l'existant
+    counts = {'review_count': "COUNT(*)", 'rating_sum': "COALESCE(SUM(rating), 0)"}
+    assignments = [f"{name} = (SELECT {expression} FROM reviews WHERE reviews.place_id = places.id)"
+                   for name, expression in counts.items()]
+    assignments += [f"rating_{rating} = (SELECT COUNT(*) FROM reviews "
+                    f"WHERE reviews.place_id = places.id AND reviews.rating = {rating})" for rating in RATINGS]
+    op.execute(f"UPDATE places SET {', '.join(assignments)}")
+
+
+def downgrade():
+    with op.batch_alter_table('places') as batch_op:
+        for name in reversed(AGGREGATES):
+            batch_op.drop_column(name)
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.drop_constraint('uq_reviews_user_id_place_id', type_='unique')
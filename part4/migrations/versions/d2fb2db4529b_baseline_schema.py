@@ -0,0 +1,93 @@
+"""Baseline schema: users, places, amenities, reviews
+
+Revision ID: d2fb2db4529b
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+Databases created by db.create_all() before migrations existed already have
+these tables: each one is only created when it is missing, so running
+'flask db upgrade' on such a database just records the revision.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2fb2db4529b'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True)]
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'users' not in tables:
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('first_name', sa.String(length=50), nullable=False),
+            sa.Column('last_name', sa.String(length=50), nullable=False),
+            sa.Column('email', sa.String(length=120), nullable=False),
+            sa.Column('password', sa.String(length=128), nullable=False),
+            sa.Column('is_admin', sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('email')
+        )
+    if 'amenities' not in tables:
+        op.create_table(
+            'amenities',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=50), nullable=False),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'places' not in tables:
+        op.create_table(
+            'places',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.String(), nullable=True),
+            sa.Column('price', sa.Float(), nullable=True),
+            sa.Column('latitude', sa.Float(), nullable=False),
+            sa.Column('longitude', sa.Float(), nullable=False),
+            sa.Column('owner_id', sa.Integer(), nullable=False),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'place_amenity_association' not in tables:
+        op.create_table(
+            'place_amenity_association',
+            sa.Column('place_id', sa.Integer(), nullable=False),
+            sa.Column('amenity_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['amenity_id'], ['amenities.id']),
+            sa.ForeignKeyConstraint(['place_id'], ['places.id']),
+            sa.PrimaryKeyConstraint('place_id', 'amenity_id')
+        )
+    if 'reviews' not in tables:
+        op.create_table(
+            'reviews',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('text', sa.String(), nullable=False),
+            sa.Column('rating', sa.Integer(), nullable=False),
+            sa.Column('place_id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(['place_id'], ['places.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('reviews')
+    op.drop_table('place_amenity_association')
+    op.drop_table('places')
+    op.drop_table('amenities')
+    op.drop_table('users')
@@ -0,0 +1,37 @@
+"""Indexes of the place search and of the reviews of a place
+
+Revision ID: fabab506bf85
+Revises: d2fb2db4529b
+Create Date: 2026-10-18 09:05:00.000000
+
+Declared on the models (reviews by place, place filters on price and
+coordinates) without a migration so far; created when missing.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fabab506bf85'
+down_revision = 'd2fb2db4529b'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_reviews_place_id_created_at', 'reviews', ['place_id', 'created_at']),
+    ('ix_places_price', 'places', ['price']),
+    ('ix_places_latitude', 'places', ['latitude']),
+    ('ix_places_longitude', 'places', ['longitude']),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -19,8 +19,18 @@ CREATE TABLE IF NOT EXISTS places (
     price DECIMAL(10,2) NOT NULL DEFAULT 0.00,
     latitude FLOAT NOT NULL,
     longitude FLOAT NOT NULL,
+    grid_cell INT NULL, -- Cellule de la grille géographique (app.geo), pour /places/nearby
+    -- Agrégats des notes, maintenus à chaque création/modification/suppression d'avis
+    review_count INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_1 INT NOT NULL DEFAULT 0,
+    rating_2 INT NOT NULL DEFAULT 0,
+    rating_3 INT NOT NULL DEFAULT 0,
+    rating_4 INT NOT NULL DEFAULT 0,
+    rating_5 INT NOT NULL DEFAULT 0,
     owner_id CHAR(36) NOT NULL,
-    FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX ix_places_grid_cell (grid_cell)
 );
 
 -- Création de la table Reviews
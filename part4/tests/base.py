@@ -0,0 +1,47 @@
+import unittest
+from sqlalchemy import event
+from config import TestingConfig
+from app import create_app, db
+
+
+class InMemoryTestingConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+class AppTestCase(unittest.TestCase):
+    """Base class for tests that need an application and an empty database."""
+
+    config_class = InMemoryTestingConfig
+
+    def setUp(self):
+        self.app = create_app(self.config_class)
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def count_queries(self):
+        """Return a list that collects every SQL statement sent to the engine."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        self.addCleanup(event.remove, db.engine, 'before_cursor_execute', before_cursor_execute)
+        return statements
+
+    def count_commits(self):
+        """Return a list that gets one entry per transaction committed on the engine."""
+        commits = []
+
+        def on_commit(conn):
+            commits.append(conn)
+
+        event.listen(db.engine, 'commit', on_commit)
+        self.addCleanup(event.remove, db.engine, 'commit', on_commit)
+        return commits
@@ -0,0 +1,129 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestBulkCreate(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = self.add_user("admin@hbnb.io", is_admin=True)
+        self.owner = self.add_user("owner@example.com")
+        self.guest = self.add_user("guest@example.com")
+        db.session.commit()
+
+    def add_user(self, email, is_admin=False):
+        user = User(first_name="John", last_name="Doe", email=email, is_admin=is_admin)
+        user.password = "not-a-real-hash"
+        db.session.add(user)
+        return user
+
+    def post(self, url, user, items):
+        token = create_access_token(identity=str(user.id), additional_claims={'is_admin': user.is_admin})
+        return self.client.post(url, json=items, headers={'Authorization': f'Bearer {token}'})
+
+    def test_amenities_inserted_in_one_transaction(self):
+        commits = self.count_commits()
+        response = self.post('/api/v1/amenities/bulk', self.admin, [{'name': f"Amenity {i}"} for i in range(100)])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()['created'], 100)
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(Amenity.query.count(), 100)
+
+    def test_amenities_require_admin(self):
+        self.assertEqual(self.post('/api/v1/amenities/bulk', self.owner, [{'name': "Wifi"}]).status_code, 403)
+
+    def test_invalid_items_are_reported_per_item(self):
+        response = self.post('/api/v1/amenities/bulk', self.admin, [{'name': "Wifi"}, {'name': ""}, {'name': "x" * 51}])
+        self.assertEqual(response.status_code, 207)
+        results = response.get_json()['results']
+        self.assertEqual([r['status'] for r in results], [201, 400, 400])
+        self.assertEqual(results[1]['index'], 1)
+        self.assertEqual(Amenity.query.count(), 1)
+
+    def test_nothing_valid_is_a_400(self):
+        response = self.post('/api/v1/amenities/bulk', self.admin, [{'name': ""}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.post('/api/v1/amenities/bulk', self.admin, {'name': "Wifi"}).status_code, 400)
+
+    def test_places(self):
+        wifi = Amenity(name="Wifi")
+        db.session.add(wifi)
+        db.session.commit()
+        items = [
+            {'title': "Flat", 'description': "", 'price': 80, 'latitude': 48.85, 'longitude': 2.35,
+             'owner_id': str(self.admin.id), 'amenities': [str(wifi.id)]},
+            {'title': "Loft", 'price': 120, 'latitude': 45.76, 'longitude': 4.83, 'amenities': ["999"]},
+            {'title': "Barn", 'price': -1, 'latitude': 0, 'longitude': 0, 'amenities': []},
+        ]
+        response = self.post('/api/v1/places/bulk', self.owner, items)
+        self.assertEqual(response.status_code, 207)
+        results = response.get_json()['results']
+        self.assertEqual([r['status'] for r in results], [201, 400, 400])
+        self.assertEqual(results[1]['error'], "Amenities not found: 999")
+        place = db.session.get(Place, results[0]['id'])
+        # A regular user always owns the places they create
+        self.assertEqual(place.owner_id, self.owner.id)
+        self.assertEqual([amenity.id for amenity in place.amenities], [wifi.id])
+        self.assertIsNotNone(place.grid_cell)
+
+    def test_malformed_place_ids_are_reported_per_item(self):
+        wifi = Amenity(name="Wifi")
+        db.session.add(wifi)
+        db.session.commit()
+        place = {'title': "T", 'price': 10, 'latitude': 0, 'longitude': 0}
+        items = [dict(place, amenities=5), dict(place, amenities=[{'x': 1}]), dict(place, amenities=[str(wifi.id)])]
+        response = self.post('/api/v1/places/bulk', self.owner, items)
+        self.assertEqual(response.status_code, 207)
+        results = response.get_json()['results']
+        self.assertEqual([r['status'] for r in results], [400, 400, 201])
+        self.assertEqual(results[0]['error'], "amenities must be a list of ids")
+        self.assertEqual(results[1]['error'], "amenity id must be a string or an integer")
+        self.assertEqual(self.post('/api/v1/places/bulk', self.owner, items[:1]).status_code, 400)
+
+    def test_malformed_review_place_id_is_reported_per_item(self):
+        place = Place(title="Flat", description="", price=10, latitude=0, longitude=0, owner=self.owner)
+        db.session.add(place)
+        db.session.commit()
+        items = [{'place_id': [1], 'text': "Great", 'rating': 5},
+                 {'place_id': str(place.id), 'text': "Fine", 'rating': 4}]
+        response = self.post('/api/v1/reviews/bulk', self.guest, items)
+        self.assertEqual(response.status_code, 207)
+        results = response.get_json()['results']
+        self.assertEqual([r['status'] for r in results], [400, 201])
+        self.assertEqual(results[0]['error'], "place_id must be a string or an integer")
+
+    def test_reviews_update_aggregates_once_per_place(self):
+        places = [Place(title=f"Place {i}", description="", price=10, latitude=0, longitude=0, owner=self.owner)
+                  for i in range(2)]
+        db.session.add_all(places)
+        mine = Place(title="Mine", description="", price=10, latitude=0, longitude=0, owner=self.guest)
+        db.session.add(mine)
+        db.session.commit()
+        items = [
+            {'place_id': str(places[0].id), 'text': "Great", 'rating': 5},
+            {'place_id': str(places[1].id), 'text': "Fine", 'rating': 3},
+            {'place_id': str(places[0].id), 'text': "Again", 'rating': 1},
+            {'place_id': str(mine.id), 'text': "Mine", 'rating': 5},
+            {'place_id': str(places[1].id), 'text': "Bad rating", 'rating': 9},
+        ]
+        response = self.post('/api/v1/reviews/bulk', self.guest, items)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([r['status'] for r in response.get_json()['results']], [201, 201, 400, 400, 400])
+        self.assertEqual(Review.query.count(), 2)
+        db.session.expire_all()
+        self.assertEqual((places[0].review_count, places[0].rating_5), (1, 1))
+        self.assertEqual((places[1].review_count, places[1].rating_sum), (1, 3))
+
+    def test_size_limit(self):
+        self.app.config['BULK_MAX_ITEMS'] = 2
+        response = self.post('/api/v1/amenities/bulk', self.admin, [{'name': "a"}, {'name': "b"}, {'name': "c"}])
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
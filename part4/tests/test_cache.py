@@ -0,0 +1,99 @@
+import time
+import unittest
+from app import db
+from app.cache import MemoryBackend
+from app.extensions import cache
+from app.models.user import User
+from app.models.place import Place
+from app.services.facade import HBnBFacade
+from tests.base import AppTestCase
+
+
+class TestMemoryBackend(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        backend = MemoryBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual((backend.get('a'), backend.get('c')), (1, 3))
+        self.assertEqual(backend.stats()['evictions'], 1)
+
+    def test_entries_expire_after_ttl(self):
+        backend = MemoryBackend(max_entries=10)
+        backend.set('a', 1, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.stats()['expirations'], 1)
+
+
+class TestFacadeCache(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.facade = HBnBFacade()
+        self.amenity = self.facade.create_amenity({'name': "WiFi"})
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        self.place = Place(title="Cozy Apartment", description="", price=100, latitude=0, longitude=0, owner=owner)
+        db.session.add_all([owner, self.place])
+        db.session.commit()
+
+    def test_second_lookup_is_served_from_cache(self):
+        amenity_id = self.amenity.id
+        self.facade.get_amenity(amenity_id)
+        db.session.remove()
+        statements = self.count_queries()
+        amenity = self.facade.get_amenity(amenity_id)
+        self.assertEqual(amenity.name, "WiFi")
+        self.assertEqual(statements, [])
+        self.assertGreaterEqual(cache.stats()['hits'], 1)
+
+    def test_cached_object_is_usable_in_the_session(self):
+        place_id = self.place.id
+        self.facade.get_place(place_id)
+        db.session.remove()
+        place = self.facade.get_place(place_id)
+        self.assertEqual(place.owner.first_name, "John")
+
+    def test_cached_copy_does_not_overwrite_the_session(self):
+        place_id = self.place.id
+        self.facade.get_place(place_id)
+        db.session.remove()
+        # Modifié dans la requête en cours, pas encore commité : le snapshot en cache est plus ancien
+        place = db.session.get(Place, place_id)
+        place.title = "Being renamed"
+        self.assertIs(self.facade.get_place(place_id), place)
+        self.assertEqual(place.title, "Being renamed")
+
+    def test_password_hash_is_not_cached(self):
+        user_id = self.place.owner_id
+        self.facade.get_user(user_id)
+        self.assertNotIn('password', cache.get('user', str(user_id)))
+        db.session.remove()
+        # Relu depuis la base si besoin
+        self.assertEqual(self.facade.get_user(user_id).password, "not-a-real-hash")
+
+    def test_updates_invalidate_the_cache(self):
+        amenity_id, place_id = self.amenity.id, self.place.id
+        self.facade.get_amenity(amenity_id)
+        self.facade.get_all_amenities()
+        self.facade.update_amenity(amenity_id, {'name': "Fiber"})
+        db.session.remove()
+        self.assertEqual(self.facade.get_amenity(amenity_id).name, "Fiber")
+        self.assertEqual([a.name for a in self.facade.get_all_amenities()], ["Fiber"])
+
+        self.facade.get_place(place_id)
+        self.facade.update_place(place_id, {'title': "Renamed"})
+        db.session.remove()
+        self.assertEqual(self.facade.get_place(place_id).title, "Renamed")
+
+    def test_new_amenity_shows_up_in_cached_listing(self):
+        self.client.get('/api/v1/amenities/')
+        self.facade.create_amenity({'name': "Pool"})
+        names = [a['name'] for a in self.client.get('/api/v1/amenities/').get_json()]
+        self.assertEqual(names, ["WiFi", "Pool"])
+
+
+if __name__ == '__main__':
+    unittest.main()
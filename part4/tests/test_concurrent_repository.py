@@ -0,0 +1,153 @@
+import sys
+import threading
+import unittest
+from app.persistence.repository import ConcurrentInMemoryRepository
+
+WRITERS = 4
+READERS = 4
+UPDATES = 300
+ITEMS = 50
+
+
+class Item:
+    def __init__(self, id, email, place_id):
+        self.id = id
+        self.email = email
+        self.place_id = place_id
+        # Toujours modifiés ensemble : un lecteur ne doit jamais les voir différents
+        self.version = self.checksum = 0
+
+
+class TestConcurrentInMemoryRepository(unittest.TestCase):
+    def setUp(self):
+        # Changer de thread très souvent pour provoquer les entrelacements
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        self.repo = ConcurrentInMemoryRepository(unique_indexes=('email',), indexes=('place_id',))
+        self.repo.add_all([Item(i, f"user{i}@example.com", i % 5) for i in range(ITEMS)])
+
+    def run_threads(self, targets, background=()):
+        """Run targets in parallel while background loops until they are done."""
+        errors = []
+        done = threading.Event()
+
+        def guarded(target):
+            try:
+                target()
+            except Exception as e:  # reported by the test
+                errors.append(e)
+
+        def looping(target):
+            while not done.is_set():
+                target()
+
+        loops = [threading.Thread(target=guarded, args=(lambda t=target: looping(t),)) for target in background]
+        threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+        for thread in loops + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        for thread in loops:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_get_all_is_built_once_per_state(self):
+        objs = self.repo.get_all()
+        self.assertIsInstance(objs, tuple)
+        self.assertIs(self.repo.get_all(), objs)
+        self.repo.add(Item(ITEMS, "new@example.com", 0))
+        self.assertEqual(len(objs), ITEMS)
+        self.assertEqual(len(self.repo.get_all()), ITEMS + 1)
+
+    def test_writers_to_different_keys_do_not_block_each_other(self):
+        repo = ConcurrentInMemoryRepository()
+        repo.add_all([Item(1, None, 0), Item(2, None, 0)])
+        done = threading.Event()
+
+        def writer(obj_id):
+            repo.update(obj_id, {'version': 1})
+            done.set()
+
+        # Un écrivain garde la clé 1 : un autre peut écrire la clé 2, pas la clé 1
+        with repo._locked(repo._stripes([1])):
+            other = threading.Thread(target=writer, args=(2,))
+            other.start()
+            self.assertTrue(done.wait(5))
+            other.join()
+            done.clear()
+            same = threading.Thread(target=writer, args=(1,))
+            same.start()
+            self.assertFalse(done.wait(0.2))
+        self.assertTrue(done.wait(5))
+        same.join()
+        self.assertEqual([repo.get(1).version, repo.get(2).version], [1, 1])
+
+    def test_add_all_checks_the_whole_batch_first(self):
+        with self.assertRaises(ValueError):
+            self.repo.add_all([Item(ITEMS, "a@example.com", 0), Item(ITEMS + 1, "user3@example.com", 0)])
+        with self.assertRaises(ValueError):
+            self.repo.add_all([Item(ITEMS, "a@example.com", 0), Item(ITEMS + 1, "a@example.com", 0)])
+        self.assertIsNone(self.repo.get(ITEMS))
+        # Une adresse libérée dans le même lot peut être reprise
+        self.repo.add_all([Item(3, "moved@example.com", 3), Item(ITEMS, "user3@example.com", 0)])
+        self.assertEqual(self.repo.get_by_attribute('email', "user3@example.com").id, ITEMS)
+
+    def test_readers_never_see_partial_updates(self):
+        def writer(offset):
+            for n in range(1, UPDATES + 1):
+                obj_id = (offset + n * WRITERS) % ITEMS
+                self.repo.update(obj_id, {'version': n, 'checksum': -n, 'place_id': n % 5})
+
+        def reader():
+            for obj in self.repo.get_all():
+                assert obj.version == -obj.checksum, "partially updated object"
+            for place_id in range(5):
+                for obj in self.repo.filter_by(place_id=place_id):
+                    assert obj.place_id == place_id, "stale index entry"
+            assert len(self.repo.get_all()) == ITEMS
+
+        self.run_threads([lambda offset=offset: writer(offset) for offset in range(WRITERS)], [reader] * READERS)
+
+        by_place = sum(len(self.repo.filter_by(place_id=place_id)) for place_id in range(5))
+        self.assertEqual(by_place, ITEMS)
+
+    def test_concurrent_adds_and_deletes(self):
+        def worker(offset):
+            for n in range(UPDATES):
+                obj_id = ITEMS + offset * UPDATES + n
+                self.repo.add(Item(obj_id, f"user{obj_id}@example.com", n % 5))
+                if n % 2:
+                    self.assertTrue(self.repo.delete(obj_id))
+
+        self.run_threads([lambda offset=offset: worker(offset) for offset in range(WRITERS)])
+        expected = ITEMS + WRITERS * UPDATES // 2
+        self.assertEqual(len(self.repo.get_all()), expected)
+        self.assertEqual(sum(len(self.repo.filter_by(place_id=p)) for p in range(5)), expected)
+        self.assertIsNone(self.repo.get_by_attribute('email', f"user{ITEMS + 1}@example.com"))
+
+    def test_unique_index_under_contention(self):
+        # Tous les threads veulent la même adresse : un seul doit l'obtenir
+        winners = []
+
+        def claim(obj_id):
+            try:
+                self.repo.update(obj_id, {'email': "taken@example.com"})
+                winners.append(obj_id)
+            except ValueError:
+                pass
+
+        self.run_threads([lambda obj_id=obj_id: claim(obj_id) for obj_id in range(ITEMS)])
+        self.assertEqual(len(winners), 1)
+        self.assertEqual(self.repo.get_by_attribute('email', "taken@example.com").id, winners[0])
+
+    def test_snapshot_objects_are_not_mutated(self):
+        before = self.repo.get(1)
+        after = self.repo.update(1, {'version': 1, 'checksum': -1})
+        self.assertEqual(before.version, 0)
+        self.assertIs(self.repo.get(1), after)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from datetime import datetime, timedelta
+from werkzeug.http import http_date
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.services import facade
+from tests.base import AppTestCase
+
+
+class TestConditionalRequests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add(owner)
+        db.session.add(Place(title="Place", description="", price=10, latitude=0, longitude=0, owner=owner))
+        db.session.add_all([Amenity(name=f"Amenity {i}") for i in range(3)])
+        db.session.commit()
+        self.place_id = Place.query.first().id
+
+    def test_responses_carry_validators(self):
+        for url in ('/api/v1/places/', f'/api/v1/places/{self.place_id}', '/api/v1/amenities/', '/api/v1/users/'):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('ETag', response.headers)
+            self.assertIn('Last-Modified', response.headers)
+
+    def test_if_none_match_skips_the_page_query(self):
+        etag = self.client.get('/api/v1/amenities/').headers['ETag']
+        statements = self.count_queries()
+        response = self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        # Only the fingerprint query ran
+        self.assertEqual(len(statements), 1)
+
+    def test_item_not_modified(self):
+        url = f'/api/v1/places/{self.place_id}'
+        etag = self.client.get(url).headers['ETag']
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': '"other"'}).status_code, 200)
+
+    def test_new_row_changes_collection_etag(self):
+        etag = self.client.get('/api/v1/amenities/').headers['ETag']
+        db.session.add(Amenity(name="Sauna"))
+        db.session.commit()
+        response = self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_update_changes_item_etag(self):
+        url = f'/api/v1/places/{self.place_id}'
+        etag = self.client.get(url).headers['ETag']
+        facade.update_place(self.place_id, {'title': 'Renamed'})
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_if_modified_since(self):
+        url = f'/api/v1/places/{self.place_id}'
+        future = http_date(datetime.utcnow() + timedelta(hours=1))
+        past = http_date(datetime(2000, 1, 1))
+        self.assertEqual(self.client.get(url, headers={'If-Modified-Since': future}).status_code, 304)
+        self.assertEqual(self.client.get(url, headers={'If-Modified-Since': past}).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
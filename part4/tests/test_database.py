@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import exc, text
+from app import create_app, db
+from app.database import TimedQueuePool, engine_options
+from config import ProductionConfig, TestingConfig
+
+
+class TestEngineOptions(unittest.TestCase):
+    def test_memory_sqlite_keeps_its_static_pool(self):
+        options = engine_options('sqlite://', {'pool_size': 5, 'max_overflow': 10, 'pool_recycle': 60})
+        self.assertEqual(options, {'pool_recycle': 60})
+
+    def test_other_databases_get_a_timed_queue_pool(self):
+        options = engine_options('postgresql://db/hbnb', {'pool_size': 5}, {'journal_mode': 'WAL'})
+        self.assertIs(options['poolclass'], TimedQueuePool)
+        # Les pragmas ne concernent que SQLite
+        self.assertNotIn('pool_events', options)
+
+    def test_production_has_no_default_database(self):
+        class MissingDatabaseConfig(ProductionConfig):
+            SQLALCHEMY_DATABASE_URI = None
+
+        with self.assertRaisesRegex(RuntimeError, 'PROD_DATABASE_URI'):
+            create_app(MissingDatabaseConfig)
+
+
+class TestSQLiteFile(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        class FileConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'hbnb.db')}"
+            SQLALCHEMY_ENGINE_OPTIONS = {'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 1}
+
+        self.app = create_app(FileConfig)
+        ctx = self.app.app_context()
+        ctx.push()
+        self.addCleanup(ctx.pop)
+        self.addCleanup(lambda: db.engine.dispose())
+        self.addCleanup(db.session.remove)
+
+    def test_pragmas_are_applied_on_connect(self):
+        with db.engine.connect() as connection:
+            pragma = lambda name: connection.execute(text(f'PRAGMA {name}')).scalar()
+            self.assertEqual(pragma('journal_mode'), 'wal')
+            self.assertEqual(pragma('synchronous'), 1)  # NORMAL
+            self.assertEqual(pragma('busy_timeout'), 5000)
+            self.assertEqual(pragma('cache_size'), -64000)
+
+    def test_checkout_waits_and_timeouts_are_exported(self):
+        pool = db.engine.pool
+        self.assertIsInstance(pool, TimedQueuePool)
+        with db.engine.connect():
+            # La seule connexion est prise : la suivante attend pool_timeout puis abandonne
+            with self.assertRaises(exc.TimeoutError):
+                db.engine.connect()
+        buckets, seconds, timeouts = pool.checkout_stats()
+        self.assertEqual(timeouts, 1)
+        self.assertGreaterEqual(seconds, 1)
+
+        exposition = self.app.test_client().get('/metrics').get_data(as_text=True)
+        self.assertIn('hbnb_db_pool_checkout_timeouts_total{bind="default"} 1\n', exposition)
+        self.assertIn('hbnb_db_pool_checkout_wait_seconds_bucket{bind="default",le="+Inf"}', exposition)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.extensions import hashing
+from app.models.user import User
+from tests.base import AppTestCase, InMemoryTestingConfig
+
+
+class SmallPoolConfig(InMemoryTestingConfig):
+    HASHING_WORKERS = 1
+    HASHING_QUEUE_SIZE = 0
+
+
+class TestHashingPool(AppTestCase):
+    config_class = SmallPoolConfig
+
+    def setUp(self):
+        super().setUp()
+        db.session.add(User(first_name="John", last_name="Doe", email="john.doe@example.com", password="s3cret!"))
+        db.session.commit()
+
+    def login(self):
+        return self.client.post('/api/v1/auth/login', json={'email': "john.doe@example.com", 'password': "s3cret!"})
+
+    def block_pool(self):
+        """Occupy the only worker until the returned event is set."""
+        release, started = threading.Event(), threading.Event()
+        pool = self.app.extensions['hbnb_hashing']
+
+        def busy():
+            started.set()
+            release.wait(5)
+
+        thread = threading.Thread(target=pool.run, args=(busy,))
+        thread.start()
+        started.wait(5)
+        self.addCleanup(thread.join)
+        self.addCleanup(release.set)
+        return release
+
+    def test_login_runs_on_the_pool(self):
+        before = hashing.stats()['completed']
+        self.assertEqual(self.login().status_code, 200)
+        stats = hashing.stats()
+        self.assertEqual(stats['completed'], before + 1)
+        self.assertEqual(stats['pending'], 0)
+
+    def test_saturated_pool_returns_503(self):
+        self.block_pool()
+        start = time.perf_counter()
+        response = self.login()
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response.headers)
+        # Rejected without waiting for the busy worker
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(hashing.stats()['rejected'], 1)
+
+    def test_saturated_pool_on_password_change_returns_503(self):
+        admin = User(first_name="Admin", last_name="Doe", email="admin@hbnb.io", password="s3cret!", is_admin=True)
+        db.session.add(admin)
+        db.session.commit()
+        user_id = User.query.filter_by(email="john.doe@example.com").one().id
+        token = create_access_token(identity=str(admin.id), additional_claims={'is_admin': True})
+        self.block_pool()
+        response = self.client.put(f'/api/v1/users/{user_id}', json={'password': "n3w-secret!"},
+                                   headers={'Authorization': f'Bearer {token}'})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '1')
+
+    def test_pool_recovers_after_saturation(self):
+        release = self.block_pool()
+        self.assertEqual(self.login().status_code, 503)
+        release.set()
+        for _ in range(50):
+            if hashing.stats()['pending'] == 0:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.login().status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
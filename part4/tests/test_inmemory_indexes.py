@@ -0,0 +1,61 @@
+import unittest
+from app.persistence.repository import InMemoryRepository
+
+
+class Item:
+    def __init__(self, id, email, place_id):
+        self.id = id
+        self.email = email
+        self.place_id = place_id
+
+
+class TestInMemoryIndexes(unittest.TestCase):
+    def setUp(self):
+        self.repo = InMemoryRepository(unique_indexes=('email',), indexes=('place_id',))
+        self.repo.add_all([Item(i, f"user{i}@example.com", i % 3) for i in range(9)])
+
+    def ids(self, objs):
+        return sorted(obj.id for obj in objs)
+
+    def test_lookups(self):
+        self.assertEqual(self.repo.get_by_attribute('email', "user4@example.com").id, 4)
+        self.assertIsNone(self.repo.get_by_attribute('email', "nobody@example.com"))
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=1)), [1, 4, 7])
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=1, email="user7@example.com")), [7])
+        self.assertEqual(self.repo.filter_by(place_id=2, email="user7@example.com"), [])
+
+    def test_indexes_follow_updates_and_deletes(self):
+        self.repo.update(4, {'email': "new@example.com", 'place_id': 2})
+        self.assertIsNone(self.repo.get_by_attribute('email', "user4@example.com"))
+        self.assertEqual(self.repo.get_by_attribute('email', "new@example.com").id, 4)
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=1)), [1, 7])
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=2)), [2, 4, 5, 8])
+
+        self.repo.delete(5)
+        self.assertIsNone(self.repo.get_by_attribute('email', "user5@example.com"))
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=2)), [2, 4, 8])
+
+    def test_unique_index_rejects_duplicates(self):
+        with self.assertRaises(ValueError):
+            self.repo.add(Item(99, "user1@example.com", 0))
+        with self.assertRaises(ValueError):
+            self.repo.update(2, {'email': "user1@example.com", 'place_id': 1})
+        # Le conflit laisse l'objet et ses index inchangés
+        self.assertEqual(self.repo.get(2).email, "user2@example.com")
+        self.assertEqual(self.repo.get_by_attribute('email', "user1@example.com").id, 1)
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=2)), [2, 5, 8])
+        self.assertIsNone(self.repo.get(99))
+
+    def test_replacing_an_object_reindexes_it(self):
+        self.repo.add(Item(3, "user3@example.com", 2))
+        self.assertEqual(self.ids(self.repo.filter_by(place_id=0)), [0, 6])
+
+    def test_unindexed_attributes_still_work(self):
+        repo = InMemoryRepository()
+        repo.add(Item(1, "a@example.com", 1))
+        self.assertEqual(repo.get_by_attribute('email', "a@example.com").id, 1)
+        self.assertEqual(len(repo.filter_by(place_id=1)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import io
+import json
+import logging
+import queue
+import sys
+import unittest
+from contextlib import redirect_stderr
+from flask import Flask
+from app.logs import DroppingQueueHandler, JsonFormatter, LogSetup, sample
+
+
+class Counted:
+    """Argument that counts how many times it is formatted."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return 'counted'
+
+
+class TestLogSetup(unittest.TestCase):
+    def setUp(self):
+        # Le logger "app" est global : on le rend tel quel après chaque test
+        logger = logging.getLogger('app')
+        saved = logger.handlers[:], logger.level, logger.propagate
+        logger.handlers = []
+
+        def restore():
+            logger.handlers, logger.level, logger.propagate = saved
+        self.addCleanup(restore)
+
+    def configure(self, setup=None, **config):
+        app = Flask('app')
+        app.config.update(config)
+        if setup is None:
+            setup = LogSetup()
+            self.addCleanup(setup.stop)
+        stream = io.StringIO()
+        with redirect_stderr(stream):
+            setup.init_app(app)
+        return setup, stream
+
+    def test_disabled_messages_are_never_formatted(self):
+        self.configure(LOG_LEVEL='INFO', LOG_ASYNC=False)
+        argument = Counted()
+        logging.getLogger('app.services.facade').debug("Looking for %s", argument)
+        self.assertEqual(argument.calls, 0)
+
+    def test_async_json_output(self):
+        setup, stream = self.configure(LOG_LEVEL='INFO', LOG_FORMAT='json', LOG_ASYNC=True)
+        argument = Counted()
+        logging.getLogger('app.query_stats').info("GET %s", argument, extra={'query_stats': {'queries': 3}})
+        # Mis en forme dans le thread appelant : l'argument peut changer ensuite
+        self.assertEqual(argument.calls, 1)
+        setup.stop()
+        record = json.loads(stream.getvalue())
+        self.assertEqual(record['message'], "GET counted")
+        self.assertEqual(record['level'], 'INFO')
+        self.assertEqual(record['logger'], 'app.query_stats')
+        self.assertEqual(record['query_stats'], {'queries': 3})
+
+    def test_replaces_the_previous_handler(self):
+        setup, _ = self.configure(LOG_ASYNC=True)
+        self.configure(setup, LOG_ASYNC=False)
+        handlers = logging.getLogger('app').handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], logging.StreamHandler)
+
+
+class TestDroppingQueueHandler(unittest.TestCase):
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = DroppingQueueHandler(queue.Queue(1))
+        record = logging.LogRecord('app', logging.INFO, __file__, 1, "row %d", (1,), None)
+        for _ in range(3):
+            handler.emit(record)
+        self.assertEqual(handler.dropped, 2)
+        self.assertEqual(handler.queue.get_nowait().getMessage(), "row 1")
+
+    def test_exception_is_kept_for_the_listener(self):
+        handler = DroppingQueueHandler(queue.Queue())
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord('app', logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+        handler.emit(record)
+        output = json.loads(JsonFormatter().format(handler.queue.get_nowait()))
+        self.assertEqual(output['message'], "failed")
+        self.assertIn("RuntimeError: boom", output['exception'])
+
+
+class TestSample(unittest.TestCase):
+    def test_one_row_in_n(self):
+        app = Flask('app')
+        app.config['LOG_ROW_SAMPLE_EVERY'] = 10
+        with app.app_context():
+            self.assertEqual(list(sample(range(25))), [0, 10, 20])
+
+
+if __name__ == '__main__':
+    unittest.main()
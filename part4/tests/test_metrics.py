@@ -0,0 +1,110 @@
+import re
+import threading
+import unittest
+from tests.base import AppTestCase, InMemoryTestingConfig
+
+
+def sample(text, name, **labels):
+    """Value of one sample of the exposition text (None if absent)."""
+    wanted = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = '^' + re.escape(name + ('{' + wanted + '}' if labels else '')) + r' (\S+)$'
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+class TestMetrics(AppTestCase):
+    def scrape(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        return response.get_data(as_text=True)
+
+    def test_requests_are_counted_by_namespace_method_and_status(self):
+        for _ in range(3):
+            self.client.get('/api/v1/places/')
+        self.client.get('/api/v1/places/999')
+        self.client.get('/api/v1/users/')
+        self.client.get('/not/a/route')
+        text = self.scrape()
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='places', method='GET', status=200), 3)
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='places', method='GET', status=404), 1)
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='users', method='GET', status=200), 1)
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='unmatched', method='GET', status=404), 1)
+
+    def test_latency_histogram(self):
+        for _ in range(4):
+            self.client.get('/api/v1/amenities/')
+        text = self.scrape()
+        labels = {'namespace': 'amenities', 'method': 'GET'}
+        self.assertEqual(sample(text, 'hbnb_http_request_duration_seconds_count', **labels), 4)
+        self.assertEqual(sample(text, 'hbnb_http_request_duration_seconds_bucket', **labels, le='+Inf'), 4)
+        buckets = [float(value) for value in re.findall(
+            r'^hbnb_http_request_duration_seconds_bucket\{namespace="amenities",method="GET",le="[^"]+"\} (\S+)$',
+            text, re.MULTILINE)]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertGreater(sample(text, 'hbnb_http_request_duration_seconds_sum', **labels), 0)
+
+    def test_counters_of_every_thread_are_summed(self):
+        def worker():
+            client = self.app.test_client()
+            for _ in range(5):
+                client.get('/api/v1/amenities/')
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        text = self.scrape()
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='amenities', method='GET', status=200), 20)
+        # Seul le scrape en cours est compté
+        self.assertEqual(sample(text, 'hbnb_http_requests_in_flight'), 1)
+
+    def test_ended_threads_are_folded_into_the_base_shard(self):
+        def worker():
+            self.app.test_client().get('/api/v1/amenities/')
+
+        for _ in range(20):
+            # Un thread par requête, comme le serveur de développement
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        text = self.scrape()
+        self.assertEqual(sample(text, 'hbnb_http_requests_total', namespace='amenities', method='GET', status=200), 20)
+        self.assertEqual(sample(text, 'hbnb_http_request_duration_seconds_count', namespace='amenities', method='GET'), 20)
+        # La base et le shard du thread du test
+        self.assertEqual(len(self.app.extensions['hbnb_metrics'].shards), 2)
+
+    def test_cache_and_hashing_gauges(self):
+        text = self.scrape()
+        for name in ('hbnb_cache_hits_total', 'hbnb_cache_misses_total', 'hbnb_cache_hit_ratio',
+                     'hbnb_hashing_queue_depth', 'hbnb_hashing_workers', 'hbnb_hashing_rejected_total'):
+            self.assertIsNotNone(sample(text, name), name)
+        self.assertEqual(sample(text, 'hbnb_hashing_workers'), self.app.config['HASHING_WORKERS'])
+
+
+class MetricsDisabledConfig(InMemoryTestingConfig):
+    METRICS_ENABLED = False
+
+
+class MetricsPathConfig(InMemoryTestingConfig):
+    METRICS_PATH = '/internal/metrics'
+
+
+class TestMetricsPath(AppTestCase):
+    config_class = MetricsPathConfig
+
+    def test_endpoint_moves(self):
+        self.assertEqual(self.client.get('/internal/metrics').status_code, 200)
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+
+class TestMetricsDisabled(AppTestCase):
+    config_class = MetricsDisabledConfig
+
+    def test_no_endpoint(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+from alembic.script import ScriptDirectory
+from flask_migrate import upgrade
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from app import create_app, db
+from app.geo import grid_cell
+from config import TestingConfig
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+BASELINE = 'd2fb2db4529b'
+
+
+class MigrationTestCase(unittest.TestCase):
+    """Database file brought to an old revision, filled with raw SQL, then upgraded."""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        class FileConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'hbnb.db')}"
+
+        self.app = create_app(FileConfig)
+        ctx = self.app.app_context()
+        ctx.push()
+        self.addCleanup(ctx.pop)
+        self.addCleanup(lambda: db.engine.dispose())
+        self.addCleanup(db.session.remove)
+        # create_app a créé le schéma actuel : on repart d'une base vide
+        db.drop_all(bind_key=None)
+
+    def upgrade(self, revision='head'):
+        upgrade(directory=MIGRATIONS, revision=revision)
+
+    def execute(self, sql, **params):
+        with db.engine.begin() as connection:
+            connection.execute(text(sql), params)
+
+    def query(self, sql, **params):
+        with db.engine.connect() as connection:
+            return connection.execute(text(sql), params).all()
+
+    def add_user_and_place(self):
+        self.execute("INSERT INTO users (id, first_name, last_name, email, password, is_admin) "
+                     "VALUES (1, 'John', 'Doe', 'john.doe@example.com', 'x', 0)")
+        self.execute("INSERT INTO places (id, title, description, price, latitude, longitude, owner_id) "
+                     "VALUES (1, 'Flat', '', 80, 48.86, 2.34, 1)")
+
+
+class TestMigrations(MigrationTestCase):
+    def test_upgrade_of_a_database_created_by_create_all(self):
+        db.create_all(bind_key=None)
+        self.upgrade()
+        head = ScriptDirectory.from_config(self.app.extensions['migrate'].migrate.get_config(MIGRATIONS)).get_current_head()
+        self.assertEqual(self.query("SELECT version_num FROM alembic_version")[0][0], head)
+
+    def test_grid_cell_is_added_and_backfilled(self):
+        self.upgrade(BASELINE)
+        self.add_user_and_place()
+        self.upgrade('4a586bc45d4c')
+        indexes = {index['name'] for index in inspect(db.engine).get_indexes('places')}
+        self.assertIn('ix_places_grid_cell', indexes)
+        self.assertEqual(self.query("SELECT grid_cell FROM places")[0][0], grid_cell(48.86, 2.34))
+
+    def test_reviews_are_deduplicated_and_aggregates_backfilled(self):
+        self.upgrade('4a586bc45d4c')
+        self.add_user_and_place()
+        self.execute("INSERT INTO users (id, first_name, last_name, email, password, is_admin) "
+                     "VALUES (2, 'Jane', 'Doe', 'jane.doe@example.com', 'x', 0)")
+        for review_id, user_id, rating in ((1, 2, 4), (2, 2, 1), (3, 1, 5)):
+            self.execute("INSERT INTO reviews (id, text, rating, place_id, user_id) "
+                         "VALUES (:id, 'Review', :rating, 1, :user_id)", id=review_id, rating=rating, user_id=user_id)
+        self.upgrade()
+
+        # Le plus ancien des doublons est gardé
+        self.assertEqual(self.query("SELECT id FROM reviews ORDER BY id"), [(1,), (3,)])
+        constraints = {c['name'] for c in inspect(db.engine).get_unique_constraints('reviews')}
+        self.assertIn('uq_reviews_user_id_place_id', constraints)
+        self.assertEqual(self.query("SELECT review_count, rating_sum, rating_1, rating_4, rating_5 FROM places"),
+                         [(2, 9, 0, 1, 1)])
+        with self.assertRaises(IntegrityError):
+            self.execute("INSERT INTO reviews (text, rating, place_id, user_id) VALUES ('Again', 3, 1, 2)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import base64
+import json
+import unittest
+from datetime import datetime, timedelta
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestPagination(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add(owner)
+        self.place = Place(title="Place", description="", price=10, latitude=0, longitude=0, owner=owner)
+        db.session.add(self.place)
+        db.session.add_all([Amenity(name=f"Amenity {i}") for i in range(25)])
+        start = datetime(2024, 1, 1)
+        for i in range(7):
+            reviewer = User(first_name="Jane", last_name="Doe", email=f"jane{i}@example.com")
+            reviewer.password = "not-a-real-hash"
+            review = Review(text=f"Review {i}", rating=5, place=self.place, user=reviewer)
+            # Two reviews share each timestamp to exercise the id tie-breaker
+            review.created_at = start + timedelta(days=i // 2)
+            db.session.add(review)
+        db.session.commit()
+
+    def walk(self, url):
+        items, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            items.extend(response.get_json())
+            pages += 1
+            cursor = response.headers.get('X-Next-Cursor')
+            url = f"{url.split('cursor=')[0].rstrip('&')}&cursor={cursor}" if cursor else None
+        return items, pages
+
+    def test_pages_cover_every_row_once(self):
+        amenities, pages = self.walk('/api/v1/amenities/?limit=10')
+        self.assertEqual(pages, 3)
+        self.assertEqual([a['name'] for a in amenities], [f"Amenity {i}" for i in range(25)])
+
+    def test_deep_pages_use_keyset_not_offset(self):
+        first = self.client.get('/api/v1/amenities/?limit=10')
+        statements = self.count_queries()
+        self.client.get(f"/api/v1/amenities/?limit=10&cursor={first.headers['X-Next-Cursor']}")
+        # The ETag fingerprint, then the page itself
+        self.assertEqual(len(statements), 2)
+        self.assertIn('amenities.id >', statements[1])
+
+    def test_default_page_size_is_capped(self):
+        self.app.config['PAGE_SIZE_DEFAULT'] = 5
+        self.app.config['PAGE_SIZE_MAX'] = 20
+        self.assertEqual(len(self.client.get('/api/v1/amenities/').get_json()), 5)
+        self.assertEqual(len(self.client.get('/api/v1/amenities/?limit=500').get_json()), 20)
+
+    def test_place_reviews_newest_first_across_pages(self):
+        reviews, pages = self.walk(f'/api/v1/reviews/places/{self.place.id}/reviews?order=newest&limit=3')
+        self.assertEqual(pages, 3)
+        self.assertEqual([r['text'] for r in reviews], [f"Review {i}" for i in reversed(range(7))])
+
+    def test_last_page_has_no_cursor(self):
+        response = self.client.get('/api/v1/users/?limit=100')
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get('/api/v1/places/?cursor=not-a-cursor').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/reviews/?limit=abc').status_code, 400)
+
+    def test_forged_cursor_is_rejected(self):
+        for payload in ([[1, 2]], [{'x': 1}], ["1"], [1, 2], {'id': 1}, "ab", [True]):
+            cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+            self.assertEqual(self.client.get(f'/api/v1/places/?cursor={cursor}').status_code, 400, payload)
+        # Tri (created_at, id) : la date doit être une date
+        cursor = base64.urlsafe_b64encode(json.dumps([[1], 1]).encode()).decode().rstrip('=')
+        url = f'/api/v1/reviews/places/{self.place.id}/reviews?order=newest&cursor={cursor}'
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
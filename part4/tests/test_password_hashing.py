@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+from flask_jwt_extended import create_access_token
+from app import db, bcrypt
+from app.models.user import User
+from tests.base import AppTestCase
+
+
+class TestPasswordHashing(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        admin = User(first_name="Admin", last_name="User", email="admin@hbnb.io", password="admin123", is_admin=True)
+        db.session.add(admin)
+        db.session.commit()
+        token = create_access_token(identity=str(admin.id), additional_claims={'is_admin': True})
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def signup(self, email="john.doe@example.com", password="s3cret!"):
+        return self.client.post('/api/v1/users/', headers=self.headers, json={
+            'first_name': "John", 'last_name': "Doe", 'email': email, 'password': password
+        })
+
+    def login(self, email="john.doe@example.com", password="s3cret!"):
+        return self.client.post('/api/v1/auth/login', json={'email': email, 'password': password})
+
+    def test_signup_hashes_once(self):
+        with mock.patch.object(bcrypt, 'generate_password_hash', wraps=bcrypt.generate_password_hash) as generate:
+            response = self.signup()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(generate.call_count, 1)
+
+    def test_stored_hash_matches_typed_password(self):
+        self.signup()
+        self.assertEqual(self.login().status_code, 200)
+        self.assertEqual(self.login(password="wrong").status_code, 401)
+
+    def test_hash_uses_configured_cost(self):
+        self.signup()
+        user = User.query.filter_by(email="john.doe@example.com").first()
+        self.assertTrue(user.password.startswith('$2b$04$'))
+
+    def test_login_rehashes_when_cost_changes(self):
+        self.signup()
+        self.app.config['BCRYPT_LOG_ROUNDS'] = 5
+        bcrypt.init_app(self.app)
+        self.addCleanup(bcrypt.init_app, self.app)
+        self.addCleanup(self.app.config.__setitem__, 'BCRYPT_LOG_ROUNDS', 4)
+
+        self.assertEqual(self.login().status_code, 200)
+        user = User.query.filter_by(email="john.doe@example.com").first()
+        self.assertTrue(user.password.startswith('$2b$05$'))
+        # The new hash still verifies, and is not rewritten again
+        with mock.patch.object(bcrypt, 'generate_password_hash') as generate:
+            self.assertEqual(self.login().status_code, 200)
+        generate.assert_not_called()
+
+    def test_wrong_password_does_not_rehash(self):
+        self.signup()
+        self.app.config['BCRYPT_LOG_ROUNDS'] = 5
+        self.addCleanup(self.app.config.__setitem__, 'BCRYPT_LOG_ROUNDS', 4)
+        with mock.patch.object(bcrypt, 'generate_password_hash') as generate:
+            self.assertEqual(self.login(password="wrong").status_code, 401)
+        generate.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.persistence.repository import InMemoryRepository
+from app.services import facade
+from tests.base import AppTestCase
+
+
+class TestPlaceAmenities(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add(owner)
+        db.session.add_all([Amenity(name=f"Amenity {i}") for i in range(40)])
+        db.session.commit()
+        self.owner_id = owner.id
+        self.amenity_ids = [amenity.id for amenity in Amenity.query.order_by(Amenity.id)]
+
+    def place_data(self, **extra):
+        return dict(title="Place", description="", price=10, latitude=0, longitude=0,
+                    owner_id=self.owner_id, **extra)
+
+    def amenity_lookups(self, statements):
+        # Lookups by id; loading a place's current collection joins place_amenity instead
+        return [s for s in statements
+                if s.lstrip().upper().startswith('SELECT') and 'FROM amenities' in s and 'place_amenity' not in s]
+
+    def test_create_resolves_amenities_in_one_query(self):
+        statements = self.count_queries()
+        place = facade.create_place(self.place_data(amenities=[str(i) for i in self.amenity_ids]))
+        self.assertEqual(len(self.amenity_lookups(statements)), 1)
+        self.assertEqual([amenity.id for amenity in place.amenities], self.amenity_ids)
+
+    def test_update_resolves_amenities_in_one_query(self):
+        place_id = facade.create_place(self.place_data()).id
+        statements = self.count_queries()
+        place = facade.update_place(place_id, {'amenities': list(reversed(self.amenity_ids))})
+        self.assertEqual(len(self.amenity_lookups(statements)), 1)
+        self.assertEqual(sorted(amenity.id for amenity in place.amenities), self.amenity_ids)
+
+    def test_unknown_ids_reported_together(self):
+        with self.assertRaises(ValueError) as raised:
+            facade.create_place(self.place_data(amenities=[self.amenity_ids[0], 998, 999]))
+        self.assertEqual(str(raised.exception), "Amenities not found: 998, 999")
+        self.assertEqual(Place.query.count(), 0)
+
+    def test_duplicate_ids_are_ignored(self):
+        place = facade.create_place(self.place_data(amenities=[self.amenity_ids[0]] * 3))
+        self.assertEqual(len(place.amenities), 1)
+
+
+class TestInMemoryGetMany(unittest.TestCase):
+    def test_get_many_keeps_order_and_skips_unknown(self):
+        repo = InMemoryRepository()
+        for name in ("a", "b", "c"):
+            repo.add(type("Obj", (), {'id': name})())
+        self.assertEqual([obj.id for obj in repo.get_many(["c", "x", "a", "c"])], ["c", "a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
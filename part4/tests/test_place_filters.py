@@ -0,0 +1,64 @@
+import unittest
+from sqlalchemy import text
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestPlaceFilters(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        self.wifi, self.pool = Amenity(name="WiFi"), Amenity(name="Pool")
+        db.session.add_all([owner, self.wifi, self.pool])
+        places = [
+            ("Paris", 120, 48.85, 2.35, [self.wifi]),
+            ("Lyon", 80, 45.76, 4.83, [self.wifi, self.pool]),
+            ("Tokyo", 200, 35.68, 139.69, [self.pool]),
+            ("Fiji", 150, -17.71, 178.06, []),
+            ("Samoa", 90, -13.76, -172.10, [self.wifi]),
+        ]
+        for title, price, latitude, longitude, amenities in places:
+            place = Place(title=title, description="", price=price, latitude=latitude, longitude=longitude, owner=owner)
+            place.amenities = amenities
+            db.session.add(place)
+        db.session.commit()
+
+    def titles(self, query):
+        response = self.client.get(f'/api/v1/places/?{query}')
+        self.assertEqual(response.status_code, 200, response.get_json())
+        return [place['title'] for place in response.get_json()]
+
+    def test_price_range(self):
+        self.assertEqual(self.titles('min_price=85&max_price=150'), ["Paris", "Fiji", "Samoa"])
+
+    def test_bounding_box(self):
+        self.assertEqual(self.titles('bbox=-5,40,10,52'), ["Paris", "Lyon"])
+
+    def test_bounding_box_across_antimeridian(self):
+        self.assertEqual(self.titles('bbox=170,-20,-170,-10'), ["Fiji", "Samoa"])
+
+    def test_required_amenities(self):
+        self.assertEqual(self.titles(f'amenities={self.wifi.id}'), ["Paris", "Lyon", "Samoa"])
+        self.assertEqual(self.titles(f'amenities={self.wifi.id},{self.pool.id}'), ["Lyon"])
+
+    def test_filters_are_combined_and_kept_across_pages(self):
+        response = self.client.get(f'/api/v1/places/?amenities={self.wifi.id}&max_price=125&limit=1')
+        self.assertEqual([p['title'] for p in response.get_json()], ["Paris"])
+        self.assertIn('max_price=125', response.headers['Link'])
+
+    def test_invalid_filters(self):
+        for query in ('max_price=cheap', 'bbox=1,2,3', 'bbox=0,50,10,40', 'amenities=a,b',
+                      'min_price=nan', 'max_price=inf', 'bbox=nan,0,1,1', 'amenities=99999999999999999999999'):
+            self.assertEqual(self.client.get(f'/api/v1/places/?{query}').status_code, 400, query)
+
+    def test_price_filter_uses_index(self):
+        plan = db.session.execute(text("EXPLAIN QUERY PLAN SELECT id FROM places WHERE price <= 100")).fetchall()
+        self.assertIn('ix_places_price', ' '.join(str(row) for row in plan))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestPlaceListing(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        amenities = [Amenity(name=f"Amenity {i}") for i in range(5)]
+        db.session.add(owner)
+        db.session.add_all(amenities)
+        for i in range(1000):
+            place = Place(title=f"Place {i}", description="", price=10 + i, latitude=0, longitude=0, owner=owner)
+            place.amenities = amenities[i % 5:i % 5 + 2]
+            db.session.add(place)
+        db.session.commit()
+        db.session.expunge_all()
+
+    def test_listing_uses_constant_number_of_queries(self):
+        statements = self.count_queries()
+        response = self.client.get('/api/v1/places/?limit=1000')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 1000)
+        # The ETag fingerprint, one query for the places, then one per 500 places for the amenity ids
+        self.assertLessEqual(len(statements), 4)
+
+    def test_listing_includes_owner_and_amenities(self):
+        places = self.client.get('/api/v1/places/?limit=1000').get_json()
+        first = places[0]
+        self.assertEqual(first['owner_id'], 1)
+        self.assertEqual(first['amenities'], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
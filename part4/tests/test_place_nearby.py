@@ -0,0 +1,91 @@
+import random
+import unittest
+from sqlalchemy import update
+from app import db
+from app.geo import haversine_km
+from app.models.place import Place
+from app.models.user import User
+from app.services.facade import HBnBFacade
+from tests.base import AppTestCase
+
+
+class TestPlaceNearby(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add(owner)
+        db.session.commit()
+        self.owner_id = owner.id
+
+    def create_place(self, title, latitude, longitude):
+        return HBnBFacade().create_place({
+            'title': title, 'description': "", 'price': 10,
+            'latitude': latitude, 'longitude': longitude, 'owner_id': self.owner_id
+        })
+
+    def nearby(self, latitude, longitude, radius_km=1):
+        return self.client.get(f'/api/v1/places/nearby?lat={latitude}&lon={longitude}&radius_km={radius_km}').get_json()
+
+    def test_nearest_first_within_radius(self):
+        self.create_place("Louvre", 48.8606, 2.3376)
+        self.create_place("Versailles", 48.8049, 2.1204)
+        self.create_place("Lyon", 45.7640, 4.8357)
+        response = self.client.get('/api/v1/places/nearby?lat=48.8584&lon=2.2945&radius_km=20')
+        self.assertEqual(response.status_code, 200)
+        places = response.get_json()
+        self.assertEqual([p['title'] for p in places], ["Louvre", "Versailles"])
+        self.assertAlmostEqual(places[0]['distance_km'], 3.2, delta=0.2)
+
+    def test_grid_search_matches_full_scan(self):
+        rng = random.Random(42)
+        points = [(rng.uniform(-89, 89), rng.uniform(-180, 180)) for _ in range(300)]
+        # Cluster some points around the antimeridian and the poles
+        points += [(rng.uniform(-10, 10), rng.choice([-1, 1]) * rng.uniform(178, 180)) for _ in range(100)]
+        points += [(rng.uniform(85, 90), rng.uniform(-180, 180)) for _ in range(100)]
+        for i, (latitude, longitude) in enumerate(points):
+            self.create_place(f"Place {i}", latitude, longitude)
+
+        for latitude, longitude, radius in [(0, 179.5, 300), (0, -179.9, 150), (88, 0, 400), (10, 10, 500)]:
+            distances = haversine_km(latitude, longitude, *zip(*points))
+            expected = sorted(f"Place {i}" for i, d in enumerate(distances) if d <= radius)
+            found = HBnBFacade().get_places_nearby(latitude, longitude, radius, limit=1000)
+            self.assertEqual(sorted(place.title for place, _ in found), expected, (latitude, longitude, radius))
+
+    def test_update_moves_place_to_new_cell(self):
+        place = self.create_place("Moving", 0, 0)
+        HBnBFacade().update_place(place.id, {'latitude': 48.86, 'longitude': 2.34})
+        self.assertEqual(len(HBnBFacade().get_places_nearby(48.86, 2.34, 1, limit=10)), 1)
+        self.assertEqual(HBnBFacade().get_places_nearby(0, 0, 1, limit=10), [])
+
+    def test_places_written_outside_the_facade_are_found(self):
+        place = Place(title="Direct", description="", price=10, latitude=48.86, longitude=2.34, owner_id=self.owner_id)
+        db.session.add(place)
+        db.session.commit()
+        self.assertEqual([p['title'] for p in self.nearby(48.86, 2.34)], ["Direct"])
+
+        place.latitude = 45.76
+        db.session.commit()
+        self.assertEqual(self.nearby(48.86, 2.34), [])
+        self.assertEqual([p['title'] for p in self.nearby(45.76, 2.34)], ["Direct"])
+
+    def test_backfill_command_sets_missing_cells(self):
+        place = self.create_place("Old row", 48.86, 2.34)
+        moved = self.create_place("Moved in SQL", 0, 0)
+        db.session.execute(update(Place).where(Place.id == place.id).values(grid_cell=None))
+        db.session.execute(update(Place).where(Place.id == moved.id).values(latitude=48.86, longitude=2.34))
+        db.session.commit()
+        self.assertEqual(self.nearby(48.86, 2.34), [])
+
+        result = self.app.test_cli_runner().invoke(args=['backfill-grid-cells'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("2 places updated", result.output)
+        self.assertEqual(sorted(p['title'] for p in self.nearby(48.86, 2.34)), ["Moved in SQL", "Old row"])
+
+    def test_invalid_parameters(self):
+        for query in ('lat=1&lon=2', 'lat=a&lon=2&radius_km=3', 'lat=100&lon=2&radius_km=3', 'lat=1&lon=2&radius_km=100000'):
+            self.assertEqual(self.client.get(f'/api/v1/places/nearby?{query}').status_code, 400, query)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import HBnBFacade
+from tests.base import AppTestCase
+
+
+class TestPlaceReviews(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        self.places = [
+            Place(title=f"Place {i}", description="", price=10, latitude=0, longitude=0, owner=owner)
+            for i in range(2)
+        ]
+        db.session.add(owner)
+        db.session.add_all(self.places)
+        start = datetime(2024, 1, 1)
+        for i in range(6):
+            reviewer = User(first_name="Jane", last_name="Doe", email=f"jane{i}@example.com")
+            reviewer.password = "not-a-real-hash"
+            review = Review(text=f"Review {i}", rating=1 + i % 5, place=self.places[i % 2], user=reviewer)
+            review.created_at = start + timedelta(days=i)
+            db.session.add(review)
+        db.session.commit()
+
+    def test_only_reviews_of_the_place_are_returned(self):
+        reviews = HBnBFacade().get_reviews_by_place(self.places[0].id)
+        self.assertEqual([review.text for review in reviews], ["Review 0", "Review 2", "Review 4"])
+
+    def test_newest_first_with_limit(self):
+        response = self.client.get(f'/api/v1/reviews/places/{self.places[1].id}/reviews?order=newest&limit=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([review['text'] for review in response.get_json()], ["Review 5", "Review 3"])
+
+    def test_invalid_limit(self):
+        response = self.client.get(f'/api/v1/reviews/places/{self.places[1].id}/reviews?limit=0')
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_place(self):
+        response = self.client.get('/api/v1/reviews/places/999/reviews')
+        self.assertEqual(response.status_code, 404)
+
+    def test_query_uses_place_index(self):
+        plan = db.session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM reviews WHERE place_id = 1 ORDER BY created_at LIMIT 10"
+        )).fetchall()
+        self.assertIn('ix_reviews_place_id_created_at', ' '.join(str(row) for row in plan))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from tests.base import AppTestCase, InMemoryTestingConfig
+
+
+class TestQueryStats(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add_all([Place(title=f"Place {i}", description="", price=10, latitude=0, longitude=0, owner=owner)
+                            for i in range(3)])
+        db.session.commit()
+
+    def test_headers_are_opt_in(self):
+        self.assertNotIn('X-DB-Query-Count', self.client.get('/api/v1/places/').headers)
+
+        self.app.config['QUERY_STATS_HEADERS'] = True
+        statements = self.count_queries()
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(int(response.headers['X-DB-Query-Count']), len(statements))
+        self.assertGreaterEqual(float(response.headers['X-DB-Time-Ms']), 0)
+
+    def test_request_summary_is_logged(self):
+        with self.assertLogs('app.query_stats', 'INFO') as logs:
+            self.client.get('/api/v1/places/')
+        summary = logs.records[-1].query_stats
+        self.assertEqual((summary['method'], summary['path'], summary['status']), ('GET', '/api/v1/places/', 200))
+        self.assertGreater(summary['queries'], 0)
+
+    def test_slow_statements(self):
+        self.app.config['QUERY_SLOW_THRESHOLD_MS'] = 0
+        with self.assertLogs('app.query_stats', 'WARNING') as logs:
+            self.client.get('/api/v1/places/')
+        self.assertTrue(any('FROM places' in record.query_stats['statement'] for record in logs.records
+                            if record.levelname == 'WARNING'))
+
+    def test_debug_endpoint(self):
+        self.client.get('/api/v1/places/?limit=2')
+        self.client.get('/api/v1/amenities/')
+        history = self.client.get('/api/v1/_debug/queries').get_json()
+        self.assertEqual([entry['path'] for entry in history['requests']],
+                         ['/api/v1/amenities/', '/api/v1/places/?limit=2'])
+
+        busy = self.client.get('/api/v1/_debug/queries?min_queries=1&limit=1').get_json()['requests']
+        self.assertEqual(len(busy), 1)
+        self.assertEqual(self.client.delete('/api/v1/_debug/queries').status_code, 204)
+        self.assertEqual(len(self.client.get('/api/v1/_debug/queries').get_json()['requests']), 1)
+
+    def test_streamed_statements_are_counted(self):
+        self.app.config['STREAM_BATCH_SIZE'] = 1
+        self.client.get('/api/v1/places/?stream=1').get_data()
+        entry = self.client.get('/api/v1/_debug/queries').get_json()['requests'][0]
+        self.assertEqual(entry['path'], '/api/v1/places/?stream=1')
+        # Fingerprint, the streamed SELECT and one amenity lookup per batch of 1 place
+        self.assertEqual(entry['queries'], 5)
+
+
+class ProductionLikeConfig(InMemoryTestingConfig):
+    QUERY_STATS_DEBUG_ENDPOINT = False
+
+
+class TestDebugEndpointDisabled(AppTestCase):
+    config_class = ProductionLikeConfig
+
+    def test_not_registered(self):
+        self.assertEqual(self.client.get('/api/v1/_debug/queries').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
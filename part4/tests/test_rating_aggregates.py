@@ -0,0 +1,66 @@
+import unittest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.services.facade import HBnBFacade
+from tests.base import AppTestCase
+
+
+class TestRatingAggregates(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        self.place = Place(title="Cozy Apartment", description="", price=100, latitude=0, longitude=0, owner=owner)
+        self.reviewers = []
+        for i in range(3):
+            reviewer = User(first_name="Jane", last_name="Doe", email=f"jane{i}@example.com")
+            reviewer.password = "not-a-real-hash"
+            self.reviewers.append(reviewer)
+        db.session.add_all([owner, self.place] + self.reviewers)
+        db.session.commit()
+
+    def review(self, reviewer, rating):
+        return HBnBFacade().create_review({
+            'text': "Review", 'rating': rating, 'user_id': reviewer.id, 'place_id': self.place.id
+        })
+
+    def test_aggregates_follow_create_update_delete(self):
+        first = self.review(self.reviewers[0], 5)
+        self.review(self.reviewers[1], 3)
+        self.assertEqual((self.place.review_count, self.place.average_rating), (2, 4.0))
+
+        HBnBFacade().update_review(first.id, {'rating': 1})
+        self.assertEqual(self.place.rating_histogram, {'1': 1, '2': 0, '3': 1, '4': 0, '5': 0})
+
+        HBnBFacade().delete_review(first.id)
+        self.assertEqual((self.place.review_count, self.place.rating_sum, self.place.rating_1), (1, 3, 0))
+
+    def test_failed_review_does_not_change_aggregates(self):
+        self.review(self.reviewers[0], 4)
+        with self.assertRaises(ValueError):
+            self.review(self.reviewers[0], 2)
+        self.assertEqual((self.place.review_count, self.place.rating_sum), (1, 4))
+
+    def test_place_payload_exposes_aggregates(self):
+        self.review(self.reviewers[0], 4)
+        self.review(self.reviewers[1], 5)
+        place = self.client.get(f'/api/v1/places/{self.place.id}').get_json()
+        self.assertEqual(place['review_count'], 2)
+        self.assertEqual(place['average_rating'], 4.5)
+        self.assertEqual(place['rating_histogram']['5'], 1)
+
+    def test_repair_command_recomputes_from_reviews(self):
+        for reviewer, rating in zip(self.reviewers, (2, 2, 5)):
+            self.review(reviewer, rating)
+        self.place.review_count, self.place.rating_sum, self.place.rating_2 = 40, 7, 0
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=['repair-ratings'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        db.session.refresh(self.place)
+        self.assertEqual((self.place.review_count, self.place.rating_sum, self.place.rating_2), (3, 9, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
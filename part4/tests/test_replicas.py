@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import insert, select
+from app import create_app, db
+from app.extensions import replicas
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+from app.services.facade import HBnBFacade
+from config import TestingConfig
+
+
+class ReplicaTestCase(unittest.TestCase):
+    """Application on a primary SQLite file, with replicas in other files."""
+
+    replica_count = 1
+
+    def replica_urls(self, directory):
+        return [f"sqlite:///{os.path.join(directory, f'replica_{i}.db')}" for i in range(1, self.replica_count + 1)]
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        binds = {f'replica_{i}': url for i, url in enumerate(self.replica_urls(directory), 1)}
+
+        class ReplicaConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'primary.db')}"
+            SQLALCHEMY_BINDS = binds
+            DB_REPLICA_BINDS = list(binds)
+            # Les lectures ne doivent pas être servies par le cache
+            CACHE_BACKEND = 'null'
+
+        self.app = create_app(ReplicaConfig)
+        self.client = self.app.test_client()
+        ctx = self.app.app_context()
+        ctx.push()
+        self.addCleanup(ctx.pop)
+        self.addCleanup(lambda: [engine.dispose() for engine in db.engines.values()])
+        self.addCleanup(db.session.remove)
+        # Flask-SQLAlchemy garde une metadata par bind sur l'objet db, partagé avec les autres tests
+        self.addCleanup(lambda: [db.metadatas.pop(bind, None) for bind in binds])
+        self.facade = HBnBFacade()
+        self.add_amenity(db.engine, "Wifi")
+
+    def add_amenity(self, engine, name):
+        # Les réplicas n'ont pas de réplication ici : on y écrit directement
+        db.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(Amenity), {'name': name})
+
+    def names(self, engine):
+        with engine.connect() as connection:
+            return sorted(connection.scalars(select(Amenity.name)))
+
+    def listed(self):
+        return sorted(amenity['name'] for amenity in self.client.get('/api/v1/amenities/').get_json())
+
+
+class TestReadRouting(ReplicaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_amenity(db.engines['replica_1'], "Pool")
+
+    def test_listings_read_the_replica(self):
+        self.assertEqual(self.listed(), ["Pool"])
+        # Lecture d'un élément (avant une mise à jour, par exemple) : sur le primaire
+        amenity_id = db.session.scalar(select(Amenity.id).where(Amenity.name == "Wifi"))
+        self.assertEqual(self.client.get(f'/api/v1/amenities/{amenity_id}').status_code, 200)
+
+    def test_writes_go_to_the_primary_and_are_read_back(self):
+        with self.app.test_request_context():
+            self.assertEqual([a.name for a in self.facade.get_all_amenities()], ["Pool"])
+            self.facade.create_amenity({'name': "Sauna"})
+            # Après une écriture, la même requête lit le primaire
+            self.assertEqual(sorted(a.name for a in self.facade.get_all_amenities()), ["Sauna", "Wifi"])
+        self.assertEqual(self.names(db.engine), ["Sauna", "Wifi"])
+        self.assertEqual(self.names(db.engines['replica_1']), ["Pool"])
+        # Une nouvelle requête repart sur le réplica
+        db.session.remove()
+        self.assertEqual(self.listed(), ["Pool"])
+
+    def test_streamed_export_reads_the_replica(self):
+        replica = db.engines['replica_1']
+        with replica.begin() as connection:
+            owner_id = connection.execute(insert(User).returning(User.id), {
+                'first_name': "John", 'last_name': "Doe", 'email': "john.doe@example.com", 'password': "x"
+            }).scalar()
+            connection.execute(insert(Place), {'title': "Flat", 'description': "", 'price': 80.0,
+                                               'latitude': 0, 'longitude': 0, 'owner_id': owner_id})
+        with self.app.test_request_context():
+            places = self.facade.iter_places()
+            # Les itérateurs lisent pendant l'itération, hors de l'appel décoré
+            self.assertEqual([place.title for place in places], ["Flat"])
+
+
+class TestRoundRobin(ReplicaTestCase):
+    replica_count = 2
+
+    def test_each_request_uses_the_next_replica(self):
+        self.add_amenity(db.engines['replica_1'], "Pool")
+        self.add_amenity(db.engines['replica_2'], "Garden")
+        seen = [self.listed() for _ in range(4)]
+        self.assertEqual(sorted(map(tuple, seen)), [("Garden",), ("Garden",), ("Pool",), ("Pool",)])
+        self.assertNotEqual(seen[0], seen[1])
+
+
+class TestUnhealthyReplica(ReplicaTestCase):
+    def replica_urls(self, directory):
+        # Dossier inexistant : SQLite ne peut pas ouvrir la base
+        return [f"sqlite:///{os.path.join(directory, 'missing', 'replica_1.db')}"]
+
+    def test_reads_fall_back_to_the_primary(self):
+        with self.assertLogs('app.replicas', 'WARNING'):
+            self.assertEqual(self.listed(), ["Wifi"])
+        self.assertEqual(replicas.status(), {'replica_1': False})
+        exposition = self.client.get('/metrics').get_data(as_text=True)
+        self.assertIn('hbnb_db_replica_up{bind="replica_1"} 0\n', exposition)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import HBnBFacade
+from tests.base import AppTestCase
+
+
+class TestReviewUniqueness(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        self.reviewer = User(first_name="Jane", last_name="Doe", email="jane.doe@example.com")
+        owner.password = self.reviewer.password = "not-a-real-hash"
+        self.place = Place(title="Cozy Apartment", description="", price=100, latitude=0, longitude=0, owner=owner)
+        db.session.add_all([owner, self.reviewer, self.place])
+        db.session.commit()
+        token = create_access_token(identity=str(self.reviewer.id))
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def post_review(self):
+        return self.client.post('/api/v1/reviews/', headers=self.headers, json={
+            'text': "Great place!", 'rating': 5, 'place_id': str(self.place.id)
+        })
+
+    def test_second_review_is_rejected(self):
+        self.assertEqual(self.post_review().status_code, 201)
+        response = self.post_review()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], "You have already reviewed this place")
+
+    def test_has_already_reviewed_is_a_single_query(self):
+        for i in range(50):
+            other = User(first_name="Other", last_name="User", email=f"other{i}@example.com")
+            other.password = "not-a-real-hash"
+            db.session.add(Review(text="Nice", rating=4, place=self.place, user=other))
+        db.session.commit()
+        user_id, place_id = self.reviewer.id, self.place.id
+
+        statements = self.count_queries()
+        self.assertFalse(HBnBFacade().has_already_reviewed(user_id, place_id))
+        self.assertEqual(len(statements), 1)
+
+    def test_duplicate_insert_maps_to_value_error(self):
+        HBnBFacade().create_review({'text': "Great", 'rating': 5, 'user_id': self.reviewer.id, 'place_id': self.place.id})
+        with self.assertRaises(ValueError):
+            HBnBFacade().create_review({'text': "Again", 'rating': 4, 'user_id': self.reviewer.id, 'place_id': self.place.id})
+
+
+if __name__ == '__main__':
+    unittest.main()
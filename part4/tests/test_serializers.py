@@ -0,0 +1,58 @@
+import json
+import unittest
+from unittest import mock
+from app import db
+from app.api.v1 import serializers
+from app.api.v1.serializers import ModelSerializer, place_serializer, user_serializer
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestSerializers(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        wifi = Amenity(name="Wifi")
+        self.place = Place(title="Flat", description="Nice", price=80.5, latitude=48.85, longitude=2.35, owner=owner)
+        self.place.amenities = [wifi]
+        self.place.review_count, self.place.rating_sum, self.place.rating_4 = 1, 4, 1
+        db.session.add(self.place)
+        db.session.commit()
+        self.owner = owner
+
+    def expected_place(self):
+        return {'id': self.place.id, 'title': "Flat", 'description': "Nice", 'price': 80.5,
+                'latitude': 48.85, 'longitude': 2.35, 'owner_id': self.owner.id, 'amenities': [1],
+                'review_count': 1, 'average_rating': 4.0,
+                'rating_histogram': {'1': 0, '2': 0, '3': 0, '4': 1, '5': 0}}
+
+    def test_place_payload(self):
+        self.assertEqual(json.loads(place_serializer.to_json(self.place)), self.expected_place())
+        response = self.client.get(f'/api/v1/places/{self.place.id}')
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_json(), self.expected_place())
+
+    def test_stdlib_fallback_gives_the_same_document(self):
+        fast = place_serializer.many_to_json([self.place])
+        with mock.patch.object(serializers, 'orjson', None):
+            slow = place_serializer.many_to_json([self.place])
+        self.assertEqual(json.loads(fast), json.loads(slow))
+
+    def test_password_is_never_serialised(self):
+        self.assertNotIn('password', user_serializer.to_dict(self.owner))
+        self.assertNotIn(b'hash', self.client.get(f'/api/v1/users/{self.owner.id}').data)
+
+    def test_row_tuples(self):
+        row = db.session.query(User.id, User.email, User.password).one()
+        self.assertEqual(user_serializer.to_dict(row), {'id': self.owner.id, 'email': "john.doe@example.com"})
+
+    def test_unknown_column_is_rejected_at_build_time(self):
+        with self.assertRaises(ValueError):
+            ModelSerializer(User, ['id', 'nickname'])
+
+
+if __name__ == '__main__':
+    unittest.main()
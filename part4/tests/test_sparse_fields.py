@@ -0,0 +1,72 @@
+import json
+import unittest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+
+class TestSparseFields(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        reviewer = User(first_name="Jane", last_name="Doe", email="jane.doe@example.com")
+        reviewer.password = "not-a-real-hash"
+        self.place = Place(title="Flat", description="Nice", price=80, latitude=48.85, longitude=2.35, owner=owner)
+        self.place.amenities = [Amenity(name="Wifi")]
+        self.place.review_count, self.place.rating_sum, self.place.rating_5 = 1, 5, 1
+        db.session.add(self.place)
+        db.session.add(Review(text="Great", rating=5, place=self.place, user=reviewer))
+        db.session.commit()
+
+    def test_place_listing_selects_only_the_requested_columns(self):
+        statements = self.count_queries()
+        response = self.client.get('/api/v1/places/?fields=title,price')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [{'title': "Flat", 'price': 80.0}])
+        # The ETag fingerprint and the page, without the amenities relationship
+        self.assertEqual(len(statements), 2)
+        self.assertIn('places.title', statements[1])
+        self.assertNotIn('places.description', statements[1])
+        self.assertFalse([s for s in statements if 'place_amenity' in s])
+
+    def test_computed_fields_load_their_columns(self):
+        statements = self.count_queries()
+        response = self.client.get('/api/v1/places/?fields=average_rating,amenities')
+        self.assertEqual(response.get_json(), [{'amenities': [1], 'average_rating': 5.0}])
+        self.assertIn('places.rating_sum', statements[1])
+        self.assertNotIn('places.rating_1', statements[1])
+        self.assertEqual(len([s for s in statements if 'place_amenity' in s]), 1)
+
+    def test_reviews_and_users(self):
+        self.assertEqual(self.client.get('/api/v1/reviews/?fields=rating').get_json(), [{'rating': 5}])
+        reviews = self.client.get(f'/api/v1/reviews/places/{self.place.id}/reviews?fields=text')
+        self.assertEqual(reviews.get_json(), [{'text': "Great"}])
+        users = self.client.get('/api/v1/users/?fields=email').get_json()
+        self.assertEqual(users, [{'email': "john.doe@example.com"}, {'email': "jane.doe@example.com"}])
+
+    def test_streamed_export(self):
+        response = self.client.get('/api/v1/places/?stream=1&fields=id,title')
+        self.assertEqual(json.loads(response.data), [{'id': self.place.id, 'title': "Flat"}])
+
+    def test_item_has_its_own_etag(self):
+        full = self.client.get(f'/api/v1/places/{self.place.id}')
+        sparse = self.client.get(f'/api/v1/places/{self.place.id}?fields=title')
+        self.assertEqual(sparse.get_json(), {'title': "Flat"})
+        self.assertNotEqual(full.headers['ETag'], sparse.headers['ETag'])
+        revalidated = self.client.get(f'/api/v1/places/{self.place.id}?fields=title',
+                                      headers={'If-None-Match': sparse.headers['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_unknown_field(self):
+        response = self.client.get('/api/v1/users/?fields=email,password')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.get_json()['error'])
+        self.assertEqual(self.client.get(f'/api/v1/places/{self.place.id}?fields=').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
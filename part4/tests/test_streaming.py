@@ -0,0 +1,74 @@
+import json
+import unittest
+from sqlalchemy import insert
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from tests.base import AppTestCase
+
+NDJSON = {'Accept': 'application/x-ndjson'}
+
+
+class TestStreaming(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app.config['STREAM_BATCH_SIZE'] = 50
+        owner = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+        owner.password = "not-a-real-hash"
+        db.session.add(owner)
+        wifi = Amenity(name="Wifi")
+        db.session.add(wifi)
+        for i in range(120):
+            place = Place(title=f"Place {i}", description="", price=i, latitude=0, longitude=0, owner=owner)
+            place.amenities = [wifi] if i % 2 else []
+            db.session.add(place)
+        db.session.commit()
+        db.session.execute(insert(Review), [
+            {'text': f"Review {i}", 'rating': 1 + i % 5, 'place_id': 1 + i % 120, 'user_id': 1} for i in range(120)
+        ])
+        db.session.commit()
+        db.session.expunge_all()
+
+    def test_json_array_stream(self):
+        response = self.client.get('/api/v1/places/?stream=1')
+        self.assertEqual(response.status_code, 200)
+        # Chunked: the length is not known up front
+        self.assertNotIn('Content-Length', response.headers)
+        self.assertEqual(response.mimetype, 'application/json')
+        places = json.loads(response.get_data())
+        # Every row, not just one page
+        self.assertEqual(len(places), 120)
+        self.assertEqual(places[1]['amenities'], [1])
+        self.assertIn('ETag', response.headers)
+
+    def test_ndjson_stream(self):
+        response = self.client.get('/api/v1/reviews/', headers=NDJSON)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 120)
+        self.assertEqual(json.loads(lines[0])['text'], "Review 0")
+
+    def test_stream_respects_filters(self):
+        places = json.loads(self.client.get('/api/v1/places/?stream=1&max_price=9').get_data())
+        self.assertEqual([place['price'] for place in places], list(range(10)))
+
+    def test_rows_fetched_in_batches(self):
+        statements = self.count_queries()
+        self.client.get('/api/v1/places/', headers=NDJSON).get_data()
+        # Fingerprint + one places query, then one amenity load per batch of 50 places
+        self.assertEqual(len(statements), 2 + 3)
+
+    def test_empty_stream(self):
+        self.assertEqual(json.loads(self.client.get('/api/v1/places/?stream=1&min_price=1000').get_data()), [])
+        self.assertEqual(self.client.get('/api/v1/places/?min_price=1000', headers=NDJSON).get_data(), b'')
+
+    def test_default_is_still_paginated(self):
+        response = self.client.get('/api/v1/places/?limit=10', headers={'Accept': '*/*'})
+        self.assertIn('Content-Length', response.headers)
+        self.assertEqual(len(response.get_json()), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
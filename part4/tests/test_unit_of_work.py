@@ -0,0 +1,100 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.persistence.unit_of_work import unit_of_work
+from app.services import facade
+from tests.base import AppTestCase
+
+
+class TestUnitOfWork(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = self.add_user("admin@hbnb.io", is_admin=True)
+        self.owner = self.add_user("owner@example.com")
+        self.guest = self.add_user("guest@example.com")
+        self.wifi = Amenity(name="Wifi")
+        db.session.add(self.wifi)
+        self.place = Place(title="Place", description="", price=10, latitude=0, longitude=0, owner=self.owner)
+        db.session.add(self.place)
+        db.session.commit()
+        self.place_id, self.wifi_id = self.place.id, self.wifi.id
+
+    def add_user(self, email, is_admin=False):
+        user = User(first_name="John", last_name="Doe", email=email, is_admin=is_admin)
+        user.password = "not-a-real-hash"
+        db.session.add(user)
+        return user
+
+    def request(self, method, url, user=None, json=None):
+        headers = {}
+        if user:
+            token = create_access_token(identity=str(user.id), additional_claims={'is_admin': user.is_admin})
+            headers['Authorization'] = f'Bearer {token}'
+        return self.client.open(url, method=method, json=json, headers=headers)
+
+    def assert_commits(self, expected, method, url, user=None, json=None, status=200):
+        commits = self.count_commits()
+        response = self.request(method, url, user, json)
+        self.assertEqual(response.status_code, status, response.get_json())
+        self.assertEqual(len(commits), expected, f"{method} {url}")
+        return response
+
+    def test_writes_commit_once(self):
+        self.assert_commits(1, 'POST', '/api/v1/users/', self.admin, status=201, json={
+            'first_name': "Jane", 'last_name': "Doe", 'email': "jane@example.com", 'password': "s3cret!"})
+        self.assert_commits(1, 'POST', '/api/v1/amenities/', self.admin, {'name': "Pool"}, status=201)
+        self.assert_commits(1, 'PUT', f'/api/v1/amenities/{self.wifi_id}', self.admin, {'name': "Fibre"})
+        self.assert_commits(1, 'POST', '/api/v1/places/', self.owner, status=201, json={
+            'title': "Flat", 'description': "", 'price': 80, 'latitude': 1, 'longitude': 1,
+            'owner_id': str(self.owner.id), 'amenities': [str(self.wifi_id)]})
+        self.assert_commits(1, 'PUT', f'/api/v1/places/{self.place_id}', self.owner,
+                            {'title': "Renamed", 'latitude': 2, 'amenities': [str(self.wifi_id)]})
+        review_id = self.assert_commits(1, 'POST', '/api/v1/reviews/', self.guest, status=201, json={
+            'text': "Great", 'rating': 5, 'place_id': str(self.place_id)}).get_json()['id']
+        self.assert_commits(1, 'PUT', f'/api/v1/reviews/{review_id}', self.guest, {'rating': 3})
+        self.assert_commits(1, 'DELETE', f'/api/v1/reviews/{review_id}', self.guest)
+        self.assert_commits(1, 'DELETE', f'/api/v1/places/{self.place_id}', self.owner)
+
+    def test_reads_do_not_commit(self):
+        for url in ('/api/v1/places/', f'/api/v1/places/{self.place_id}', '/api/v1/amenities/',
+                    f'/api/v1/reviews/places/{self.place_id}/reviews'):
+            self.assert_commits(0, 'GET', url)
+
+    def test_review_and_aggregates_commit_together(self):
+        commits = self.count_commits()
+        facade.create_review({'text': "Great", 'rating': 4, 'user_id': self.guest.id, 'place_id': self.place_id})
+        self.assertEqual(len(commits), 1)
+        db.session.expire_all()
+        self.assertEqual(db.session.get(Place, self.place_id).review_count, 1)
+
+    def test_failed_update_rolls_back_every_step(self):
+        with self.assertRaises(ValueError):
+            # The title is valid and applied first, the owner is not
+            facade.update_place(self.place_id, {'title': "Renamed", 'owner_id': 999})
+        db.session.expire_all()
+        self.assertEqual(db.session.get(Place, self.place_id).title, "Place")
+
+    def test_nested_units_commit_once(self):
+        commits = self.count_commits()
+        with unit_of_work():
+            facade.create_amenity({'name': "Pool"})
+            facade.create_amenity({'name': "Sauna"})
+            self.assertEqual(len(commits), 0)
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(Amenity.query.count(), 3)
+
+    def test_error_in_outer_unit_rolls_back_inner_work(self):
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                facade.create_amenity({'name': "Pool"})
+                raise RuntimeError
+        self.assertEqual(Amenity.query.count(), 1)
+        self.assertEqual(Review.query.count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()